@@ -3,12 +3,20 @@ The :mod:`skactiveml.base` package implements the base classes for
 :mod:`skactiveml`.
 """
 
+import hashlib
+import pickle
 import warnings
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from copy import deepcopy
 
 import numpy as np
-from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
+from sklearn.base import (
+    BaseEstimator,
+    ClassifierMixin,
+    RegressorMixin,
+    clone,
+)
 from sklearn.metrics import accuracy_score
 from sklearn.utils.multiclass import check_classification_targets
 from sklearn.utils.validation import (
@@ -1122,6 +1130,44 @@ class SkactivemlClassifier(BaseEstimator, ClassifierMixin, ABC):
         y_pred = self._le.transform(self.predict(X))
         return accuracy_score(y, y_pred, sample_weight=sample_weight)
 
+    def get_state(self):
+        """Return a snapshot of the fitted state of this classifier.
+
+        In contrast to `copy.deepcopy`, the hyperparameters (i.e., the
+        parameters of `__init__`) are not copied. Nested scikit-learn
+        estimators, e.g., `estimator_` of `SklearnClassifier`, are snapshotted
+        recursively such that essentially only their fitted arrays are copied.
+
+        Returns
+        -------
+        state : object
+            Snapshot of the fitted state, which can be restored via
+            `set_state`.
+        """
+        return _EstimatorState(self)
+
+    def set_state(self, state):
+        """Restore a fitted state obtained by `get_state`. The state is copied
+        such that it can be restored multiple times.
+
+        Parameters
+        ----------
+        state : object
+            Snapshot of the fitted state obtained by `get_state` of a
+            classifier with the same hyperparameters.
+
+        Returns
+        -------
+        self : SkactivemlClassifier
+            The classifier with the restored fitted state.
+        """
+        if not isinstance(state, _EstimatorState):
+            raise TypeError(
+                "`state` must be obtained by `get_state`, got "
+                f"{type(state)}."
+            )
+        return state.restore(self)
+
     def _validate_data(
         self,
         X,
@@ -1543,3 +1589,128 @@ class AnnotatorModelMixin(ABC):
              annotation of sample `X[i]`.
         """
         raise NotImplementedError
+
+
+class _EstimatorState:
+    """Snapshot of an estimator consisting of its class, its hyperparameters,
+    and its fitted attributes."""
+
+    def __init__(self, estimator, memo=None):
+        memo = {} if memo is None else memo
+        self.estimator_type = type(estimator)
+        self.params = {
+            key: clone(value, safe=False)
+            for key, value in estimator.get_params(deep=False).items()
+        }
+        self.attributes = {}
+        for key, value in vars(estimator).items():
+            if key in self.params:
+                continue
+            if isinstance(value, BaseEstimator):
+                self.attributes[key] = _EstimatorState(value, memo)
+            else:
+                self.attributes[key] = _copy_state_value(value, memo)
+
+    def new_estimator(self):
+        params = {
+            key: clone(value, safe=False) for key, value in self.params.items()
+        }
+        return self.estimator_type(**params)
+
+    def restore(self, estimator, memo=None):
+        # A common memo preserves references between the attributes, e.g.,
+        # an optimizer referencing the coefficients of a model.
+        memo = {} if memo is None else memo
+        attributes = estimator.__dict__
+        for key in list(attributes):
+            if key not in self.params and key not in self.attributes:
+                del attributes[key]
+        for key, value in self.attributes.items():
+            if isinstance(value, _EstimatorState):
+                nested = attributes.get(key)
+                if type(nested) is not value.estimator_type:
+                    nested = value.new_estimator()
+                attributes[key] = value.restore(nested, memo)
+            else:
+                attributes[key] = _copy_state_value(value, memo)
+        return estimator
+
+
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, np.generic)
+
+
+def _copy_state_value(value, memo):
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if id(value) in memo:
+        return memo[id(value)]
+    if type(value) is np.ndarray:
+        value_copy = value.copy()
+    elif type(value) in (list, tuple):
+        value_copy = type(value)(_copy_state_value(v, memo) for v in value)
+    else:
+        return deepcopy(value, memo)
+    memo[id(value)] = value_copy
+    return value_copy
+
+
+class _FitCache:
+    """Least recently used caches of fitted states of estimators. They are
+    shared by all estimators such that fits of clones on identical data, e.g.,
+    by different query strategies in the same active learning cycle, are only
+    computed once. There is one cache per maximum size, such that estimators
+    with different `fit_cache_size` do not evict each other's states. As the
+    size is part of the hyperparameters, states are only shared between
+    estimators with identical sizes anyway."""
+
+    def __init__(self):
+        self._states = {}
+
+    @staticmethod
+    def key(estimator, *data):
+        """Returns a fingerprint of the hyperparameters of `estimator` and the
+        `data`, or None if they cannot be fingerprinted."""
+        fingerprint = hashlib.blake2b(digest_size=16)
+        try:
+            params = estimator.get_params(deep=False)
+            fingerprint.update(pickle.dumps((type(estimator), params)))
+            for values in data:
+                values = np.asarray(values)
+                fingerprint.update(
+                    pickle.dumps((values.dtype.str, values.shape))
+                )
+                if values.dtype.hasobject:
+                    fingerprint.update(pickle.dumps(values))
+                else:
+                    fingerprint.update(np.ascontiguousarray(values).data)
+        except Exception:
+            return None
+        return fingerprint.digest()
+
+    def load(self, estimator, key, max_size):
+        """Restores the fitted state stored for `key` in the cache of size
+        `max_size` into `estimator` and returns whether such a state
+        exists."""
+        states = self._states.get(max_size, {})
+        state = states.get(key)
+        if state is None:
+            return False
+        states.move_to_end(key)
+        state.restore(estimator)
+        return True
+
+    def store(self, estimator, key, max_size):
+        """Stores the fitted state of `estimator` for `key` in the cache of
+        size `max_size` and evicts its least recently used states exceeding
+        `max_size`."""
+        states = self._states.setdefault(max_size, OrderedDict())
+        states[key] = _EstimatorState(estimator)
+        states.move_to_end(key)
+        while len(states) > max_size:
+            states.popitem(last=False)
+
+    def clear(self):
+        self._states.clear()
+
+
+_FIT_CACHE = _FitCache()
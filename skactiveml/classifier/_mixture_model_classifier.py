@@ -7,8 +7,8 @@ Classifier based on a Gaussian Mixture Model.
 from copy import deepcopy
 
 import numpy as np
-from scipy.spatial.distance import cdist
 from sklearn.mixture import GaussianMixture, BayesianGaussianMixture
+from sklearn.utils import gen_batches, get_chunk_n_rows
 from sklearn.utils.validation import (
     check_array,
     check_is_fitted,
@@ -38,7 +38,9 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
         default='responsibilities'
         Determines whether the responsibilities outputted by the
         `mixture_model` or the exponentials of the Mahalanobis distances as
-        similarities are used to compute the class frequency estimates.
+        similarities are used to compute the class frequency estimates. The
+        Mahalanobis distances are computed in chunks of samples whose size is
+        determined by `sklearn.get_config()['working_memory']`.
     classes : array-like, shape (n_classes), default=None
         Holds the label for each class. If none, the classes are determined
         during the fit.
@@ -57,6 +59,15 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
     random_state : int or RandomState instance or None, default=None
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    cache_responsibilities : bool, default=False
+        If True and `mixture_model` is already fitted, e.g., on the complete
+        pool of samples, the responsibilities of the training samples `X` are
+        cached. A subsequent call of `fit` with the same samples `X` and the
+        same mixture model only updates `F_components_` for the samples whose
+        labels changed, and `predict_freq` for these samples becomes a lookup.
+        Each call of `fit` resets the cache, such that responsibilities of a
+        previous fit are only reused for identical samples and mixture model
+        parameters.
 
     Attributes
     ----------
@@ -87,6 +98,7 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
         cost_matrix=None,
         class_prior=0.0,
         random_state=None,
+        cache_responsibilities=False,
     ):
         super().__init__(
             classes=classes,
@@ -97,6 +109,7 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
         )
         self.mixture_model = mixture_model
         self.weight_mode = weight_mode
+        self.cache_responsibilities = cache_responsibilities
 
     def fit(self, X, y, sample_weight=None):
         """Fit the model using `X` as training samples and `y` as class labels.
@@ -118,6 +131,11 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
             `skactiveml.classifier.MixtureModelClassifier` object fitted on the
              training data.
         """
+        # Reset the cache of the previous fit. Its responsibilities are only
+        # reused below if the samples and the mixture model are unchanged.
+        cache = self.__dict__.get("_cache")
+        self._cache = None
+
         # Check input parameters.
         X, y, sample_weight = self._validate_data(X, y, sample_weight)
         self._check_n_features(X, reset=True)
@@ -148,14 +166,23 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
                 f"'similarities', got {self.weight_mode} instead."
             )
 
+        # Check cache of responsibilities.
+        if not isinstance(self.cache_responsibilities, bool):
+            raise TypeError(
+                f"`cache_responsibilities` must be of type `bool`, got "
+                f"{type(self.cache_responsibilities)} instead."
+            )
+
         if self.n_features_in_ is None:
             self.F_components_ = 0
         else:
             # Refit model if desired.
             try:
                 check_is_fitted(self.mixture_model_)
+                use_cache = self.cache_responsibilities
             except NotFittedError:
                 self.mixture_model_ = self.mixture_model_.fit(X)
+                use_cache = False
 
             # Counts number of votes per class label for each sample.
             V = compute_vote_vectors(
@@ -165,11 +192,49 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
                 missing_label=-1,
             )
 
-            # Stores responsibility for every given sample of training set.
-            R = self.mixture_model_.predict_proba(X)
+            if (
+                use_cache
+                and cache is not None
+                and np.array_equal(X, cache["X"])
+                and V.shape == cache["V"].shape
+                and all(
+                    np.array_equal(getattr(self.mixture_model_, key), value)
+                    for key, value in cache["params"].items()
+                )
+            ):
+                # Update class frequency estimates per component for the
+                # samples whose labels changed.
+                is_changed = np.any(V != cache["V"], axis=1)
+                V_diff = V[is_changed] - cache["V"][is_changed]
+                self.F_components_ = (
+                    cache["F"] + cache["R"][is_changed].T @ V_diff
+                )
+                cache = {**cache, "V": V, "F": self.F_components_}
+            else:
+                # Stores responsibility for every given sample of training
+                # set.
+                R = self.mixture_model_.predict_proba(X)
 
-            # Stores class frequency estimates per component.
-            self.F_components_ = R.T @ V
+                # Stores class frequency estimates per component.
+                self.F_components_ = R.T @ V
+
+                if use_cache:
+                    cache = {
+                        "X": X.copy(),
+                        "R": R,
+                        "V": V,
+                        "F": self.F_components_,
+                        "params": {
+                            key: getattr(self.mixture_model_, key).copy()
+                            for key in [
+                                "weights_",
+                                "means_",
+                                "precisions_cholesky_",
+                            ]
+                        },
+                    }
+            if use_cache:
+                self._cache = cache
 
         return self
 
@@ -191,23 +256,90 @@ class MixtureModelClassifier(ClassFrequencyEstimator):
         X = check_array(X)
         self._check_n_features(X, reset=False)
         if np.sum(self.F_components_) > 0:
-            if self.weight_mode == "similarities":
-                S = np.exp(
-                    -np.array(
-                        [
-                            cdist(
-                                X,
-                                [self.mixture_model_.means_[j]],
-                                metric="mahalanobis",
-                                VI=self.mixture_model_.precisions_[j],
-                            ).ravel()
-                            for j in range(self.mixture_model_.n_components)
-                        ]
-                    )
-                ).T
+            # Look up the cached weights of the training samples.
+            cache = self.__dict__.get("_cache")
+            if cache is not None and np.array_equal(X, cache["X"]):
+                if self.weight_mode == "similarities":
+                    if "S" not in cache:
+                        cache["S"] = np.exp(-self._mahalanobis_distances(X))
+                    S = cache["S"]
+                else:
+                    S = cache["R"]
+            elif self.weight_mode == "similarities":
+                S = np.exp(-self._mahalanobis_distances(X))
             else:
                 S = self.mixture_model_.predict_proba(X)
             F = S @ self.F_components_
         else:
             F = np.zeros((len(X), len(self.classes_)))
         return F
+
+    def _mahalanobis_distances(self, X):
+        """Computes the Mahalanobis distances between the samples `X` and the
+        means of all components via the Cholesky factors of the precision
+        matrices, whose representation depends on the covariance type.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_samples, n_features)
+            Input samples.
+
+        Returns
+        -------
+        D : np.ndarray of shape (n_samples, n_components)
+            `D[i, j]` is the Mahalanobis distance between the sample `X[i]`
+            and the mean of the component `j`.
+        """
+        covariance_type = self.mixture_model_.covariance_type
+        means = self.mixture_model_.means_
+        prec_chol = self.mixture_model_.precisions_cholesky_
+        n_components, n_features = means.shape
+
+        # Transform the samples and means such that squared Euclidean
+        # distances correspond to squared Mahalanobis distances.
+        if covariance_type == "full":
+            means_prec = np.einsum("kd,kde->ke", means, prec_chol)
+            # Stack the factors to transform the samples by a single product.
+            prec_chol = prec_chol.transpose(1, 0, 2).reshape(n_features, -1)
+        elif covariance_type == "tied":
+            means_prec = means @ prec_chol
+        elif covariance_type == "diag":
+            precisions = prec_chol**2
+            means_prec = means * precisions
+            means_sq = np.sum(means * means_prec, axis=1)
+        else:
+            means_sq = np.sum(means**2, axis=1) * prec_chol**2
+
+        # Compute the distances for chunks of samples to bound the memory of
+        # the transformed samples.
+        if covariance_type in ["full", "tied"]:
+            row_bytes = 2 * n_components * n_features * X.itemsize
+        else:
+            row_bytes = 2 * n_components * X.itemsize
+        chunk_n_rows = get_chunk_n_rows(
+            row_bytes=row_bytes, max_n_rows=max(len(X), 1)
+        )
+        D = np.empty((len(X), n_components))
+        for sl in gen_batches(len(X), chunk_n_rows):
+            if covariance_type == "full":
+                Y = (X[sl] @ prec_chol).reshape(-1, n_components, n_features)
+                Y -= means_prec
+                D[sl] = np.einsum("nkd,nkd->nk", Y, Y)
+            elif covariance_type == "tied":
+                Y = (X[sl] @ prec_chol)[:, np.newaxis, :] - means_prec
+                D[sl] = np.einsum("nkd,nkd->nk", Y, Y)
+            elif covariance_type == "diag":
+                D[sl] = (
+                    X[sl] ** 2 @ precisions.T
+                    - 2 * X[sl] @ means_prec.T
+                    + means_sq
+                )
+            else:
+                X_sq = np.sum(X[sl] ** 2, axis=1, keepdims=True)
+                D[sl] = (
+                    X_sq * prec_chol**2
+                    - 2 * (X[sl] @ means.T) * prec_chol**2
+                    + means_sq
+                )
+        # Avoid negative values due to numerical errors.
+        return np.sqrt(np.maximum(D, 0))
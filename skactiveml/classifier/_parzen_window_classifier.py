@@ -5,9 +5,19 @@ Parzen Window Classifier
 # Author: Marek Herde <marek.herde@uni-kassel.de>
 
 import numpy as np
-from sklearn.metrics.pairwise import pairwise_kernels, KERNEL_PARAMS
-from sklearn.utils import check_array
-from sklearn.utils.validation import check_is_fitted, check_scalar
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.metrics.pairwise import (
+    pairwise_distances,
+    pairwise_kernels,
+    KERNEL_PARAMS,
+)
+from sklearn.neighbors import NearestNeighbors
+from sklearn.utils import check_array, gen_batches, get_chunk_n_rows
+from sklearn.utils.validation import (
+    check_consistent_length,
+    check_is_fitted,
+    check_scalar,
+)
 
 from ..base import ClassFrequencyEstimator
 from ..utils import MISSING_LABEL, compute_vote_vectors
@@ -45,6 +55,34 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
         available samples are considered.
     metric_dict : dict,
         Any further parameters are passed directly to the kernel function.
+    algorithm : {'brute', 'auto', 'ball_tree', 'kd_tree'}, default='brute'
+        Algorithm used to find the nearest neighbours if `n_neighbors` is not
+        None. For 'brute', the full kernel matrix between the test and
+        training samples is computed. Otherwise, the algorithm is passed to
+        `sklearn.neighbors.NearestNeighbors`, which indexes the training
+        samples in `fit` such that only the kernel values of the nearest
+        neighbours are computed. This is only supported for the
+        distance-based kernels 'rbf' and 'laplacian'.
+    working_memory : int or float, default=None
+        The sought maximum memory in MiB for the temporary kernel matrices
+        during prediction. The test samples are processed in chunks such that
+        the peak memory is independent of their number. If None, the value of
+        `sklearn.get_config()['working_memory']` is used.
+    approximation : {None, 'rff', 'nystroem'}, default=None
+        Approximation of the kernel by an explicit feature map `phi` such that
+        the class frequency estimates are given by
+        `phi(X) @ (phi(X_).T @ V_)`. The summary `phi(X_).T @ V_` is computed
+        in `fit` and updated by `partial_fit`, so that prediction costs are
+        independent of the number of training samples. For 'rff', random
+        Fourier features (`sklearn.kernel_approximation.RBFSampler`) are used,
+        which requires `metric='rbf'`. For 'nystroem', the Nystroem method
+        (`sklearn.kernel_approximation.Nystroem`) is used, whose components
+        are sampled from the training samples passed to `fit`. If None, the
+        exact kernel is computed. An approximation cannot be combined with
+        `n_neighbors` or `metric='precomputed'`.
+    n_components : int, default=100
+        Number of features of the approximating feature map. It is ignored if
+        `approximation` is None.
 
     Attributes
     ----------
@@ -63,6 +101,20 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
         The class labels are represented by counting vectors. An entry `V[i,j]`
         indicates how many class labels of `classes[j]` were provided for
         training sample `X_[i]`.
+    nn_ : sklearn.neighbors.NearestNeighbors or None
+        Index of the training samples to find the nearest neighbours. It is
+        None if `n_neighbors` is None, `algorithm='brute'`, or there are not
+        more than `n_neighbors` training samples. The index is rebuilt by
+        `partial_fit` once the number of samples appended since the last
+        rebuild exceeds the number of indexed samples. Until then, the
+        appended samples are searched by brute force.
+    feature_map_ : sklearn.kernel_approximation.RBFSampler or
+    sklearn.kernel_approximation.Nystroem or None
+        Fitted feature map approximating the kernel. It is None if
+        `approximation` is None or there are no training samples.
+    V_components_ : np.ndarray of shape (n_components, classes)
+        Summary `feature_map_.transform(X_).T @ V_` of the training data. It
+        is only available if `feature_map_` is not None.
 
     References
     ----------
@@ -72,6 +124,10 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
     """
 
     METRICS = list(KERNEL_PARAMS.keys()) + ["precomputed"]
+    NEIGHBOR_METRICS = {"rbf": "euclidean", "laplacian": "manhattan"}
+
+    # `partial_fit` only appends samples, i.e., it cannot forget samples.
+    _partial_fit_appends_samples = True
 
     def __init__(
         self,
@@ -83,6 +139,10 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
         cost_matrix=None,
         class_prior=0.0,
         random_state=None,
+        algorithm="brute",
+        working_memory=None,
+        approximation=None,
+        n_components=100,
     ):
         super().__init__(
             classes=classes,
@@ -94,6 +154,10 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
         self.metric = metric
         self.n_neighbors = n_neighbors
         self.metric_dict = metric_dict
+        self.algorithm = algorithm
+        self.working_memory = working_memory
+        self.approximation = approximation
+        self.n_components = n_components
 
     def fit(self, X, y, sample_weight=None):
         """Fit the model using X as training data and y as class labels.
@@ -144,6 +208,62 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
 
         self._check_n_features(X, reset=True)
 
+        # Check algorithm to find the nearest neighbors.
+        algorithms = ["brute", "auto", "ball_tree", "kd_tree"]
+        if self.algorithm not in algorithms:
+            raise ValueError(
+                f"The parameter 'algorithm' must be in {algorithms}, got "
+                f"{self.algorithm}."
+            )
+        if (
+            self.algorithm != "brute"
+            and self.metric not in ParzenWindowClassifier.NEIGHBOR_METRICS
+        ):
+            raise ValueError(
+                f"The parameter 'algorithm={self.algorithm}' requires "
+                f"'metric' to be in "
+                f"{list(ParzenWindowClassifier.NEIGHBOR_METRICS)}."
+            )
+
+        # Check working memory.
+        if self.working_memory is not None:
+            check_scalar(
+                self.working_memory,
+                name="working_memory",
+                target_type=(int, float),
+                min_val=0,
+                include_boundaries="neither",
+            )
+
+        # Check approximation of the kernel.
+        approximations = [None, "rff", "nystroem"]
+        if self.approximation not in approximations:
+            raise ValueError(
+                f"The parameter 'approximation' must be in {approximations}, "
+                f"got {self.approximation}."
+            )
+        if self.approximation is not None:
+            check_scalar(
+                self.n_components,
+                name="n_components",
+                target_type=int,
+                min_val=1,
+            )
+            if self.n_neighbors is not None:
+                raise ValueError(
+                    "The parameter 'approximation' cannot be combined with "
+                    "'n_neighbors'."
+                )
+            if self.metric == "precomputed":
+                raise ValueError(
+                    "The parameter 'approximation' cannot be combined with "
+                    "'metric=precomputed'."
+                )
+            if self.approximation == "rff" and self.metric != "rbf":
+                raise ValueError(
+                    "The parameter 'approximation=rff' requires 'metric=rbf'."
+                )
+
         # Store train samples.
         self.X_ = X.copy()
 
@@ -158,8 +278,167 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
                 missing_label=-1,
             )
 
+        # Reset the lengths of the buffers used by `partial_fit`.
+        self._buffer_lengths = {}
+
+        self._fit_nn()
+        self._fit_feature_map()
+
+        return self
+
+    def partial_fit(self, X, y, sample_weight=None):
+        """Update the fitted model using X as additional training data and y
+        as class labels. The samples and their count vectors are appended to
+        `X_` and `V_`, which are stored in buffers whose capacity grows
+        geometrically. Hence, an update takes amortized time linear in the
+        number of new samples. If the model is not fitted yet, `fit` is called
+        instead. If `approximation` is not None, the summary `V_components_`
+        is updated with the new samples, while the feature map is kept.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            The sample matrix `X` is the feature matrix representing the
+            samples.
+        y : array-like of shape (n_samples)
+            It contains the class labels of the training samples.
+        sample_weight : array-like of shape (n_samples)
+            It contains the weights of the training samples' class labels.
+            It must have the same shape as y.
+
+        Returns
+        -------
+        self: ParzenWindowClassifier,
+            The ParzenWindowClassifier is fitted on the training data.
+        """
+        if (
+            not hasattr(self, "X_")
+            or self.n_features_in_ is None
+            or "_buffer_lengths" not in self.__dict__
+        ):
+            return self.fit(X, y, sample_weight=sample_weight)
+
+        # Check input parameters. In contrast to `fit`, the classes are not
+        # determined again.
+        X = check_array(X, ensure_min_samples=0)
+        y = check_array(
+            y,
+            ensure_2d=False,
+            force_all_finite=False,
+            ensure_min_samples=0,
+            dtype=None,
+        )
+        check_consistent_length(X, y)
+        if sample_weight is not None:
+            sample_weight = check_array(
+                sample_weight, ensure_2d=False, ensure_min_samples=0
+            )
+            if not np.array_equal(y.shape, sample_weight.shape):
+                raise ValueError(
+                    f"`y` has the shape {y.shape} and `sample_weight` has the "
+                    f"shape {sample_weight.shape}. Both need to have "
+                    f"identical shapes."
+                )
+        if len(X) == 0:
+            return self
+        self._check_n_features(X, reset=False)
+        y = self._le.transform(y)
+
+        # Append train samples and their count vectors.
+        V = compute_vote_vectors(
+            y=y,
+            w=sample_weight,
+            classes=np.arange(len(self.classes_)),
+            missing_label=-1,
+        )
+        self.X_ = self._append_to_buffer("X_", X)
+        self.V_ = self._append_to_buffer("V_", V)
+
+        # Rebuild the index of the nearest neighbors only when the number of
+        # indexed samples has been doubled, such that the rebuilds take
+        # amortized time linear in the number of new samples.
+        if self.nn_ is None or 2 * self.nn_.n_samples_fit_ < len(self.X_):
+            self._fit_nn()
+        if self.feature_map_ is not None:
+            self.V_components_ = (
+                self.V_components_ + self.feature_map_.transform(X).T @ V
+            )
+
         return self
 
+    def _append_to_buffer(self, name, values):
+        """Returns the concatenation of the attribute `name` and `values`.
+        If the attribute is a view of a buffer (i.e., its base array) that
+        has not been extended by another view (e.g., of a shallow copy),
+        `values` are written into the buffer. Otherwise, a new buffer with
+        twice the required capacity is allocated.
+        """
+        arr = getattr(self, name)
+        n, n_new = len(arr), len(arr) + len(values)
+        buffer = arr.base
+        dtype = np.result_type(arr, values)
+        if (
+            buffer is None
+            or self._buffer_lengths.get(name) != n
+            or len(buffer) < n_new
+            or buffer.dtype != dtype
+            or buffer.shape[1:] != arr.shape[1:]
+        ):
+            buffer = np.empty((2 * n_new,) + arr.shape[1:], dtype=dtype)
+            buffer[:n] = arr
+        buffer[n:n_new] = values
+        self._buffer_lengths[name] = n_new
+        return buffer[:n_new]
+
+    def _fit_nn(self):
+        # Index train samples to find the nearest neighbors.
+        self.nn_ = None
+        if (
+            self.n_neighbors is not None
+            and self.algorithm != "brute"
+            and self.n_features_in_ is not None
+            and len(self.X_) > self.n_neighbors
+        ):
+            # Check the kernel parameters as they are not passed to the
+            # kernel function during prediction.
+            pairwise_kernels(
+                self.X_[:1], self.X_[:1], self.metric, **self.metric_dict_
+            )
+            self.nn_ = NearestNeighbors(
+                n_neighbors=self.n_neighbors,
+                algorithm=self.algorithm,
+                metric=ParzenWindowClassifier.NEIGHBOR_METRICS[self.metric],
+            ).fit(self.X_)
+
+    def _fit_feature_map(self):
+        # Approximate the kernel by an explicit feature map.
+        self.feature_map_ = None
+        if self.approximation is None or self.n_features_in_ is None:
+            return
+        # Check the kernel parameters as they are not passed to the kernel
+        # function during prediction.
+        pairwise_kernels(
+            self.X_[:1], self.X_[:1], self.metric, **self.metric_dict_
+        )
+        if self.approximation == "rff":
+            gamma = self.metric_dict_.get("gamma")
+            if gamma is None:
+                gamma = 1.0 / self.X_.shape[1]
+            self.feature_map_ = RBFSampler(
+                gamma=gamma,
+                n_components=self.n_components,
+                random_state=self.random_state_,
+            )
+        else:
+            self.feature_map_ = Nystroem(
+                kernel=self.metric,
+                kernel_params=self.metric_dict_,
+                n_components=min(self.n_components, len(self.X_)),
+                random_state=self.random_state_,
+            )
+        self.feature_map_.fit(self.X_)
+        self.V_components_ = self.feature_map_.transform(self.X_).T @ self.V_
+
     def predict_freq(self, X):
         """Return class frequency estimates for the input samples 'X'.
 
@@ -182,29 +461,87 @@ class ParzenWindowClassifier(ClassFrequencyEstimator):
         if self.n_features_in_ is None:
             return np.zeros((len(X), len(self.classes_)))
 
-        # Compute kernel (metric) matrix.
+        # Compute kernel values of the nearest neighbors from their
+        # distances.
+        if self.nn_ is not None:
+            self._check_n_features(X, reset=False)
+            dist, indices = self.nn_.kneighbors(X)
+            # Include the samples appended after the last rebuild of the
+            # index.
+            n_samples_fit = self.nn_.n_samples_fit_
+            if n_samples_fit < len(self.X_):
+                dist_new = pairwise_distances(
+                    X,
+                    self.X_[n_samples_fit:],
+                    metric=ParzenWindowClassifier.NEIGHBOR_METRICS[
+                        self.metric
+                    ],
+                )
+                dist = np.hstack([dist, dist_new])
+                indices = np.hstack(
+                    [
+                        indices,
+                        np.broadcast_to(
+                            np.arange(n_samples_fit, len(self.X_)),
+                            dist_new.shape,
+                        ),
+                    ]
+                )
+                nearest = np.argpartition(dist, self.n_neighbors - 1, axis=1)
+                nearest = nearest[:, : self.n_neighbors]
+                dist = np.take_along_axis(dist, nearest, axis=1)
+                indices = np.take_along_axis(indices, nearest, axis=1)
+            gamma = self.metric_dict_.get("gamma")
+            if gamma is None:
+                gamma = 1.0 / self.X_.shape[1]
+            if self.metric == "rbf":
+                dist **= 2
+            K = np.exp(-gamma * dist)
+            return np.einsum("ik,ikc->ic", K, self.V_[indices])
+
+        # Check kernel (metric) matrix.
         if self.metric == "precomputed":
-            K = X
-            if np.size(K, 0) != np.size(X, 0) or np.size(K, 1) != np.size(
-                self.X_, 0
-            ):
+            if np.size(X, 1) != np.size(self.X_, 0):
                 raise ValueError(
                     "The kernel matrix 'X' must have the shape "
                     "(n_test_samples, n_train_samples)."
                 )
         else:
             self._check_n_features(X, reset=False)
-            K = pairwise_kernels(
-                X, self.X_, metric=self.metric, **self.metric_dict_
-            )
 
-        # computing class frequency estimates
-        if self.n_neighbors is None or np.size(self.X_, 0) <= self.n_neighbors:
-            F = K @ self.V_
+        # Compute class frequency estimates for chunks of test samples to
+        # bound the memory of the kernel matrix.
+        if self.feature_map_ is not None:
+            n_bytes = 2 * np.size(self.V_components_, 0) * X.itemsize
         else:
-            indices = np.argpartition(K, -self.n_neighbors, axis=1)
-            indices = indices[:, -self.n_neighbors :]
-            F = np.empty((np.size(X, 0), len(self.classes_)))
-            for i in range(np.size(X, 0)):
-                F[i, :] = K[i, indices[i]] @ self.V_[indices[i], :]
+            n_bytes = 2 * np.size(self.X_, 0) * X.itemsize
+        chunk_n_rows = get_chunk_n_rows(
+            row_bytes=n_bytes,
+            max_n_rows=max(len(X), 1),
+            working_memory=self.working_memory,
+        )
+        F = np.empty((len(X), len(self.classes_)))
+        for sl in gen_batches(len(X), chunk_n_rows):
+            if self.feature_map_ is not None:
+                # Clip negative estimates caused by the approximation.
+                F[sl] = np.maximum(
+                    self.feature_map_.transform(X[sl]) @ self.V_components_, 0
+                )
+                continue
+            if self.metric == "precomputed":
+                K = X[sl]
+            else:
+                K = pairwise_kernels(
+                    X[sl], self.X_, metric=self.metric, **self.metric_dict_
+                )
+            if (
+                self.n_neighbors is None
+                or np.size(self.X_, 0) <= self.n_neighbors
+            ):
+                F[sl] = K @ self.V_
+            else:
+                indices = np.argpartition(K, -self.n_neighbors, axis=1)
+                indices = indices[:, -self.n_neighbors :]
+                K = np.take_along_axis(K, indices, axis=1)
+                F[sl] = np.einsum("ik,ikc->ic", K, self.V_[indices])
         return F
@@ -8,7 +8,6 @@ import warnings
 import numpy as np
 
 from copy import deepcopy
-from collections import deque
 
 from sklearn.base import MetaEstimatorMixin, is_classifier
 from sklearn.utils.validation import (
@@ -18,7 +17,7 @@ from sklearn.utils.validation import (
 )
 from sklearn.utils import metaestimators, check_consistent_length
 
-from ..base import SkactivemlClassifier
+from ..base import SkactivemlClassifier, _FIT_CACHE
 from ..utils import (
     rand_argmin,
     MISSING_LABEL,
@@ -55,6 +54,20 @@ class SklearnClassifier(SkactivemlClassifier, MetaEstimatorMixin):
     random_state : int or RandomState instance or None, default=None
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    fit_cache_size : int or None, default=None
+        If not None, the fitted states of `fit` are stored in a least recently
+        used cache of this size, which is shared by all wrappers with the
+        same `fit_cache_size`. The cache is keyed by a fingerprint of the
+        hyperparameters and the training data, such that a fit of this
+        wrapper or one of its clones on identical data restores the cached
+        state instead of fitting `estimator` again. Hence, `estimator` should
+        be deterministic, e.g., by setting its `random_state`. Fits with
+        further keyword arguments or warm-started refits (see
+        `IndexClassifierWrapper`) are not cached. The cached states contain
+        copies of the fitted estimators and are kept until the end of the
+        process. Hence, `fit_cache_size` bounds the number of states kept for
+        each distinct value of `fit_cache_size`. All cached states are
+        released by `clear_fit_cache`.
 
     Attributes
     ----------
@@ -74,6 +87,7 @@ class SklearnClassifier(SkactivemlClassifier, MetaEstimatorMixin):
         missing_label=MISSING_LABEL,
         cost_matrix=None,
         random_state=None,
+        fit_cache_size=None,
     ):
         super().__init__(
             classes=classes,
@@ -82,6 +96,7 @@ class SklearnClassifier(SkactivemlClassifier, MetaEstimatorMixin):
             random_state=random_state,
         )
         self.estimator = estimator
+        self.fit_cache_size = fit_cache_size
 
     def fit(self, X, y, sample_weight=None, **fit_kwargs):
         """Fit the model using X as training data and y as class labels.
@@ -106,13 +121,35 @@ class SklearnClassifier(SkactivemlClassifier, MetaEstimatorMixin):
         self: SklearnClassifier,
             The SklearnClassifier is fitted on the training data.
         """
-        return self._fit(
+        # Look up the fitted state in the cache.
+        key = None
+        if self.fit_cache_size is not None:
+            check_scalar(self.fit_cache_size, "fit_cache_size", int, min_val=1)
+            if not fit_kwargs and not self.__dict__.get("_warm_start_fit"):
+                key = _FIT_CACHE.key(self, X, y, sample_weight)
+                if key is not None and _FIT_CACHE.load(
+                    self, key, self.fit_cache_size
+                ):
+                    return self
+
+        self._fit(
             fit_function="fit",
             X=X,
             y=y,
             sample_weight=sample_weight,
             **fit_kwargs,
         )
+        if key is not None:
+            _FIT_CACHE.store(self, key, self.fit_cache_size)
+        return self
+
+    @classmethod
+    def clear_fit_cache(cls):
+        """Releases all fitted states cached by wrappers with a
+        `fit_cache_size`. As the cache is shared, this includes the states of
+        `SklearnClassifier` and `SklearnRegressor`.
+        """
+        _FIT_CACHE.clear()
 
     @_available_if("partial_fit", hasattr(metaestimators, "available_if"))
     def partial_fit(self, X, y, sample_weight=None, **fit_kwargs):
@@ -147,6 +184,22 @@ class SklearnClassifier(SkactivemlClassifier, MetaEstimatorMixin):
             **fit_kwargs,
         )
 
+    def _can_warm_start(self, X, y_lbld):
+        # A fitted `estimator_` is only kept for `fit`, if warm starts were
+        # explicitly requested (e.g., by `IndexClassifierWrapper`) and the
+        # previous solution is compatible with the new training data.
+        if not self.__dict__.get("_warm_start_fit") or not getattr(
+            self, "is_fitted_", False
+        ):
+            return False
+        classes = getattr(self.estimator_, "classes_", None)
+        n_features = getattr(self.estimator_, "n_features_in_", None)
+        return (
+            classes is not None
+            and np.array_equal(classes, np.unique(y_lbld))
+            and n_features == np.size(X, 1)
+        )
+
     def predict(self, X, **predict_kwargs):
         """Return class label predictions for the input data X.
 
@@ -271,13 +324,12 @@ class SklearnClassifier(SkactivemlClassifier, MetaEstimatorMixin):
                 f"{self.estimator} does not support `sample_weight`. "
                 f"Therefore, this parameter will be ignored."
             )
-        if hasattr(self, "estimator_"):
-            if fit_function != "partial_fit":
-                self.estimator_ = deepcopy(self.estimator)
-        else:
-            self.estimator_ = deepcopy(self.estimator)
         # count labels per class
         is_lbld = is_labeled(y, missing_label=-1)
+        if not hasattr(self, "estimator_") or (
+            fit_function == "fit" and not self._can_warm_start(X, y[is_lbld])
+        ):
+            self.estimator_ = deepcopy(self.estimator)
         self._label_counts = [
             np.sum(y[is_lbld] == c) for c in range(len(self._le.classes_))
         ]
@@ -364,10 +416,31 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
         If True, the existing partial_fit method in `estimator` is ignored and
         the sliding window is used instead. If False, the partial_fit method
         in estimator is used but a warning is thrown as the sliding window has
-        no effect.
+        no effect. An exception are estimators whose partial_fit method only
+        appends the samples to their training data (e.g.,
+        `ParzenWindowClassifier`). For a restricted `window_size`, they are
+        always refitted on the sliding window.
     random_state : int or RandomState instance or None, default=None
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    refit_interval : int, default=1
+        Number of samples added to the sliding window by `partial_fit` after
+        which `estimator` is refitted on the window. In between, the
+        predictions are made by the previously fitted estimator. It is only
+        used if the partial_fit method of `estimator` is not used. The
+        estimator is not refitted if the window did not change.
+
+    Attributes
+    ----------
+    X_train_ : np.ndarray of shape (n_window_samples, n_features)
+        Samples in the sliding window.
+    y_train_ : np.ndarray of shape (n_window_samples,)
+        Class labels of the samples in the sliding window.
+    sample_weight_train_ : np.ndarray of shape (n_window_samples,) or None
+        Weights of the samples in the sliding window. It is None if no weights
+        were passed.
+    estimator_ : skactiveml.base.SkactivemlClassifier
+        The wrapped classifier fitted on the sliding window.
     """
 
     def __init__(
@@ -380,6 +453,7 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
         only_labeled=False,
         ignore_estimator_partial_fit=False,
         random_state=None,
+        refit_interval=1,
     ):
         super().__init__(
             classes=classes,
@@ -391,6 +465,7 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
         self.only_labeled = only_labeled
         self.window_size = window_size
         self.ignore_estimator_partial_fit = ignore_estimator_partial_fit
+        self.refit_interval = refit_interval
 
     def fit(self, X, y, sample_weight=None, **fit_kwargs):
         """Fit the model using X as training data and y as class labels.
@@ -435,23 +510,20 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
         )
 
         self._add_samples("fit", X, y, sample_weight)
-        X_train = np.array(self.X_train_)
-        y_train = np.array(self.y_train_)
-        sample_weight_train = None
-        if self.sample_weight_train_ is not None:
-            sample_weight_train = np.array(self.sample_weight_train_)
         return self._fit(
             "fit",
-            X=X_train,
-            y=y_train,
-            sample_weight=sample_weight_train,
+            X=self.X_train_,
+            y=self.y_train_,
+            sample_weight=self.sample_weight_train_,
             **fit_kwargs,
         )
 
     def partial_fit(self, X, y, sample_weight=None, **fit_kwargs):
         """Partially fitting the model using X as training data and y as class
         labels. If 'base_estimator' has no partial_fit function use fit with
-        the sliding window for X, y and sample_weight.
+        the sliding window for X, y and sample_weight. In this case, the
+        estimator is refitted only after `refit_interval` samples were added
+        to the window.
 
         Parameters
         ----------
@@ -493,11 +565,17 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
             check_X_dict=self.check_X_dict_,
         )
 
-        self._add_samples("partial_fit", X, y, sample_weight)
+        n_added = self._add_samples("partial_fit", X, y, sample_weight)
 
+        # Estimators whose partial_fit method only appends samples would keep
+        # the samples that dropped out of the window.
+        appends_samples = self.window_size is not None and getattr(
+            self.estimator, "_partial_fit_appends_samples", False
+        )
         if (
             hasattr(self.estimator, "partial_fit")
             and not self.ignore_estimator_partial_fit
+            and not appends_samples
         ):
             warnings.warn(
                 "The partial_fit method in estimator is used but the "
@@ -512,27 +590,25 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
                 **fit_kwargs,
             )
         else:
-            X_train = np.array(self.X_train_)
-            y_train = np.array(self.y_train_)
-            sample_weight_train = None
-            if self.sample_weight_train_ is not None:
-                sample_weight_train = np.array(self.sample_weight_train_)
+            # Refit only if enough samples were added to the window since the
+            # last refit.
+            self._n_added_since_fit = (
+                self.__dict__.get("_n_added_since_fit", 0) + n_added
+            )
+            if (
+                "estimator_" in self.__dict__
+                and self._n_added_since_fit < self.refit_interval
+            ):
+                return self
             return self._fit(
                 "fit",
-                X=X_train,
-                y=y_train,
-                sample_weight=sample_weight_train,
+                X=self.X_train_,
+                y=self.y_train_,
+                sample_weight=self.sample_weight_train_,
                 **fit_kwargs,
             )
 
     def _add_samples(self, fit_func, X, y, sample_weight=None):
-
-        if not hasattr(self, "X_train_"):
-            self.X_train_ = deque(maxlen=self.window_size)
-        if not hasattr(self, "y_train_"):
-            self.y_train_ = deque(maxlen=self.window_size)
-        if not hasattr(self, "sample_weight_train_"):
-            self.sample_weight_train_ = deque(maxlen=self.window_size)
         if self.only_labeled:
             is_lbld = is_labeled(y, self.missing_label)
             X = X[is_lbld]
@@ -543,16 +619,67 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
                 sample_weight = None
         # reset the window if fit is called otherwise extend the window with
         # the given data
-        if fit_func == "fit":
-            self.X_train_ = deque(maxlen=self.window_size)
-            self.y_train_ = deque(maxlen=self.window_size)
-            self.sample_weight_train_ = deque(maxlen=self.window_size)
-        self.X_train_.extend(X)
-        self.y_train_.extend(y)
+        if fit_func == "fit" or "X_train_" not in self.__dict__:
+            self.X_train_ = X[:0]
+            self.y_train_ = y[:0]
+            self.sample_weight_train_ = None
+            self._buffer_ends = {}
         if sample_weight is not None:
-            self.sample_weight_train_.extend(sample_weight)
+            if self.sample_weight_train_ is None:
+                self.sample_weight_train_ = np.ones(len(self.y_train_))
+            self.sample_weight_train_ = self._append_to_window(
+                "sample_weight_train_", sample_weight
+            )
         else:
             self.sample_weight_train_ = None
+        self.X_train_ = self._append_to_window("X_train_", X)
+        self.y_train_ = self._append_to_window("y_train_", y)
+        return len(y)
+
+    def _append_to_window(self, name, values):
+        """Returns the latest `window_size` entries of the concatenation of
+        the attribute `name` and `values` as a view of a buffer. If the
+        attribute is a view of a buffer (i.e., its base array) that has not
+        been extended by another view (e.g., of a shallow copy), `values` are
+        written into the unused capacity of the buffer. Otherwise, the
+        entries are copied into a new buffer with twice the required
+        capacity. Hence, appending a sample takes amortized time linear in its
+        number of features.
+        """
+        arr = getattr(self, name)
+        # Keep only the entries fitting into the window.
+        n_values = len(values)
+        if self.window_size is not None:
+            n_values = min(n_values, self.window_size)
+            values = values[len(values) - n_values :]
+            arr = arr[max(len(arr) + n_values - self.window_size, 0) :]
+        n_arr = len(arr)
+        buffer = arr.base
+        dtype = np.result_type(arr, values)
+        end = None
+        if (
+            name in self._buffer_ends
+            and buffer is not None
+            and buffer.dtype == dtype
+            and buffer.shape[1:] == values.shape[1:]
+            and buffer.strides[0] > 0
+        ):
+            offset = np.byte_bounds(arr)[0] - np.byte_bounds(buffer)[0]
+            end = offset // buffer.strides[0] + n_arr
+        if (
+            end is None
+            or self._buffer_ends.get(name) != end
+            or len(buffer) < end + n_values
+        ):
+            capacity = 2 * (n_arr + n_values)
+            if self.window_size is not None:
+                capacity = max(capacity, 2 * self.window_size)
+            buffer = np.empty((capacity,) + values.shape[1:], dtype=dtype)
+            buffer[:n_arr] = arr
+            end = n_arr
+        buffer[end : end + n_values] = values
+        self._buffer_ends[name] = end + n_values
+        return buffer[end - n_arr : end + n_values]
 
     def _fit(self, fit_function, X, y, sample_weight=None, **fit_kwargs):
 
@@ -575,6 +702,7 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
                 self.estimator_ = deepcopy(self.estimator)
         else:
             self.estimator_ = deepcopy(self.estimator)
+        self._n_added_since_fit = 0
 
         if fit_function == "fit":
             self.estimator_.fit(
@@ -601,6 +729,7 @@ class SlidingWindowClassifier(SkactivemlClassifier, MetaEstimatorMixin):
                 min_inclusive=False,
             )
         check_type(self.only_labeled, "only_labeled", bool)
+        check_scalar(self.refit_interval, "refit_interval", int, min_val=1)
 
         check_type(
             self.ignore_estimator_partial_fit,
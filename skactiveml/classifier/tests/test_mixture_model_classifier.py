@@ -1,6 +1,8 @@
 import unittest
 
 import numpy as np
+from scipy.spatial.distance import cdist
+from sklearn import config_context
 from sklearn.datasets import make_blobs
 from sklearn.mixture import BayesianGaussianMixture, GaussianMixture
 from sklearn.utils.validation import NotFittedError, check_is_fitted
@@ -27,6 +29,87 @@ class TestMixtureModelClassifier(unittest.TestCase):
         cmm = MixtureModelClassifier(missing_label="nan", weight_mode="Test")
         self.assertRaises(ValueError, cmm.fit, X=self.X, y=self.y)
 
+    def test_init_param_cache_responsibilities(self):
+        cmm = MixtureModelClassifier(missing_label=-1)
+        self.assertFalse(cmm.cache_responsibilities)
+        cmm = MixtureModelClassifier(
+            missing_label="nan", cache_responsibilities="Test"
+        )
+        self.assertRaises(TypeError, cmm.fit, X=self.X, y=self.y)
+
+        X, y_true = make_blobs(n_samples=100, centers=3, random_state=0)
+        X_test = X[:10] + 0.1
+        mixture = GaussianMixture(n_components=4, random_state=0).fit(X)
+        for weight_mode in ["responsibilities", "similarities"]:
+            with self.subTest(weight_mode=weight_mode):
+                cmm = MixtureModelClassifier(
+                    mixture_model=mixture,
+                    weight_mode=weight_mode,
+                    classes=[0, 1, 2],
+                    cache_responsibilities=True,
+                )
+                cmm_exp = MixtureModelClassifier(
+                    mixture_model=mixture,
+                    weight_mode=weight_mode,
+                    classes=[0, 1, 2],
+                )
+                y = np.full(len(X), np.nan)
+                w = np.ones(len(X))
+                for idx in [[], [0, 1], [2, 3, 4], [0, 50, 99]]:
+                    y[idx] = y_true[idx]
+                    w[idx] += 1
+                    cmm.fit(X, y, sample_weight=w)
+                    cmm_exp.fit(X, y, sample_weight=w)
+                    np.testing.assert_allclose(
+                        cmm.F_components_, cmm_exp.F_components_, atol=1e-12
+                    )
+                    for X_pred in [X, X_test]:
+                        np.testing.assert_allclose(
+                            cmm.predict_freq(X_pred),
+                            cmm_exp.predict_freq(X_pred),
+                            atol=1e-12,
+                        )
+
+                # The cache is replaced for other samples.
+                cmm.fit(X[:50], y[:50])
+                cmm_exp.fit(X[:50], y[:50])
+                np.testing.assert_allclose(
+                    cmm.predict_freq(X), cmm_exp.predict_freq(X)
+                )
+
+                # Refits on other data or with another mixture model do not
+                # use the responsibilities of previous fits.
+                P = cmm.predict_proba(X_test)
+                y_new = y_true[::-1]
+                mixture_new = GaussianMixture(
+                    n_components=4, random_state=1
+                ).fit(X[50:])
+                for params, X_fit, y_fit in [
+                    ({}, X + 1, y_new),
+                    ({"mixture_model": mixture_new}, X, y_new),
+                ]:
+                    cmm.set_params(**params).fit(X_fit, y_fit)
+                    cmm_exp.set_params(**params).fit(X_fit, y_fit)
+                    P_new = cmm.predict_proba(X_test)
+                    self.assertFalse(np.allclose(P, P_new))
+                    np.testing.assert_allclose(
+                        cmm_exp.predict_proba(X_test), P_new
+                    )
+                    P = P_new
+
+                # A failing fit resets the cache.
+                self.assertIsNotNone(cmm._cache)
+                self.assertRaises(ValueError, cmm.fit, X, y_true[1:])
+                self.assertIsNone(cmm._cache)
+
+        # No cache if the mixture model is fitted on the training samples.
+        cmm = MixtureModelClassifier(
+            mixture_model=GaussianMixture(n_components=4),
+            classes=[0, 1, 2],
+            cache_responsibilities=True,
+        ).fit(X, y_true)
+        self.assertIsNone(cmm._cache)
+
     def test_fit(self):
         mixture = GaussianMixture(random_state=0, n_components=4)
         cmm = MixtureModelClassifier(
@@ -104,6 +187,48 @@ class TestMixtureModelClassifier(unittest.TestCase):
         F = cmm.predict_freq(X=X)
         self.assertTrue(F.sum() > 0)
 
+        # The similarities are based on the Mahalanobis distances for all
+        # covariance types.
+        for covariance_type in ["full", "tied", "diag", "spherical"]:
+            with self.subTest(covariance_type=covariance_type):
+                mixture = GaussianMixture(
+                    n_components=3,
+                    covariance_type=covariance_type,
+                    random_state=0,
+                ).fit(X)
+                cmm = MixtureModelClassifier(
+                    mixture_model=mixture,
+                    classes=[0, 1],
+                    weight_mode="similarities",
+                ).fit(X=X, y=y)
+                precisions = mixture.precisions_
+                if covariance_type == "tied":
+                    precisions = [precisions] * 3
+                elif covariance_type == "diag":
+                    precisions = [np.diag(p) for p in precisions]
+                elif covariance_type == "spherical":
+                    precisions = [p * np.eye(X.shape[1]) for p in precisions]
+                S = np.exp(
+                    -np.column_stack(
+                        [
+                            cdist(
+                                X,
+                                mixture.means_[[j]],
+                                metric="mahalanobis",
+                                VI=precisions[j],
+                            ).ravel()
+                            for j in range(3)
+                        ]
+                    )
+                )
+                np.testing.assert_allclose(
+                    cmm.predict_freq(X=X), S @ cmm.F_components_
+                )
+                with config_context(working_memory=0.001):
+                    np.testing.assert_allclose(
+                        cmm.predict_freq(X=X), S @ cmm.F_components_
+                    )
+
     def test_predict_proba(self):
         mixture = BayesianGaussianMixture(n_components=1).fit(X=self.X)
         cmm = MixtureModelClassifier(
@@ -1,6 +1,8 @@
 import unittest
+from copy import copy
 
 import numpy as np
+from sklearn.metrics.pairwise import pairwise_kernels
 from sklearn.utils.validation import NotFittedError
 
 from skactiveml.classifier import ParzenWindowClassifier
@@ -41,6 +43,122 @@ class TestParzenWindowClassifier(unittest.TestCase):
         pwc = ParzenWindowClassifier(missing_label="nan", n_neighbors=1.5)
         self.assertRaises(TypeError, pwc.fit, X=self.X, y=self.y)
 
+    def test_init_param_algorithm(self):
+        pwc = ParzenWindowClassifier()
+        self.assertEqual(pwc.algorithm, "brute")
+        pwc = ParzenWindowClassifier(missing_label="nan", algorithm="Test")
+        self.assertRaises(ValueError, pwc.fit, X=self.X, y=self.y)
+        for metric in ["linear", "precomputed"]:
+            pwc = ParzenWindowClassifier(
+                missing_label="nan", metric=metric, algorithm="kd_tree"
+            )
+            self.assertRaises(ValueError, pwc.fit, X=self.X, y=self.y)
+        pwc = ParzenWindowClassifier(
+            missing_label="nan",
+            n_neighbors=1,
+            metric_dict={"test": 1},
+            algorithm="kd_tree",
+        )
+        self.assertRaises(TypeError, pwc.fit, X=self.X, y=self.y)
+
+        # The nearest neighbors are indexed only if required.
+        pwc = ParzenWindowClassifier(missing_label="nan", algorithm="auto")
+        self.assertIsNone(pwc.fit(X=self.X, y=self.y).nn_)
+        pwc = ParzenWindowClassifier(
+            missing_label="nan", n_neighbors=3, algorithm="auto"
+        )
+        self.assertIsNone(pwc.fit(X=self.X, y=self.y).nn_)
+        pwc = ParzenWindowClassifier(
+            missing_label="nan", n_neighbors=2, algorithm="auto"
+        )
+        self.assertIsNotNone(pwc.fit(X=self.X, y=self.y).nn_)
+
+    def test_init_param_working_memory(self):
+        pwc = ParzenWindowClassifier()
+        self.assertIsNone(pwc.working_memory)
+        for working_memory, error in [
+            (0, ValueError),
+            (-1, ValueError),
+            ("Test", TypeError),
+        ]:
+            pwc = ParzenWindowClassifier(
+                missing_label="nan", working_memory=working_memory
+            )
+            self.assertRaises(error, pwc.fit, X=self.X, y=self.y)
+
+    def test_init_param_approximation(self):
+        pwc = ParzenWindowClassifier()
+        self.assertIsNone(pwc.approximation)
+        for kwargs in [
+            {"approximation": "Test"},
+            {"approximation": "rff", "metric": "laplacian"},
+            {"approximation": "rff", "n_neighbors": 2},
+            {"approximation": "nystroem", "metric": "precomputed"},
+        ]:
+            pwc = ParzenWindowClassifier(missing_label="nan", **kwargs)
+            self.assertRaises(ValueError, pwc.fit, X=self.X, y=self.y)
+        pwc = ParzenWindowClassifier(
+            missing_label="nan", approximation="rff", metric_dict={"a": 1}
+        )
+        self.assertRaises(TypeError, pwc.fit, X=self.X, y=self.y)
+
+        # The approximations converge to the exact class frequency estimates.
+        random_state = np.random.RandomState(0)
+        X = random_state.rand(100, 2)
+        y = random_state.choice([0, 1, 2], size=100)
+        X_test = random_state.rand(20, 2)
+        for metric, approximation, n_components in [
+            ("rbf", "rff", 2000),
+            ("rbf", "nystroem", 20),
+            ("laplacian", "nystroem", 80),
+        ]:
+            with self.subTest(metric=metric, approximation=approximation):
+                pwc = ParzenWindowClassifier(
+                    metric=metric, metric_dict={"gamma": 2}, random_state=0
+                ).fit(X, y)
+                pwc_approx = ParzenWindowClassifier(
+                    metric=metric,
+                    metric_dict={"gamma": 2},
+                    random_state=0,
+                    approximation=approximation,
+                    n_components=n_components,
+                ).fit(X, y)
+                F = pwc.predict_freq(X_test)
+                F_approx = pwc_approx.predict_freq(X_test)
+                self.assertEqual(F_approx.shape, F.shape)
+                self.assertTrue(np.all(F_approx >= 0))
+                np.testing.assert_allclose(F_approx, F, rtol=0.1)
+
+        # No training samples.
+        pwc = ParzenWindowClassifier(
+            classes=[0, 1], approximation="nystroem"
+        ).fit(np.zeros((0, 2)), [])
+        self.assertIsNone(pwc.feature_map_)
+        np.testing.assert_array_equal(pwc.predict_freq(X_test), 0)
+
+    def test_init_param_n_components(self):
+        pwc = ParzenWindowClassifier()
+        self.assertEqual(pwc.n_components, 100)
+        for n_components, error in [
+            (0, ValueError),
+            (1.5, TypeError),
+            ("Test", TypeError),
+        ]:
+            pwc = ParzenWindowClassifier(
+                missing_label="nan",
+                approximation="rff",
+                n_components=n_components,
+            )
+            self.assertRaises(error, pwc.fit, X=self.X, y=self.y)
+        pwc = ParzenWindowClassifier(
+            missing_label="nan", approximation="rff", n_components=7
+        ).fit(X=self.X, y=self.y)
+        self.assertEqual(pwc.V_components_.shape, (7, 2))
+        pwc = ParzenWindowClassifier(
+            missing_label="nan", approximation="nystroem", n_components=7
+        ).fit(X=self.X, y=self.y)
+        self.assertEqual(pwc.V_components_.shape, (3, 2))
+
     def test_fit(self):
         pwc = ParzenWindowClassifier(
             classes=["tokyo", "paris", "new york"], missing_label="nan"
@@ -56,6 +174,118 @@ class TestParzenWindowClassifier(unittest.TestCase):
         pwc.fit(X=self.X, y=self.y, sample_weight=self.w)
         np.testing.assert_array_equal([[0, 0, 2], [0, 0, 0], [0, 1, 0]], pwc.V_)
 
+    def test_partial_fit(self):
+        random_state = np.random.RandomState(0)
+        X = random_state.rand(30, 2)
+        y = random_state.choice(["tokyo", "paris", "nan"], size=30)
+        w = random_state.rand(30)
+        X_test = random_state.rand(10, 2)
+
+        # Without fitted model, `partial_fit` equals `fit`.
+        pwc = ParzenWindowClassifier(
+            classes=["tokyo", "paris"], missing_label="nan"
+        )
+        pwc.partial_fit(X[:5], y[:5], sample_weight=w[:5])
+        np.testing.assert_array_equal(pwc.X_, X[:5])
+
+        # Incremental updates equal a fit on all samples.
+        for n_neighbors, algorithm in [(None, "brute"), (5, "kd_tree")]:
+            with self.subTest(n_neighbors=n_neighbors, algorithm=algorithm):
+                pwc = ParzenWindowClassifier(
+                    classes=["tokyo", "paris"],
+                    missing_label="nan",
+                    n_neighbors=n_neighbors,
+                    algorithm=algorithm,
+                )
+                pwc.fit(X[:5], y[:5], sample_weight=w[:5])
+                for start, end in [(5, 6), (6, 20), (20, 20), (20, 30)]:
+                    pwc.partial_fit(
+                        X[start:end], y[start:end], sample_weight=w[start:end]
+                    )
+                    pwc_exp = ParzenWindowClassifier(
+                        classes=["tokyo", "paris"],
+                        missing_label="nan",
+                        n_neighbors=n_neighbors,
+                        algorithm=algorithm,
+                    ).fit(X[:end], y[:end], sample_weight=w[:end])
+                    np.testing.assert_array_equal(pwc.X_, pwc_exp.X_)
+                    np.testing.assert_array_equal(pwc.V_, pwc_exp.V_)
+                    np.testing.assert_allclose(
+                        pwc.predict_proba(X_test),
+                        pwc_exp.predict_proba(X_test),
+                    )
+
+        # The index of the nearest neighbors is rebuilt once the number of
+        # samples has been doubled. Predictions do not change the index and
+        # include the samples appended since the last rebuild.
+        pwc = ParzenWindowClassifier(
+            classes=["tokyo", "paris"],
+            missing_label="nan",
+            n_neighbors=5,
+            algorithm="kd_tree",
+        )
+        pwc_brute = ParzenWindowClassifier(
+            classes=["tokyo", "paris"], missing_label="nan", n_neighbors=5
+        )
+        pwc.fit(X[:8], y[:8])
+        nn = pwc.nn_
+        for i in range(8, 16):
+            pwc.partial_fit(X[i : i + 1], y[i : i + 1])
+            self.assertIs(pwc.nn_, nn)
+            pwc_brute.fit(X[: i + 1], y[: i + 1])
+            np.testing.assert_allclose(
+                pwc.predict_freq(X_test), pwc_brute.predict_freq(X_test)
+            )
+            self.assertIs(pwc.nn_, nn)
+        pwc.partial_fit(X[16:17], y[16:17])
+        self.assertIsNot(pwc.nn_, nn)
+        self.assertEqual(pwc.nn_.n_samples_fit_, 17)
+
+        # The summary of an approximated kernel is updated incrementally.
+        pwc = ParzenWindowClassifier(
+            classes=["tokyo", "paris"],
+            missing_label="nan",
+            approximation="rff",
+            random_state=0,
+        )
+        pwc.fit(X[:5], y[:5], sample_weight=w[:5])
+        pwc.partial_fit(X[5:], y[5:], sample_weight=w[5:])
+        pwc_exp = ParzenWindowClassifier(
+            classes=["tokyo", "paris"],
+            missing_label="nan",
+            approximation="rff",
+            random_state=0,
+        ).fit(X, y, sample_weight=w)
+        np.testing.assert_allclose(pwc.V_components_, pwc_exp.V_components_)
+        np.testing.assert_allclose(
+            pwc.predict_freq(X_test), pwc_exp.predict_freq(X_test)
+        )
+
+        # The samples are appended to a buffer with unused capacity.
+        pwc = ParzenWindowClassifier(
+            classes=["tokyo", "paris"], missing_label="nan"
+        )
+        pwc.fit(X[:5], y[:5]).partial_fit(X[5:6], y[5:6])
+        buffer = pwc.X_.base
+        self.assertGreater(len(buffer), len(pwc.X_))
+        pwc.partial_fit(X[6:7], y[6:7])
+        self.assertIs(pwc.X_.base, buffer)
+
+        # Shallow copies do not overwrite each other's samples.
+        pwc_copy = copy(pwc)
+        pwc.partial_fit(X[7:8], y[7:8])
+        pwc_copy.partial_fit(X[8:9], y[8:9])
+        np.testing.assert_array_equal(pwc.X_, X[:8])
+        np.testing.assert_array_equal(pwc_copy.X_, X[[*range(7), 8]])
+
+        # Invalid inputs.
+        self.assertRaises(ValueError, pwc.partial_fit, X[:2], ["berlin"] * 2)
+        self.assertRaises(ValueError, pwc.partial_fit, X[:2, :1], y[:2])
+        self.assertRaises(ValueError, pwc.partial_fit, X[:2], y[:3])
+        self.assertRaises(
+            ValueError, pwc.partial_fit, X[:2], y[:2], sample_weight=w[:3]
+        )
+
     def test_predict_freq(self):
         pwc = ParzenWindowClassifier(
             classes=["tokyo", "paris", "new york"],
@@ -109,6 +339,47 @@ class TestParzenWindowClassifier(unittest.TestCase):
         F_rbf = pwc.fit(X=self.X, y=self.y).predict_freq(np.ones_like(self.X))
         np.testing.assert_array_equal(F_call, F_rbf)
 
+        # All algorithms yield the same estimates.
+        random_state = np.random.RandomState(0)
+        X = random_state.rand(50, 3)
+        y = random_state.choice(["tokyo", "paris", "nan"], size=50)
+        w = random_state.rand(50)
+        X_test = random_state.rand(20, 3)
+        for metric, metric_dict, n_neighbors in [
+            ("rbf", None, 5),
+            ("rbf", {"gamma": 10}, 1),
+            ("laplacian", {"gamma": 0.5}, 7),
+        ]:
+            pwc = ParzenWindowClassifier(
+                classes=["tokyo", "paris"],
+                missing_label="nan",
+                metric=metric,
+                metric_dict=metric_dict,
+                n_neighbors=n_neighbors,
+            )
+            F_exp = pwc.fit(X, y, sample_weight=w).predict_freq(X_test)
+            K = pairwise_kernels(
+                X_test, X, metric=metric, **(metric_dict or {})
+            )
+            nn = np.argsort(-K, axis=1)[:, :n_neighbors]
+            V = pwc.V_
+            F_loop = [K[i, nn[i]] @ V[nn[i]] for i in range(len(X_test))]
+            np.testing.assert_allclose(F_exp, F_loop)
+            for algorithm in ["auto", "ball_tree", "kd_tree"]:
+                with self.subTest(metric=metric, algorithm=algorithm):
+                    pwc.set_params(algorithm=algorithm)
+                    F = pwc.fit(X, y, sample_weight=w).predict_freq(X_test)
+                    np.testing.assert_allclose(F, F_exp)
+            pwc.set_params(algorithm="brute")
+
+            # Chunked estimates equal the estimates at once.
+            for n_neighbors in [None, n_neighbors]:
+                pwc.set_params(n_neighbors=n_neighbors, working_memory=None)
+                F_exp = pwc.fit(X, y, sample_weight=w).predict_freq(X_test)
+                pwc.set_params(working_memory=0.004)
+                F = pwc.fit(X, y, sample_weight=w).predict_freq(X_test)
+                np.testing.assert_allclose(F, F_exp)
+
     def test_predict_proba(self):
         pwc = ParzenWindowClassifier(
             classes=["tokyo", "paris"], missing_label="nan"
@@ -1,14 +1,22 @@
 import unittest
 import warnings
+from copy import copy
+from unittest.mock import patch
 
 import numpy as np
+from sklearn.base import clone
 from sklearn.ensemble import BaggingClassifier
 from sklearn.gaussian_process import (
     GaussianProcessClassifier,
     GaussianProcessRegressor,
 )
-from sklearn.linear_model import Perceptron
+from sklearn.linear_model import (
+    LogisticRegression,
+    Perceptron,
+    SGDClassifier,
+)
 from sklearn.naive_bayes import GaussianNB
+from sklearn.neural_network import MLPClassifier
 from sklearn.utils.validation import NotFittedError, check_is_fitted
 
 from skactiveml.classifier import (
@@ -35,6 +43,72 @@ class TestSklearnClassifier(unittest.TestCase):
         )
         self.assertRaises(TypeError, clf.fit, X=self.X, y=self.y1)
 
+    def test_init_param_fit_cache_size(self):
+        clf = SklearnClassifier(estimator=GaussianNB())
+        self.assertIsNone(clf.fit_cache_size)
+        for fit_cache_size, error in [
+            (0, ValueError),
+            (1.5, TypeError),
+            ("Test", TypeError),
+        ]:
+            clf = SklearnClassifier(
+                estimator=GaussianNB(),
+                missing_label="nan",
+                fit_cache_size=fit_cache_size,
+            )
+            self.assertRaises(error, clf.fit, X=self.X, y=self.y1)
+
+        # Clones fitted on identical data restore the cached state.
+        SklearnClassifier.clear_fit_cache()
+        X = np.random.RandomState(0).rand(10, 2)
+        y = np.array([0, 1, np.nan, 1, 0, np.nan, 0, 1, 1, 0])
+        clf = SklearnClassifier(
+            estimator=GaussianNB(), classes=[0, 1], fit_cache_size=2
+        )
+        with patch.object(
+            GaussianNB, "fit", autospec=True, side_effect=GaussianNB.fit
+        ) as fit:
+            P = clone(clf).fit(X, y).predict_proba(X)
+            clf_cached = clone(clf).fit(X, y)
+            self.assertEqual(fit.call_count, 1)
+            np.testing.assert_array_equal(clf_cached.predict_proba(X), P)
+
+            # Changed data and hyperparameters are refitted.
+            y[2] = 0
+            clf.fit(X, y)
+            clf.fit(X, y, sample_weight=np.arange(10))
+            clf.set_params(random_state=0).fit(X, y)
+            self.assertEqual(fit.call_count, 4)
+            self.assertRaises(
+                AssertionError,
+                np.testing.assert_array_equal,
+                clf.predict_proba(X),
+                P,
+            )
+
+            # The least recently used states are evicted.
+            clf.fit(X, y)
+            self.assertEqual(fit.call_count, 4)
+            clf.set_params(random_state=None).fit(X, y)
+            self.assertEqual(fit.call_count, 5)
+
+            # Wrappers with other cache sizes do not evict these states.
+            clf_1 = SklearnClassifier(
+                estimator=GaussianNB(), classes=[0, 1], fit_cache_size=1
+            )
+            for random_state in range(3):
+                clf_1.set_params(random_state=random_state).fit(X, y)
+            self.assertEqual(fit.call_count, 8)
+            clf.fit(X, y)
+            clf.set_params(random_state=0).fit(X, y)
+            self.assertEqual(fit.call_count, 8)
+
+            # Cleared states are refitted.
+            SklearnClassifier.clear_fit_cache()
+            clf.fit(X, y)
+            self.assertEqual(fit.call_count, 9)
+        SklearnClassifier.clear_fit_cache()
+
     def test_fit(self):
         clf = SklearnClassifier(
             estimator=GaussianProcessClassifier(),
@@ -172,6 +246,91 @@ class TestSklearnClassifier(unittest.TestCase):
         y_exp = ["tokyo"] * len(self.X)
         np.testing.assert_array_equal(y_exp, y)
 
+    def test_fit_warm_start(self):
+        X = np.random.RandomState(0).randn(40, 2)
+        y = (X[:, 0] > 0).astype(float)
+        y[:2] = 1 - y[:2]
+
+        # The estimator's `warm_start` alone does not keep `estimator_`.
+        clf = SklearnClassifier(
+            LogisticRegression(warm_start=True), classes=[0, 1]
+        )
+        clf.fit(X[:30], y[:30])
+        estimator = clf.estimator_
+        clf.fit(X, y)
+        self.assertIsNot(clf.estimator_, estimator)
+
+        # Warm starts must be requested explicitly, e.g., by
+        # `IndexClassifierWrapper`.
+        n_iter = {}
+        for warm_start in [False, True]:
+            clf = SklearnClassifier(
+                LogisticRegression(warm_start=warm_start), classes=[0, 1]
+            )
+            clf._warm_start_fit = warm_start
+            clf.fit(X[:30], y[:30])
+            estimator = clf.estimator_
+            clf.fit(X, y)
+            self.assertEqual(clf.estimator_ is estimator, warm_start)
+            n_iter[warm_start] = clf.n_iter_[0]
+        self.assertLess(n_iter[True], n_iter[False])
+
+        # The estimator is reset if the observed classes or features change.
+        y_3 = y.copy()
+        y_3[-5:] = 2
+        for X_fit, y_fit in [(X, y_3), (X[:, :1], y)]:
+            clf = SklearnClassifier(
+                LogisticRegression(warm_start=True), classes=[0, 1, 2]
+            )
+            clf._warm_start_fit = True
+            clf.fit(X[:30], y[:30])
+            estimator = clf.estimator_
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                clf.fit(X_fit, y_fit)
+            self.assertIsNot(clf.estimator_, estimator)
+            self.assertTrue(clf.is_fitted_)
+            np.testing.assert_allclose(
+                clf.predict_proba(X_fit),
+                SklearnClassifier(LogisticRegression(), classes=[0, 1, 2])
+                .fit(X_fit, y_fit)
+                .predict_proba(X_fit),
+            )
+
+    def test_get_state(self):
+        X = np.random.RandomState(0).rand(20, 2)
+        y = (X[:, 0] > 0.5).astype(float)
+        for estimator in [
+            GaussianNB(),
+            SGDClassifier(loss="log_loss", random_state=0),
+            MLPClassifier(hidden_layer_sizes=(3,), random_state=0),
+        ]:
+            clf = SklearnClassifier(estimator, classes=[0, 1])
+            state = clf.get_state()
+            clf.partial_fit(X[:10], y[:10])
+            P_exp = clf.predict_proba(X)
+            base_state = clf.get_state()
+
+            # Restoring the state must undo further updates.
+            for _ in range(2):
+                clf.partial_fit(X[10:], y[10:])
+                self.assertFalse(np.allclose(P_exp, clf.predict_proba(X)))
+                clf.set_state(base_state)
+                np.testing.assert_array_equal(P_exp, clf.predict_proba(X))
+
+            # Hyperparameters are not part of the state.
+            self.assertNotIn("estimator", base_state.attributes)
+            self.assertNotIn("estimator_", state.attributes)
+            clf.set_state(state)
+            self.assertFalse(hasattr(clf, "estimator_"))
+            self.assertRaises(NotFittedError, clf.predict_proba, X)
+            self.assertRaises(TypeError, clf.set_state, {})
+
+            # The state can be restored in another classifier.
+            clf_2 = SklearnClassifier(estimator, classes=[0, 1])
+            clf_2.set_state(base_state)
+            np.testing.assert_array_equal(P_exp, clf_2.predict_proba(X))
+
 
 class TestSlidingWindowClassifier(unittest.TestCase):
     def setUp(self):
@@ -197,6 +356,32 @@ class TestSlidingWindowClassifier(unittest.TestCase):
         )
         self.assertRaises(ValueError, clf.fit, X=self.X, y=self.y1)
 
+        # The window is applied although `ParzenWindowClassifier` implements
+        # `partial_fit`.
+        random_state = np.random.RandomState(0)
+        X = random_state.rand(10, 2)
+        y = random_state.choice([0, 1], size=10)
+        clf = SlidingWindowClassifier(
+            estimator=ParzenWindowClassifier(classes=[0, 1]),
+            classes=[0, 1],
+            window_size=3,
+        )
+        for x_i, y_i in zip(X, y):
+            clf.partial_fit(x_i.reshape(1, -1), [y_i])
+        self.assertEqual(len(clf.estimator_.X_), 3)
+        np.testing.assert_array_equal(clf.estimator_.X_, X[-3:])
+
+        # Without a window, the samples are appended via `partial_fit`.
+        clf = SlidingWindowClassifier(
+            estimator=ParzenWindowClassifier(classes=[0, 1]), classes=[0, 1]
+        )
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            for x_i, y_i in zip(X, y):
+                clf.partial_fit(x_i.reshape(1, -1), [y_i])
+        self.assertTrue(any("sliding window" in str(w_i.message) for w_i in w))
+        np.testing.assert_array_equal(clf.estimator_.X_, X)
+
     def test_init_param_only_labeled(self):
         clf = SlidingWindowClassifier(
             estimator=ParzenWindowClassifier(), only_labeled="Test"
@@ -218,6 +403,46 @@ class TestSlidingWindowClassifier(unittest.TestCase):
         )
         self.assertRaises(TypeError, clf.fit, X=self.X, y=self.y1)
 
+    def test_init_param_refit_interval(self):
+        clf = SlidingWindowClassifier(estimator=ParzenWindowClassifier())
+        self.assertEqual(clf.refit_interval, 1)
+        for refit_interval, error in [
+            (0, ValueError),
+            (1.5, TypeError),
+            ("Test", TypeError),
+        ]:
+            clf = SlidingWindowClassifier(
+                estimator=ParzenWindowClassifier(),
+                refit_interval=refit_interval,
+            )
+            self.assertRaises(error, clf.fit, X=self.X, y=self.y3)
+
+        # The estimator is refitted after `refit_interval` added samples.
+        random_state = np.random.RandomState(0)
+        X = random_state.rand(20, 2)
+        y = random_state.choice([0, 1, np.nan], size=20)
+        clf = SlidingWindowClassifier(
+            estimator=ParzenWindowClassifier(classes=[0, 1]),
+            classes=[0, 1],
+            ignore_estimator_partial_fit=True,
+            window_size=6,
+            only_labeled=True,
+            refit_interval=3,
+        )
+        clf.fit(X[:2], y[:2])
+        estimator = clf.estimator_
+        n_added = 0
+        for i in range(2, 20):
+            clf.partial_fit(X[[i]], y[[i]])
+            n_added += not np.isnan(y[i])
+            if n_added == 3:
+                n_added = 0
+                self.assertIsNot(clf.estimator_, estimator)
+                estimator = clf.estimator_
+                np.testing.assert_array_equal(clf.estimator_.X_, clf.X_train_)
+            else:
+                self.assertIs(clf.estimator_, estimator)
+
     def test_fit(self):
         # check if clf is correctly initialized
         clf = SlidingWindowClassifier(
@@ -369,6 +594,58 @@ class TestSlidingWindowClassifier(unittest.TestCase):
         clf.partial_fit(
             self.X, self.y_nan, sample_weight=np.ones_like(self.y2)
         )
+
+        # The window contains the latest samples and is stored in a buffer.
+        random_state = np.random.RandomState(0)
+        X = random_state.rand(30, 2)
+        y = random_state.choice([0, 1], size=30)
+        w = random_state.rand(30)
+        for window_size in [None, 1, 4]:
+            with self.subTest(window_size=window_size):
+                clf = SlidingWindowClassifier(
+                    estimator=ParzenWindowClassifier(classes=[0, 1]),
+                    classes=[0, 1],
+                    ignore_estimator_partial_fit=True,
+                    window_size=window_size,
+                )
+                clf.fit(X[:2], y[:2], sample_weight=w[:2])
+                for start, end in [(2, 3), (3, 10), (10, 10), (10, 30)]:
+                    clf.partial_fit(
+                        X[start:end], y[start:end], sample_weight=w[start:end]
+                    )
+                    start = 0 if window_size is None else end - window_size
+                    start = max(start, 0)
+                    np.testing.assert_array_equal(clf.X_train_, X[start:end])
+                    np.testing.assert_array_equal(clf.y_train_, y[start:end])
+                    np.testing.assert_array_equal(
+                        clf.sample_weight_train_, w[start:end]
+                    )
+                    np.testing.assert_array_equal(
+                        clf.estimator_.X_, X[start:end]
+                    )
+        clf = SlidingWindowClassifier(
+            estimator=ParzenWindowClassifier(classes=[0, 1]),
+            classes=[0, 1],
+            ignore_estimator_partial_fit=True,
+            window_size=4,
+        )
+        clf.fit(X[:4], y[:4]).partial_fit(X[4:5], y[4:5])
+        buffer = clf.X_train_.base
+        self.assertGreater(len(buffer), len(clf.X_train_))
+        clf.partial_fit(X[5:6], y[5:6])
+        self.assertIs(clf.X_train_.base, buffer)
+        self.assertIsNone(clf.sample_weight_train_)
+
+        # Weights are initialized with ones, if they were not given before.
+        clf.partial_fit(X[6:7], y[6:7], sample_weight=[2])
+        np.testing.assert_array_equal(clf.sample_weight_train_, [1, 1, 1, 2])
+
+        # Shallow copies do not overwrite each other's samples.
+        clf_copy = copy(clf)
+        clf.partial_fit(X[7:8], y[7:8])
+        clf_copy.partial_fit(X[8:9], y[8:9])
+        np.testing.assert_array_equal(clf.X_train_, X[4:8])
+        np.testing.assert_array_equal(clf_copy.X_train_, X[[4, 5, 6, 8]])
         # test clf with classes and empty data
         clf = SlidingWindowClassifier(
             estimator=SklearnClassifier(
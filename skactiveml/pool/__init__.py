@@ -5,6 +5,7 @@ pool-based active learning.
 
 from . import multiannotator
 from . import utils
+from ._candidate_screening import CandidateScreening
 from ._cost_embedding_al import CostEmbeddingAL
 from ._discriminative_al import DiscriminativeAL
 from ._epistemic_uncertainty_sampling import EpistemicUncertaintySampling
@@ -62,4 +63,5 @@ __all__ = [
     "GreedySamplingX",
     "GreedySamplingTarget",
     "DiscriminativeAL",
+    "CandidateScreening",
 ]
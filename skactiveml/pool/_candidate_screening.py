@@ -0,0 +1,236 @@
+"""
+Module implementing a two-stage candidate screening wrapper for expensive
+pool-based query strategies.
+"""
+
+import numpy as np
+
+from ._random_sampling import RandomSampling
+from ..base import SingleAnnotatorPoolQueryStrategy
+from ..utils import MISSING_LABEL, call_func, check_scalar, check_type
+
+
+class CandidateScreening(SingleAnnotatorPoolQueryStrategy):
+    """Candidate Screening
+
+    This wrapper implements a two-stage query strategy. In the first stage, a
+    cheap `screening_strategy` (e.g., `UncertaintySampling` or
+    `RandomSampling`) computes utilities for all candidates. Only
+    `max_candidates` of them are passed to the second stage, where the
+    (typically expensive) `strategy` selects the samples to be queried. Thus,
+    the number of candidates evaluated by strategies requiring one model refit
+    per candidate, e.g., `MonteCarloEER` or `ExpectedModelOutputChange`, is
+    bounded independently of the size of the pool.
+
+    Parameters
+    ----------
+    strategy : SingleAnnotatorPoolQueryStrategy, optional (default=None)
+        Query strategy selecting the samples among the screened candidates. If
+        None, `RandomSampling` is used.
+    screening_strategy : SingleAnnotatorPoolQueryStrategy,
+    optional (default=None)
+        Query strategy whose utilities are used to screen the candidates. If
+        None, `RandomSampling` is used, i.e., a random subset of the candidates
+        is passed to `strategy`.
+    max_candidates : int, optional (default=100)
+        Maximum number of candidates passed to `strategy`. If `batch_size` is
+        larger, `batch_size` candidates are passed instead. If there are not
+        more candidates than this number, no screening is performed.
+    screening : {'top', 'stratified'}, optional (default='top')
+        Defines how the candidates are screened. For 'top', the candidates
+        with the highest screening utilities are selected. For 'stratified',
+        the candidates are sorted according to their screening utilities and
+        split into `max_candidates` strata of (almost) equal size, from each
+        of which one candidate is drawn at random.
+    missing_label : scalar or string or np.nan or None, optional
+    (default=np.nan)
+        Value to represent a missing label.
+    random_state : int or np.random.RandomState, optional (default=None)
+        The random state to use.
+    """
+
+    def __init__(
+        self,
+        strategy=None,
+        screening_strategy=None,
+        max_candidates=100,
+        screening="top",
+        missing_label=MISSING_LABEL,
+        random_state=None,
+    ):
+        super().__init__(
+            missing_label=missing_label, random_state=random_state
+        )
+        self.strategy = strategy
+        self.screening_strategy = screening_strategy
+        self.max_candidates = max_candidates
+        self.screening = screening
+
+    def query(
+        self,
+        X,
+        y,
+        candidates=None,
+        batch_size=1,
+        return_utilities=False,
+        screening_params_dict=None,
+        **kwargs,
+    ):
+        """Determines for which candidate samples labels are to be queried.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data set, usually complete, i.e. including the labeled and
+            unlabeled samples.
+        y : array-like of shape (n_samples)
+            Labels of the training data set (possibly including unlabeled ones
+            indicated by self.MISSING_LABEL.
+        candidates : None or array-like of shape (n_candidates), dtype=int or
+            array-like of shape (n_candidates, n_features),
+            optional (default=None)
+            If candidates is None, the unlabeled samples from (X,y) are
+            considered as candidates.
+            If candidates is of shape (n_candidates) and of type int,
+            candidates is considered as the indices of the samples in (X,y).
+            If candidates is of shape (n_candidates, n_features), the
+            candidates are directly given in candidates (not necessarily
+            contained in X). This is not supported by all query strategies.
+        batch_size : int, optional (default=1)
+            The number of samples to be selected in one AL cycle.
+        return_utilities : bool, optional (default=False)
+            If true, also return the utilities based on the query strategy.
+        screening_params_dict : dict, optional (default=None)
+            Dictionary for the parameters of the `query` method of the
+            `screening_strategy`. They overwrite the entries of `kwargs`.
+        kwargs : kwargs
+            Further parameters, e.g., `clf`, which are passed to the `query`
+            methods of `strategy` and `screening_strategy` if they appear in
+            the respective signatures.
+
+        Returns
+        -------
+        query_indices : numpy.ndarray of shape (batch_size)
+            The query_indices indicate for which candidate sample a label is
+            to queried, e.g., `query_indices[0]` indicates the first selected
+            sample.
+            If candidates is None or of shape (n_candidates), the indexing
+            refers to samples in X.
+            If candidates is of shape (n_candidates, n_features), the indexing
+            refers to samples in candidates.
+        utilities : numpy.ndarray of shape (batch_size, n_samples) or
+            numpy.ndarray of shape (batch_size, n_candidates)
+            The utilities of samples after each selected sample of the batch,
+            e.g., `utilities[0]` indicates the utilities used for selecting
+            the first sample (with index `query_indices[0]`) of the batch.
+            Utilities for labeled samples and candidates that were screened
+            out will be set to np.nan.
+            If candidates is None or of shape (n_candidates), the indexing
+            refers to samples in X.
+            If candidates is of shape (n_candidates, n_features), the indexing
+            refers to samples in candidates.
+        """
+        # Validate input parameters.
+        X, y, candidates, batch_size, return_utilities = self._validate_data(
+            X, y, candidates, batch_size, return_utilities, reset=True
+        )
+
+        X_cand, mapping = self._transform_candidates(candidates, X, y)
+
+        check_type(
+            self.strategy,
+            "strategy",
+            SingleAnnotatorPoolQueryStrategy,
+            target_vals=[None],
+        )
+        check_type(
+            self.screening_strategy,
+            "screening_strategy",
+            SingleAnnotatorPoolQueryStrategy,
+            target_vals=[None],
+        )
+        check_scalar(self.max_candidates, "max_candidates", int, min_val=1)
+        check_type(
+            self.screening, "screening", target_vals=["top", "stratified"]
+        )
+        if screening_params_dict is None:
+            screening_params_dict = {}
+        check_type(screening_params_dict, "screening_params_dict", dict)
+
+        strategy = self.strategy
+        if strategy is None:
+            strategy = RandomSampling(
+                missing_label=self.missing_label_,
+                random_state=self.random_state_,
+            )
+        screening_strategy = self.screening_strategy
+        if screening_strategy is None:
+            screening_strategy = RandomSampling(
+                missing_label=self.missing_label_,
+                random_state=self.random_state_,
+            )
+
+        # Screen the candidates, if there are more than allowed.
+        n_cand = len(X_cand)
+        n_screened = max(self.max_candidates, batch_size)
+        if n_cand > n_screened:
+            screening_kwargs = dict(kwargs, **screening_params_dict)
+            _, screening_utilities = call_func(
+                screening_strategy.query,
+                X=X,
+                y=y,
+                candidates=candidates,
+                return_utilities=True,
+                **screening_kwargs,
+            )
+            screening_utilities = screening_utilities[0]
+            if mapping is not None:
+                screening_utilities = screening_utilities[mapping]
+            screening_utilities = np.nan_to_num(
+                screening_utilities, nan=-np.inf
+            )
+            # Sort descending and break ties at random.
+            order = np.lexsort(
+                (
+                    self.random_state_.random_sample(n_cand),
+                    -screening_utilities,
+                )
+            )
+            if self.screening == "top":
+                screened_idx = order[:n_screened]
+            else:
+                strata = np.array_split(order, n_screened)
+                screened_idx = np.array(
+                    [self.random_state_.choice(s) for s in strata]
+                )
+            screened_idx = np.sort(screened_idx)
+        else:
+            screened_idx = np.arange(n_cand)
+
+        # Query the screened candidates.
+        if mapping is None:
+            screened_candidates = X_cand[screened_idx]
+        else:
+            screened_candidates = mapping[screened_idx]
+        query_indices, w_utilities = call_func(
+            strategy.query,
+            X=X,
+            y=y,
+            candidates=screened_candidates,
+            batch_size=batch_size,
+            return_utilities=True,
+            **kwargs,
+        )
+
+        # Map the results back to the original candidates.
+        if mapping is None:
+            query_indices = screened_idx[query_indices]
+            utilities = np.full((len(w_utilities), n_cand), np.nan)
+            utilities[:, screened_idx] = w_utilities
+        else:
+            utilities = w_utilities
+
+        if return_utilities:
+            return query_indices, utilities
+        else:
+            return query_indices
@@ -5,6 +5,7 @@ Module implementing discriminative active learning.
 
 import numpy as np
 from sklearn import clone
+from sklearn.ensemble import BaseEnsemble
 
 from ..base import SingleAnnotatorPoolQueryStrategy, SkactivemlClassifier
 from ..utils import (
@@ -13,6 +14,7 @@ from ..utils import (
     is_unlabeled,
     simple_batch,
     check_type,
+    check_scalar,
 )
 
 
@@ -31,6 +33,21 @@ class DiscriminativeAL(SingleAnnotatorPoolQueryStrategy):
         `greedy_selection=False` the classifying discriminator is refitted
         after each sample selection within a batch. Otherwise, the
         discriminator is kept fixed.
+    refit_interval : int, optional (default=1)
+        This parameter is only relevant for `greedy_selection=False`. The
+        discriminator is refitted only after every `refit_interval` sample
+        selections within a batch. In between, the remaining candidates are
+        selected according to the utilities of the last fit.
+    warm_start : bool, optional (default=False)
+        This parameter is only relevant for `greedy_selection=False`. If
+        True, each refit within a batch is initialized with the solution of
+        the previous fit by setting the `warm_start` parameter of the
+        discriminator or of its wrapped `estimator` (e.g., for
+        `LogisticRegression` or `MLPClassifier`). Discriminators without such
+        a parameter and ensembles of `sklearn.ensemble` (e.g.,
+        `RandomForestClassifier` or `HistGradientBoostingClassifier`), for
+        which `warm_start` means adding estimators or iterations instead of
+        initializing the previous ones, are refitted from scratch.
     missing_label : scalar or string or np.nan or None, optional
     (default=np.nan)
         Value to represent a missing label.
@@ -49,11 +66,15 @@ class DiscriminativeAL(SingleAnnotatorPoolQueryStrategy):
         greedy_selection=False,
         missing_label=MISSING_LABEL,
         random_state=None,
+        refit_interval=1,
+        warm_start=False,
     ):
         super().__init__(
             missing_label=missing_label, random_state=random_state
         )
         self.greedy_selection = greedy_selection
+        self.refit_interval = refit_interval
+        self.warm_start = warm_start
 
     def query(
         self,
@@ -120,6 +141,8 @@ class DiscriminativeAL(SingleAnnotatorPoolQueryStrategy):
         )
         check_type(discriminator, "discriminator", SkactivemlClassifier)
         check_type(self.greedy_selection, "greedy_selection", bool)
+        check_scalar(self.refit_interval, "refit_interval", int, min_val=1)
+        check_type(self.warm_start, "warm_start", bool)
 
         # Retransform candidates and create a potential mapping to the samples
         # in `X`.
@@ -153,26 +176,35 @@ class DiscriminativeAL(SingleAnnotatorPoolQueryStrategy):
                 return_utilities=return_utilities,
             )
         else:
-            # Refit the binary classifier, i.e., the discriminator, after each
-            # selected sample in a batch.
+            # Decide whether the refits are initialized with the previous
+            # solution.
+            if self.warm_start:
+                _set_warm_start(discriminator)
+
+            # Refit the binary classifier, i.e., the discriminator, after
+            # every `refit_interval` selected samples in a batch.
             X_discriminator = X
             query_indices_cand = []
             utilities_cand = np.empty((batch_size, len(X_cand)), dtype=float)
             for i in range(batch_size):
-                # Determine unlabeled vs. labeled samples.
-                y_discriminator = is_unlabeled(
-                    y, missing_label=self.missing_label
-                )
-                y_discriminator = y_discriminator.astype(int)
+                if i % self.refit_interval == 0:
+                    # Determine unlabeled vs. labeled samples.
+                    y_discriminator = is_unlabeled(
+                        y, missing_label=self.missing_label
+                    )
+                    y_discriminator = y_discriminator.astype(int)
+
+                    # Mark already selected samples as labeled.
+                    y_discriminator[mapping[query_indices_cand]] = 0
 
-                # Mark already selected samples as labeled.
-                y_discriminator[mapping[query_indices_cand]] = 0
+                    # Fit discriminator to classify unlabeled vs. labeled
+                    # samples.
+                    discriminator.fit(X_discriminator, y_discriminator)
 
-                # Fit discriminator to classify unlabeled vs. labeled samples.
-                discriminator.fit(X_discriminator, y_discriminator)
+                    # Compute utilities as probabilities of being unlabeled.
+                    probas_cand = discriminator.predict_proba(X_cand)[:, 1]
 
-                # Compute utilities as probabilities of being unlabeled.
-                utilities_cand[i] = discriminator.predict_proba(X_cand)[:, 1]
+                utilities_cand[i] = probas_cand
                 utilities_cand[i, query_indices_cand] = np.nan
                 query_indices_cand.append(
                     rand_argmax(utilities_cand[i], self.random_state_)[0]
@@ -188,3 +220,22 @@ class DiscriminativeAL(SingleAnnotatorPoolQueryStrategy):
                 return query_indices, utilities
             else:
                 return query_indices
+
+
+def _set_warm_start(discriminator):
+    """Enables the `warm_start` parameter of the discriminator or of its
+    wrapped `estimator`, if it initializes the refit with the previous
+    solution. This is not the case for ensembles, for which `warm_start` adds
+    estimators or iterations to the previous ones."""
+    params = discriminator.get_params()
+    if "estimator__warm_start" in params:
+        estimator = discriminator.estimator
+        module = type(estimator).__module__
+        if isinstance(estimator, BaseEnsemble) or module.startswith(
+            "sklearn.ensemble"
+        ):
+            return
+        discriminator.set_params(estimator__warm_start=True)
+        discriminator._warm_start_fit = True
+    elif "warm_start" in params:
+        discriminator.set_params(warm_start=True)
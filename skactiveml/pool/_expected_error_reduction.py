@@ -1,4 +1,9 @@
+import warnings
+from copy import copy
+
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.utils import gen_batches, get_chunk_n_rows
 
 from .utils import IndexClassifierWrapper
 from ..base import SingleAnnotatorPoolQueryStrategy, SkactivemlClassifier
@@ -11,6 +16,7 @@ from ..utils import (
     check_equal_missing_label,
     unlabeled_indices,
     is_unlabeled,
+    rand_argmax,
 )
 
 
@@ -48,6 +54,24 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
         Value to represent a missing label.
     random_state : int or np.random.RandomState
         The random state to use.
+    n_jobs : int, optional (default=None)
+        The number of jobs to evaluate the candidates in parallel. The
+        candidates are split into shards that are evaluated by separate
+        copies of the classifier. Large arrays, e.g., the samples and the
+        precomputed kernel values, are shared with the workers via memory
+        mapping. None means 1 unless in a `joblib.parallel_backend` context.
+        -1 means using all processors.
+    backend : str, optional (default=None)
+        The parallelization backend passed to `joblib.Parallel`, e.g., 'loky'
+        or 'threading'. If None, the default backend of `joblib` is used.
+    batch_mode : {'simple', 'sequential'}, optional (default='simple')
+        Defines how batches with `batch_size>1` are selected. For 'simple',
+        the candidates with the highest utilities are selected. For
+        'sequential', the candidates are selected one after another. After
+        each selection, the classifier is updated with the expected label of
+        the selected candidate (cf. `IndexClassifierWrapper.
+        partial_fit_proba`) and the utilities of the remaining candidates are
+        recomputed. This requires a classifier accepting sample weights.
 
     References
     ----------
@@ -69,12 +93,18 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
         cost_matrix=None,
         missing_label=MISSING_LABEL,
         random_state=None,
+        n_jobs=None,
+        backend=None,
+        batch_mode="simple",
     ):
         super().__init__(
             missing_label=missing_label, random_state=random_state
         )
         self.cost_matrix = cost_matrix
         self.enforce_mapping = enforce_mapping
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.batch_mode = batch_mode
 
     def query(
         self,
@@ -235,51 +265,101 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
             idx_eval,
             fit_clf=fit_clf,
         )
-        # Compute class-membership probabilities of candidate samples
-        probs_cand = id_clf.predict_proba(idx_cand)
-
         # Check cost matrix.
         classes = id_clf.classes_
         self._validate_cost_matrix(len(classes))
 
+        if self.batch_mode == "simple" or batch_size == 1:
+            utilities_cand, _ = self._compute_utilities(
+                id_clf, idx_train, idx_cand, idx_eval, w_eval
+            )
+            if mapping is None:
+                utilities = np.array(utilities_cand)
+            else:
+                utilities = np.full(len(X), np.nan)
+                utilities[mapping] = utilities_cand
+
+            return simple_batch(
+                utilities,
+                self.random_state_,
+                batch_size=batch_size,
+                return_utilities=return_utilities,
+            )
+
+        # Select the candidates sequentially.
+        if len(idx_cand) < batch_size:
+            warnings.warn(
+                f"'batch_size={batch_size}' is larger than number of "
+                f"candidate samples. Instead, 'batch_size={len(idx_cand)}' "
+                f"was set."
+            )
+            batch_size = len(idx_cand)
+        # The selected candidates are added to the training samples such
+        # that the remaining candidates are predicted by them.
+        id_clf.precompute(idx_cand, idx_cand)
+        n_utilities = len(idx_cand) if mapping is None else len(X)
+        utilities = np.full((batch_size, n_utilities), np.nan)
+        query_indices = np.empty(batch_size, dtype=int)
+        is_cand = np.ones(len(idx_cand), dtype=bool)
+        for b in range(batch_size):
+            if b > 0:
+                # Update the classifier with the expected label of the
+                # previously selected candidate.
+                id_clf.partial_fit_proba(
+                    idx_cand[[i_sel]],
+                    probs_sel,
+                    use_base_clf=True,
+                    set_base_clf=True,
+                )
+                is_cand[i_sel] = False
+            utilities_cand, probs_cand = self._compute_utilities(
+                id_clf, idx_train, idx_cand[is_cand], idx_eval, w_eval
+            )
+            i_best = rand_argmax(utilities_cand, self.random_state_)[0]
+            i_sel = np.flatnonzero(is_cand)[i_best]
+            probs_sel = probs_cand[[i_best]]
+            if mapping is None:
+                utilities[b, is_cand] = utilities_cand
+                query_indices[b] = i_sel
+            else:
+                utilities[b, mapping[is_cand]] = utilities_cand
+                query_indices[b] = mapping[i_sel]
+
+        if return_utilities:
+            return query_indices, utilities
+        else:
+            return query_indices
+
+    def _compute_utilities(
+        self, id_clf, idx_train, idx_cand, idx_eval, w_eval
+    ):
+        """Computes the utilities of the candidates `idx_cand` for the current
+        base classifier.
+
+        Returns
+        -------
+        utilities_cand : np.ndarray of shape (n_candidates)
+            The utilities of the candidates.
+        probs_cand : np.ndarray of shape (n_candidates, n_classes)
+            The class-membership probabilities of the candidates.
+        """
+        # Compute class-membership probabilities of candidate samples
+        probs_cand = id_clf.predict_proba(idx_cand)
+
         # precomputating current error
         current_error = self._estimate_current_error(
             id_clf, idx_train, idx_cand, idx_eval, w_eval
         )
 
-        # Storage for computed errors per candidate sample
-        errors = np.zeros([len(idx_cand), len(classes)])
-
-        # Iterate over candidate samples
-        for i_cx, idx_cx in enumerate(idx_cand):
-            # Simulate acquisition of label for each candidate sample and class
-            for i_cy, cy in enumerate(classes):
-                errors[i_cx, i_cy] = self._estimate_error_for_candidate(
-                    id_clf,
-                    [idx_cx],
-                    [cy],
-                    idx_train,
-                    idx_cand,
-                    idx_eval,
-                    w_eval,
-                )
+        # Compute errors per candidate sample and class
+        errors = self._estimate_errors(
+            id_clf, idx_train, idx_cand, idx_eval, w_eval
+        )
 
         # utils are maximized, errors minimized: hence multiply by (-1)
         future_error = np.sum(probs_cand * errors, axis=1)
         utilities_cand = -1 * (future_error - current_error)
-
-        if mapping is None:
-            utilities = np.array(utilities_cand)
-        else:
-            utilities = np.full(len(X), np.nan)
-            utilities[mapping] = utilities_cand
-
-        return simple_batch(
-            utilities,
-            self.random_state_,
-            batch_size=batch_size,
-            return_utilities=return_utilities,
-        )
+        return utilities_cand, probs_cand
 
     def _validate_data(
         self,
@@ -337,7 +417,14 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
         """Function used to evaluate parameters of the `__init__` function that
         are not part of the abstract class to avoid redundancies.
         """
-        pass
+        if self.n_jobs is not None:
+            check_type(self.n_jobs, "n_jobs", int)
+            if self.n_jobs == 0:
+                raise ValueError("`n_jobs` must not be 0.")
+        check_type(self.backend, "backend", str, target_vals=[None])
+        check_type(
+            self.batch_mode, "batch_mode", target_vals=["simple", "sequential"]
+        )
 
     def _precompute_and_fit_clf(
         self,
@@ -361,6 +448,84 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
         """
         return 0.0
 
+    def _estimate_errors(self, id_clf, idx_train, idx_cand, idx_eval, w_eval):
+        """Estimates the error for every pair of candidate and class label.
+
+        If the class-membership probabilities of the simulated classifiers can
+        be computed in closed form (cf. `IndexClassifierWrapper.
+        simulate_proba`), they are computed for chunks of candidates at once.
+        Otherwise, the classifier is refitted for every pair. If `n_jobs` is
+        not 1, shards of candidates are evaluated in parallel.
+
+        Returns
+        -------
+        errors : np.ndarray of shape (n_candidates, n_classes)
+            The estimated errors, where `errors[i, c]` is the error after
+            adding the candidate `idx_cand[i]` with label `classes_[c]`.
+        """
+        n_classes = len(id_clf.classes_)
+        n_jobs = effective_n_jobs(self.n_jobs)
+
+        # Determine the shards of candidates.
+        shard_size = len(idx_cand)
+        if id_clf.can_simulate_proba():
+            # Bound memory of the probability tensor of each shard.
+            row_bytes = 3 * 8 * n_classes**2 * len(idx_eval)
+            shard_size = get_chunk_n_rows(row_bytes)
+        if n_jobs > 1:
+            shard_size = min(shard_size, -(-len(idx_cand) // n_jobs))
+        shards = [
+            idx_cand[sl]
+            for sl in gen_batches(len(idx_cand), max(shard_size, 1))
+        ]
+        if len(shards) == 0:
+            return np.zeros([0, n_classes])
+
+        if n_jobs == 1 or len(shards) == 1:
+            errors = [
+                self._estimate_errors_for_candidates(
+                    id_clf, idx_cx, idx_train, idx_cand, idx_eval, w_eval
+                )
+                for idx_cx in shards
+            ]
+        else:
+            # Compute shared values once. Each shard gets its own copy of the
+            # classifier, whose large arrays are memory mapped by `joblib`.
+            id_clf.prepare_simulation(idx_cand, idx_eval)
+            errors = Parallel(n_jobs=self.n_jobs, backend=self.backend)(
+                delayed(self._estimate_errors_for_candidates)(
+                    copy(id_clf), idx_cx, idx_train, idx_cand, idx_eval, w_eval
+                )
+                for idx_cx in shards
+            )
+        return np.concatenate(errors, axis=0)
+
+    def _estimate_errors_for_candidates(
+        self, id_clf, idx_cx, idx_train, idx_cand, idx_eval, w_eval
+    ):
+        if id_clf.can_simulate_proba():
+            probs = id_clf.simulate_proba(idx_cx, idx_eval)
+            return self._estimate_errors_from_probas(
+                id_clf, probs, idx_cx, idx_train, idx_cand, idx_eval, w_eval
+            )
+
+        # Iterate over candidate samples
+        classes = id_clf.classes_
+        errors = np.zeros([len(idx_cx), len(classes)])
+        for i_cx, idx_x in enumerate(idx_cx):
+            # Simulate acquisition of label for each candidate sample and class
+            for i_cy, cy in enumerate(classes):
+                errors[i_cx, i_cy] = self._estimate_error_for_candidate(
+                    id_clf,
+                    [idx_x],
+                    [cy],
+                    idx_train,
+                    idx_cand,
+                    idx_eval,
+                    w_eval,
+                )
+        return errors
+
     def _estimate_error_for_candidate(
         self, uclf, idx_cx, cy, idx_train, idx_cand, idx_eval, w_eval
     ):
@@ -369,6 +534,19 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
             "by the query strategy."
         )
 
+    def _estimate_errors_from_probas(
+        self, id_clf, probs, idx_cx, idx_train, idx_cand, idx_eval, w_eval
+    ):
+        """
+        `probs` is of shape (len(idx_cx), n_classes, len(idx_eval), n_classes)
+        and contains the simulated class-membership probabilities of the
+        evaluation samples. Result must be of shape (len(idx_cx), n_classes).
+        """
+        raise NotImplementedError(
+            "Error estimation method must be implemented"
+            "by the query strategy."
+        )
+
     def _validate_cost_matrix(self, n_classes):
 
         cost_matrix = (
@@ -476,37 +654,56 @@ class ExpectedErrorReduction(SingleAnnotatorPoolQueryStrategy):
     def _risk_estimation(
         self, prob_true, prob_pred, cost_matrix, sample_weight
     ):
-        if prob_true.ndim == 1 and prob_pred.ndim == 1:
-            cost_est = cost_matrix[prob_true, :][
-                range(len(prob_true)), prob_pred
-            ]
-            return np.sum(sample_weight * cost_est)
-        elif prob_true.ndim == 1 and prob_pred.ndim == 2:
-            cost_est = cost_matrix[prob_true, :]
-            return np.sum(
-                sample_weight[:, np.newaxis]
-                * prob_pred
-                * cost_est[np.newaxis, :]
+        """Computes the weighted risk of predictions for (stacks of) samples.
+
+        Class labels are given as integer arrays of class indices and
+        class-membership probabilities as float arrays with the classes along
+        the last axis. Leading axes enumerate, e.g., simulated classifiers and
+        are broadcast against each other. The contractions are computed via
+        `einsum` such that no tensor of shape (n_samples, n_classes, n_classes)
+        is allocated.
+
+        Parameters
+        ----------
+        prob_true : np.ndarray of shape (..., n_samples) or
+            (..., n_samples, n_classes)
+            True class indices or class-membership probabilities.
+        prob_pred : np.ndarray of shape (..., n_samples) or
+            (..., n_samples, n_classes)
+            Predicted class indices or class-membership probabilities.
+        cost_matrix : np.ndarray of shape (n_classes, n_classes)
+            Cost matrix with `cost_matrix[i,j]` defining the cost of predicting
+            class `j` for a sample with the actual class `i`.
+        sample_weight : np.ndarray of shape (n_samples)
+            Weights of the samples.
+
+        Returns
+        -------
+        risk : float or np.ndarray of shape (...)
+            Weighted sum of the (expected) costs over the samples.
+        """
+        true_is_label = np.issubdtype(prob_true.dtype, np.integer)
+        pred_is_label = np.issubdtype(prob_pred.dtype, np.integer)
+        if true_is_label and pred_is_label:
+            cost_est = cost_matrix[prob_true, prob_pred]
+        elif true_is_label:
+            cost_est = np.einsum(
+                "...ek,...ek->...e", cost_matrix[prob_true], prob_pred
             )
-        elif prob_true.ndim == 2 and prob_pred.ndim == 1:
-            cost_est = cost_matrix[:, prob_pred].T
-            return np.sum(
-                sample_weight[:, np.newaxis]
-                * prob_true
-                * cost_est[np.newaxis, :]
+        elif pred_is_label:
+            cost_est = np.einsum(
+                "...ek,...ek->...e", prob_true, cost_matrix.T[prob_pred]
             )
         else:
-            prob_mat = (
-                prob_true[:, :, np.newaxis] @ prob_pred[:, np.newaxis, :]
-            )
-            return np.sum(
-                sample_weight[:, np.newaxis, np.newaxis]
-                * prob_mat
-                * cost_matrix[np.newaxis, :, :]
+            cost_est = np.einsum(
+                "...ek,...ek->...e", prob_true @ cost_matrix, prob_pred
             )
+        return cost_est @ sample_weight
 
     def _logloss_estimation(self, prob_true, prob_pred):
-        return -np.sum(prob_true * np.log(prob_pred + np.finfo(float).eps))
+        return -np.sum(
+            prob_true * np.log(prob_pred + np.finfo(float).eps), axis=(-2, -1)
+        )
 
 
 class MonteCarloEER(ExpectedErrorReduction):
@@ -535,6 +732,21 @@ class MonteCarloEER(ExpectedErrorReduction):
         Value to represent a missing label.
     random_state : int or np.random.RandomState
         The random state to use.
+    n_jobs : int, optional (default=None)
+        The number of jobs to evaluate the candidates in parallel. None means 1
+        unless in a `joblib.parallel_backend` context. -1 means using all
+        processors.
+    backend : str, optional (default=None)
+        The parallelization backend passed to `joblib.Parallel`. If None, the
+        default backend of `joblib` is used.
+    batch_mode : {'simple', 'sequential'}, optional (default='simple')
+        Defines how batches with `batch_size>1` are selected. For 'simple',
+        the candidates with the highest utilities are selected. For
+        'sequential', the candidates are selected one after another. After
+        each selection, the classifier is updated with the expected label of
+        the selected candidate (cf. `IndexClassifierWrapper.
+        partial_fit_proba`) and the utilities of the remaining candidates are
+        recomputed. This requires a classifier accepting sample weights.
 
     References
     ----------
@@ -548,12 +760,18 @@ class MonteCarloEER(ExpectedErrorReduction):
         subtract_current=False,
         missing_label=MISSING_LABEL,
         random_state=None,
+        n_jobs=None,
+        backend=None,
+        batch_mode="simple",
     ):
         super().__init__(
             enforce_mapping=False,
             cost_matrix=cost_matrix,
             missing_label=missing_label,
             random_state=random_state,
+            n_jobs=n_jobs,
+            backend=backend,
+            batch_mode=batch_mode,
         )
         self.method = method
         self.subtract_current = subtract_current
@@ -612,6 +830,22 @@ class MonteCarloEER(ExpectedErrorReduction):
             err = self._logloss_estimation(probs, probs)
         return err
 
+    def _estimate_errors_from_probas(
+        self, id_clf, probs, idx_cx, idx_train, idx_cand, idx_eval, w_eval
+    ):
+        if self.method == "misclassification_loss":
+            # The risk of the cost-optimal prediction is the minimal cost.
+            # The minimum is taken class-wise, which is considerably faster
+            # than reducing the short last axis of the cost tensor.
+            costs = probs @ self.cost_matrix_
+            min_costs = costs[..., 0].copy()
+            for k in range(1, costs.shape[-1]):
+                np.minimum(min_costs, costs[..., k], out=min_costs)
+            err = min_costs @ w_eval[idx_eval]
+        elif self.method == "log_loss":
+            err = self._logloss_estimation(probs, probs)
+        return err
+
     def _precompute_and_fit_clf(
         self, id_clf, X_full, y_full, idx_train, idx_cand, idx_eval, fit_clf
     ):
@@ -667,6 +901,21 @@ class ValueOfInformationEER(ExpectedErrorReduction):
         Value to represent a missing label.
     random_state : int or np.random.RandomState
         The random state to use.
+    n_jobs : int, optional (default=None)
+        The number of jobs to evaluate the candidates in parallel. None means 1
+        unless in a `joblib.parallel_backend` context. -1 means using all
+        processors.
+    backend : str, optional (default=None)
+        The parallelization backend passed to `joblib.Parallel`. If None, the
+        default backend of `joblib` is used.
+    batch_mode : {'simple', 'sequential'}, optional (default='simple')
+        Defines how batches with `batch_size>1` are selected. For 'simple',
+        the candidates with the highest utilities are selected. For
+        'sequential', the candidates are selected one after another. After
+        each selection, the classifier is updated with the expected label of
+        the selected candidate (cf. `IndexClassifierWrapper.
+        partial_fit_proba`) and the utilities of the remaining candidates are
+        recomputed. This requires a classifier accepting sample weights.
 
     References
     ----------
@@ -690,12 +939,18 @@ class ValueOfInformationEER(ExpectedErrorReduction):
         normalize=False,
         missing_label=MISSING_LABEL,
         random_state=None,
+        n_jobs=None,
+        backend=None,
+        batch_mode="simple",
     ):
         super().__init__(
             enforce_mapping=True,
             cost_matrix=cost_matrix,
             missing_label=missing_label,
             random_state=random_state,
+            n_jobs=n_jobs,
+            backend=backend,
+            batch_mode=batch_mode,
         )
         self.consider_unlabeled = consider_unlabeled
         self.consider_labeled = consider_labeled
@@ -844,6 +1099,64 @@ class ValueOfInformationEER(ExpectedErrorReduction):
         else:
             return err
 
+    def _estimate_errors_from_probas(
+        self, id_clf, probs, idx_cx, idx_train, idx_cand, idx_eval, w_eval
+    ):
+        y_eval = id_clf.y[idx_eval]
+        is_lbld = is_labeled(y_eval, missing_label=self.missing_label_)
+        w_eval = w_eval[idx_eval]
+
+        # Position of the candidates within the evaluation samples.
+        pos = np.full(len(id_clf.X), -1)
+        pos[idx_eval] = np.arange(len(idx_eval))
+        pos_cx = pos[idx_cx]
+        probs_cx = probs[np.arange(len(idx_cx)), :, pos_cx]
+        w_cx = w_eval[pos_cx]
+
+        # Each candidate's simulated label as class index of shape (1, C, 1).
+        y_cx_c_id = np.arange(probs.shape[1])[np.newaxis, :, np.newaxis]
+        probs_cx = probs_cx[:, :, np.newaxis, :]
+
+        err = np.zeros(probs.shape[:2])
+        norm = np.zeros(len(idx_cx))
+        if self.consider_labeled:
+            y_labeled_c_id = id_clf._le.transform(y_eval[is_lbld])
+            err += self._risk_estimation(
+                y_labeled_c_id,
+                probs[:, :, is_lbld],
+                self.cost_matrix_,
+                w_eval[is_lbld],
+            )
+            norm += np.sum(is_lbld)
+            if self.candidate_to_labeled:
+                err += w_cx[:, np.newaxis] * self._risk_estimation(
+                    y_cx_c_id, probs_cx, self.cost_matrix_, np.ones(1)
+                )
+                norm += 1
+
+        if self.consider_unlabeled:
+            probs_ulbd = probs[:, :, ~is_lbld]
+            err += self._risk_estimation(
+                probs_ulbd, probs_ulbd, self.cost_matrix_, w_eval[~is_lbld]
+            )
+            norm += np.sum(~is_lbld)
+            if self.candidate_to_labeled:
+                # Candidates move from the unlabeled to the labeled samples.
+                is_ulbd_cx = ~is_lbld[pos_cx]
+                err_cx = self._risk_estimation(
+                    probs_cx, probs_cx, self.cost_matrix_, np.ones(1)
+                )
+                err -= (is_ulbd_cx * w_cx)[:, np.newaxis] * err_cx
+                norm -= is_ulbd_cx
+
+        if self.normalize:
+            norm = norm[:, np.newaxis]
+            return np.divide(
+                err, norm, out=np.zeros_like(err), where=norm != 0
+            )
+        else:
+            return err
+
     def _estimate_current_error(
         self, id_clf, idx_train, idx_cand, idx_eval, w_eval
     ):
@@ -1,12 +1,14 @@
 import math
 
 import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn import clone
 
 from skactiveml.base import (
     SkactivemlRegressor,
     SingleAnnotatorPoolQueryStrategy,
     SkactivemlClassifier,
+    _FitCache,
 )
 from skactiveml.utils import (
     check_type,
@@ -16,6 +18,7 @@ from skactiveml.utils import (
     check_X_y,
     check_random_state,
     check_callable,
+    is_unlabeled,
 )
 
 
@@ -46,6 +49,20 @@ class ExpectedModelChangeMaximization(SingleAnnotatorPoolQueryStrategy):
         Value to represent a missing label.
     random_state : int | np.random.RandomState, optional (default=None)
         Random state for candidate selection.
+    n_jobs : int, optional (default=None)
+        The number of jobs to fit the bootstrap estimators and to predict with
+        them in parallel. None means 1 unless in a `joblib.parallel_backend`
+        context. -1 means using all processors.
+    backend : str, optional (default=None)
+        The parallelization backend passed to `joblib.Parallel`, e.g., 'loky'
+        or 'threading'. If None, the default backend of `joblib` is used.
+    warm_start : bool, optional (default=False)
+        If True, the bootstrap estimators and their bootstraps are kept
+        between calls of `query`. In the next call, only the estimators whose
+        bootstraps contain samples with changed labels or weights are
+        refitted, as long as `X`, the hyperparameters of `reg`,
+        `bootstrap_size`, and `n_train` are unchanged. Otherwise, new
+        bootstraps are drawn.
 
     References
     ----------
@@ -63,6 +80,9 @@ class ExpectedModelChangeMaximization(SingleAnnotatorPoolQueryStrategy):
         feature_map=None,
         missing_label=MISSING_LABEL,
         random_state=None,
+        n_jobs=None,
+        backend=None,
+        warm_start=False,
     ):
         super().__init__(
             random_state=random_state, missing_label=missing_label
@@ -71,6 +91,9 @@ class ExpectedModelChangeMaximization(SingleAnnotatorPoolQueryStrategy):
         self.n_train = n_train
         self.ord = ord
         self.feature_map = feature_map
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.warm_start = warm_start
 
     def query(
         self,
@@ -147,25 +170,27 @@ class ExpectedModelChangeMaximization(SingleAnnotatorPoolQueryStrategy):
         if self.feature_map is None:
             self.feature_map = lambda x: x
         check_callable(self.feature_map, "self.feature_map")
+        if self.n_jobs is not None:
+            check_type(self.n_jobs, "n_jobs", int)
+            if self.n_jobs == 0:
+                raise ValueError("`n_jobs` must not be 0.")
+        check_type(self.backend, "backend", str, target_vals=[None])
+        check_type(self.warm_start, "warm_start", bool)
 
         if fit_reg:
             reg = clone(reg).fit(X, y, sample_weight)
 
         X_cand, mapping = self._transform_candidates(candidates, X, y)
 
-        learners = _bootstrap_estimators(
-            reg,
-            X,
-            y,
-            bootstrap_size=self.bootstrap_size,
-            n_train=self.n_train,
-            sample_weight=sample_weight,
-            random_state=self.random_state_,
-        )
+        learners = self._fit_learners(reg, X, y, sample_weight)
 
-        results_learner = np.array(
-            [learner.predict(X_cand) for learner in learners]
-        )
+        if effective_n_jobs(self.n_jobs) == 1:
+            results_learner = [learner.predict(X_cand) for learner in learners]
+        else:
+            results_learner = Parallel(
+                n_jobs=self.n_jobs, backend=self.backend
+            )(delayed(learner.predict)(X_cand) for learner in learners)
+        results_learner = np.array(results_learner)
         pred = reg.predict(X_cand).reshape(1, -1)
         scalars = np.average(np.abs(results_learner - pred), axis=0)
         X_cand_mapped_features = self.feature_map(X_cand)
@@ -185,6 +210,66 @@ class ExpectedModelChangeMaximization(SingleAnnotatorPoolQueryStrategy):
             return_utilities=return_utilities,
         )
 
+    def _fit_learners(self, reg, X, y, sample_weight):
+        """Fits the bootstrap estimators. For `warm_start=True`, the
+        estimators of the previous call are reused if possible, and only
+        those whose bootstraps contain changed samples are refitted."""
+        cache = self.__dict__.get("_bootstrap_cache")
+        self._bootstrap_cache = None
+        key = None
+        if self.warm_start:
+            key = _FitCache.key(
+                reg, X, np.array([self.bootstrap_size, self.n_train])
+            )
+        w = np.ones(len(X)) if sample_weight is None else sample_weight
+        is_lbld = ~is_unlabeled(y, missing_label=self.missing_label_)
+
+        if key is not None and cache is not None and cache["key"] == key:
+            learners = list(cache["learners"])
+            subsets_indices = cache["subsets_indices"]
+            is_changed = (is_lbld != cache["is_lbld"]) | (w != cache["w"])
+            is_changed |= is_lbld & cache["is_lbld"] & (y != cache["y"])
+            refit = [
+                b
+                for b, subset_indices in enumerate(subsets_indices)
+                if np.any(is_changed[subset_indices])
+            ]
+            refitted = _fit_estimators(
+                reg,
+                X,
+                y,
+                [subsets_indices[b] for b in refit],
+                sample_weight=sample_weight,
+                n_jobs=self.n_jobs,
+                backend=self.backend,
+            )
+            for b, learner in zip(refit, refitted):
+                learners[b] = learner
+        else:
+            learners, subsets_indices = _bootstrap_estimators(
+                reg,
+                X,
+                y,
+                bootstrap_size=self.bootstrap_size,
+                n_train=self.n_train,
+                sample_weight=sample_weight,
+                random_state=self.random_state_,
+                n_jobs=self.n_jobs,
+                backend=self.backend,
+                return_indices=True,
+            )
+
+        if key is not None:
+            self._bootstrap_cache = {
+                "key": key,
+                "learners": learners,
+                "subsets_indices": subsets_indices,
+                "y": np.array(y, copy=True),
+                "is_lbld": is_lbld,
+                "w": np.array(w, copy=True),
+            }
+        return learners
+
 
 def _bootstrap_estimators(
     est,
@@ -194,6 +279,9 @@ def _bootstrap_estimators(
     n_train=0.5,
     sample_weight=None,
     random_state=None,
+    n_jobs=None,
+    backend=None,
+    return_indices=False,
 ):
     """Train the estimator on bootstraps of `X` and `y`.
 
@@ -215,11 +303,21 @@ def _bootstrap_estimators(
     random_state : int | np.random.RandomState (default=None)
         The random state to use. If `random_state is None` random
         `random_state` is used.
+    n_jobs : int, optional (default=None)
+        The number of jobs to fit the estimators in parallel. None means 1
+        unless in a `joblib.parallel_backend` context.
+    backend : str, optional (default=None)
+        The parallelization backend passed to `joblib.Parallel`.
+    return_indices : bool, optional (default=False)
+        Whether to return the indices of the samples of each bootstrap.
 
     Returns
     -------
     bootstrap_est : list of SkactivemlClassifier or list of SkactivemlRegressor
         The estimators trained on different bootstraps.
+    subsets_indices : list of numpy.ndarray, optional
+        The indices of the samples of each bootstrap. Only returned if
+        `return_indices` is True.
     """
 
     check_X_y(X=X, y=y, sample_weight=sample_weight)
@@ -242,20 +340,51 @@ def _bootstrap_estimators(
     check_type(est, "est", SkactivemlClassifier, SkactivemlRegressor)
     random_state = check_random_state(random_state)
 
-    bootstrap_est = [clone(est) for _ in range(bootstrap_size)]
     sample_indices = np.arange(len(X))
     subsets_indices = [
         random_state.choice(sample_indices, size=int(len(X) * n_train + 1))
         for _ in range(bootstrap_size)
     ]
 
-    for est_b, subset_indices in zip(bootstrap_est, subsets_indices):
-        X_for_learner = X[subset_indices]
-        y_for_learner = y[subset_indices]
-        if sample_weight is None:
-            est_b.fit(X_for_learner, y_for_learner)
-        else:
-            weight_for_learner = sample_weight[subset_indices]
-            est_b.fit(X_for_learner, y_for_learner, weight_for_learner)
+    bootstrap_est = _fit_estimators(
+        est,
+        X,
+        y,
+        subsets_indices,
+        sample_weight=sample_weight,
+        n_jobs=n_jobs,
+        backend=backend,
+    )
 
+    if return_indices:
+        return bootstrap_est, subsets_indices
     return bootstrap_est
+
+
+def _fit_estimators(
+    est, X, y, subsets_indices, sample_weight=None, n_jobs=None, backend=None
+):
+    """Fits a clone of the estimator on each subset of `X` and `y`, in
+    parallel if `n_jobs` is not 1."""
+    if effective_n_jobs(n_jobs) == 1 or len(subsets_indices) <= 1:
+        return [
+            _fit_estimator(clone(est), X, y, subset_indices, sample_weight)
+            for subset_indices in subsets_indices
+        ]
+    return Parallel(n_jobs=n_jobs, backend=backend)(
+        delayed(_fit_estimator)(
+            clone(est), X, y, subset_indices, sample_weight
+        )
+        for subset_indices in subsets_indices
+    )
+
+
+def _fit_estimator(est, X, y, subset_indices, sample_weight=None):
+    X_for_learner = X[subset_indices]
+    y_for_learner = y[subset_indices]
+    if sample_weight is None:
+        est.fit(X_for_learner, y_for_learner)
+    else:
+        weight_for_learner = sample_weight[subset_indices]
+        est.fit(X_for_learner, y_for_learner, weight_for_learner)
+    return est
@@ -9,7 +9,11 @@ from skactiveml.base import (
     ProbabilisticRegressor,
     SingleAnnotatorPoolQueryStrategy,
 )
-from skactiveml.pool.utils import _update_reg, _conditional_expect
+from skactiveml.pool.utils import (
+    _update_reg,
+    _conditional_expect,
+    _check_vector_func,
+)
 from skactiveml.utils import (
     check_type,
     simple_batch,
@@ -176,14 +180,31 @@ class ExpectedModelOutputChange(SingleAnnotatorPoolQueryStrategy):
             )
             y_pred_new = reg_new.predict(X_eval)
 
-            return self.loss(y_pred, y_pred_new)
+            if y_pred_new.ndim == 1:
+                return self.loss(y_pred, y_pred_new)
+            return np.array(
+                [
+                    [self.loss(y_pred, y_p) for y_p in y_ps]
+                    for y_ps in y_pred_new
+                ]
+            )
 
+        # Predict for all candidates and potential labels at once, if
+        # possible. The loss is still evaluated for each prediction.
+        vector_func = _check_vector_func(
+            self.integration_dict,
+            reg,
+            X,
+            y,
+            sample_weight=sample_weight,
+            mapping=mapping,
+        )
         change = _conditional_expect(
             X_cand,
             _model_output_change,
             reg,
             random_state=self.random_state_,
-            **self.integration_dict,
+            **{**self.integration_dict, "vector_func": vector_func},
         )
 
         if mapping is None:
@@ -7,7 +7,11 @@ from skactiveml.base import (
     SingleAnnotatorPoolQueryStrategy,
 )
 from skactiveml.utils import check_type, simple_batch, MISSING_LABEL
-from skactiveml.pool.utils import _update_reg, _conditional_expect
+from skactiveml.pool.utils import (
+    _update_reg,
+    _conditional_expect,
+    _check_vector_func,
+)
 
 
 class ExpectedModelVarianceReduction(SingleAnnotatorPoolQueryStrategy):
@@ -153,14 +157,23 @@ class ExpectedModelVarianceReduction(SingleAnnotatorPoolQueryStrategy):
             )
             _, new_model_std = reg_new.predict(X_eval, return_std=True)
 
-            return np.average(new_model_std**2)
+            return np.average(new_model_std**2, axis=-1)
 
+        # Evaluate all candidates and potential labels at once, if possible.
+        vector_func = _check_vector_func(
+            self.integration_dict,
+            reg,
+            X,
+            y,
+            sample_weight=sample_weight,
+            mapping=mapping,
+        )
         ex_model_variance = _conditional_expect(
             X_cand,
             new_model_variance,
             reg,
             random_state=self.random_state_,
-            **self.integration_dict
+            **{**self.integration_dict, "vector_func": vector_func}
         )
 
         utilities_cand = old_model_variance - ex_model_variance
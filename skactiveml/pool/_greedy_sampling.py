@@ -1,6 +1,7 @@
 import numpy as np
 from sklearn import clone
 from sklearn.metrics import pairwise_distances, pairwise
+from sklearn.utils import gen_batches, get_chunk_n_rows
 
 from skactiveml.base import (
     SingleAnnotatorPoolQueryStrategy,
@@ -399,45 +400,51 @@ def _greedy_sampling(
     method=None,
     **kwargs,
 ):
-
-    dist_dict = dict(
-        X_cand=X_cand, y_cand=y_cand, X=X, y=y, method=method, **kwargs
-    )
+    dist_dict = dict(X=X, y=y, method=method, **kwargs)
     query_indices = np.zeros(batch_size, dtype=int)
     utilities = np.full((batch_size, len(X_cand)), np.nan)
-    distances = np.full((len(X_cand), len(X)), np.nan)
 
-    if len(selected_indices) == 0:
-        distances[:, sample_indices] = _measure_distance(
-            sample_indices, **dist_dict
-        )
-    else:
-        distances[:, selected_indices] = _measure_distance(
-            selected_indices, **dist_dict
+    def measure_distance(indices, sl=slice(None)):
+        return _measure_distance(
+            indices,
+            X_cand=X_cand[sl],
+            y_cand=None if y_cand is None else y_cand[sl],
+            **dist_dict,
         )
 
-    not_selected_candidates = np.arange(len(X_cand), dtype=int)
+    # The utility of a candidate is its minimum distance to the selected
+    # samples or, if there are none, its negative sum of distances to all
+    # samples. It is computed for chunks of candidates and afterwards updated
+    # by the distances to each newly selected candidate.
+    is_empty = len(selected_indices) == 0
+    reference_indices = sample_indices if is_empty else selected_indices
+    util = np.empty(len(X_cand))
+    chunk_n_rows = get_chunk_n_rows(
+        row_bytes=8 * max(len(reference_indices), 1),
+        max_n_rows=len(X_cand),
+    )
+    for sl in gen_batches(len(X_cand), chunk_n_rows):
+        dist = measure_distance(reference_indices, sl)
+        if is_empty:
+            util[sl] = -np.sum(dist, axis=1)
+        else:
+            util[sl] = np.min(dist, axis=1)
 
+    is_selected = np.zeros(len(X_cand), dtype=bool)
     for i in range(batch_size):
-        if len(selected_indices) == 0:
-            dist = distances[not_selected_candidates][:, sample_indices]
-            util = -np.sum(dist, axis=1)
-        else:
-            dist = distances[not_selected_candidates][:, selected_indices]
-            util = np.min(dist, axis=1)
-        utilities[i, not_selected_candidates] = util
+        not_selected_candidates = np.flatnonzero(~is_selected)
+        utilities[i, not_selected_candidates] = util[not_selected_candidates]
 
-        idx = rand_argmax(util, random_state=random_state)
+        idx = rand_argmax(
+            util[not_selected_candidates], random_state=random_state
+        )[0]
         query_indices[i] = not_selected_candidates[idx]
-        distances[:, candidate_indices[idx]] = _measure_distance(
-            candidate_indices[idx], **dist_dict
-        )
+        is_selected[query_indices[i]] = True
 
-        selected_indices = np.append(
-            selected_indices, candidate_indices[idx], axis=0
-        )
-        candidate_indices = np.delete(candidate_indices, idx, axis=0)
-        not_selected_candidates = np.delete(not_selected_candidates, idx)
+        dist = measure_distance(
+            candidate_indices[query_indices[i] : query_indices[i] + 1]
+        )[:, 0]
+        util = dist if is_empty and i == 0 else np.minimum(util, dist)
 
     return query_indices, utilities
 
@@ -11,6 +11,7 @@ from skactiveml.pool.utils import (
     _update_reg,
     _conditional_expect,
     _cross_entropy,
+    _check_vector_func,
 )
 from skactiveml.utils import (
     check_type,
@@ -213,15 +214,24 @@ class MutualInformationGainMaximization(SingleAnnotatorPoolQueryStrategy):
                 mapping=mapping,
             )
             _, entropy_cand = reg_new.predict(X_eval, return_entropy=True)
-            potentials_post_entropy = np.sum(entropy_cand)
+            potentials_post_entropy = np.sum(entropy_cand, axis=-1)
             return potentials_post_entropy
 
+        # Evaluate all candidates and potential labels at once, if possible.
+        vector_func = _check_vector_func(
+            self.integration_dict,
+            reg,
+            X,
+            y,
+            sample_weight=sample_weight,
+            mapping=mapping,
+        )
         cond_entropy = _conditional_expect(
             X_cand,
             new_entropy,
             reg,
             random_state=self.random_state_,
-            **self.integration_dict
+            **{**self.integration_dict, "vector_func": vector_func}
         )
 
         mi_gain = prior_entropy - cond_entropy
@@ -1,5 +1,8 @@
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from sklearn.kernel_approximation import Nystroem
 from sklearn.metrics.pairwise import pairwise_kernels, KERNEL_PARAMS
+from sklearn.utils import gen_batches, get_chunk_n_rows
 
 from skactiveml.base import SingleAnnotatorPoolQueryStrategy
 from skactiveml.utils import (
@@ -7,7 +10,6 @@ from skactiveml.utils import (
     simple_batch,
     MISSING_LABEL,
     is_labeled,
-    is_unlabeled,
     ExtLabelEncoder,
 )
 
@@ -34,6 +36,19 @@ class Quire(SingleAnnotatorPoolQueryStrategy):
         Value to represent a missing label.
     random_state : int or np.random.RandomState, optional (default=None)
         The random state to use.
+    approximation : {None, 'nystroem'}, default=None
+        Approximation of the kernel matrix. For 'nystroem', the kernel matrix
+        is approximated by the Nystroem method
+        (`sklearn.kernel_approximation.Nystroem`), whose components are
+        sampled from `X`. The inverses are then computed via the Woodbury
+        identity, which requires O(n_samples * n_components**2) time instead
+        of O(n_labeled**3 + n_candidates * n_labeled**2). The kernel values of
+        the candidates with themselves are computed exactly. If None, the
+        exact kernel matrix is used. An approximation cannot be combined with
+        `metric='precomputed'`.
+    n_components : int, default=100
+        Rank of the approximating kernel matrix. It is ignored if
+        `approximation` is None.
 
     References
     ---------
@@ -52,6 +67,8 @@ class Quire(SingleAnnotatorPoolQueryStrategy):
         metric_dict=None,
         missing_label=MISSING_LABEL,
         random_state=None,
+        approximation=None,
+        n_components=100,
     ):
         super().__init__(
             missing_label=missing_label, random_state=random_state
@@ -60,6 +77,8 @@ class Quire(SingleAnnotatorPoolQueryStrategy):
         self.lmbda = lmbda
         self.metric = metric
         self.metric_dict = metric_dict
+        self.approximation = approximation
+        self.n_components = n_components
 
     def query(
         self,
@@ -131,7 +150,6 @@ class Quire(SingleAnnotatorPoolQueryStrategy):
             candidates, X, y, enforce_mapping=True
         )
         mask_l = is_labeled(y=y, missing_label=self.missing_label)
-        mask_a = is_unlabeled(y=y, missing_label=self.missing_label)
         le = ExtLabelEncoder(self.classes, self.missing_label)
         y = le.fit_transform(y)
         classes_ = le.transform(self.classes)
@@ -170,8 +188,30 @@ class Quire(SingleAnnotatorPoolQueryStrategy):
             min_inclusive=False,
         )
 
+        # Check approximation of the kernel.
+        approximations = [None, "nystroem"]
+        if self.approximation not in approximations:
+            raise ValueError(
+                f"The parameter 'approximation' must be in {approximations}, "
+                f"got {self.approximation}."
+            )
+        if self.approximation is not None:
+            check_scalar(
+                self.n_components,
+                name="n_components",
+                target_type=int,
+                min_val=1,
+            )
+            if self.metric == "precomputed":
+                raise ValueError(
+                    "The parameter 'approximation' cannot be combined with "
+                    "'metric=precomputed'."
+                )
+
         # --- Computation ----------------------------------------------------
-        # Compute kernel (metric) matrix.
+        # Compute the required blocks of the kernel (metric) matrix, i.e.,
+        # the kernel values between labeled samples, between candidates and
+        # labeled samples, and of the candidates with themselves.
         if self.metric == "precomputed":
             K = np.array(X)
             if K.shape != (len(y), len(y)):
@@ -179,31 +219,51 @@ class Quire(SingleAnnotatorPoolQueryStrategy):
                     "The kernel matrix 'K' must have the shape "
                     "(n_samples, n_samples)."
                 )
+            K_ll = K[mask_l][:, mask_l]
+            K_cl = K[mapping][:, mask_l]
+            K_cc_diag = np.diag(K)[mapping]
+        elif self.approximation == "nystroem":
+            # Approximate the kernel matrix by `Z @ Z.T`.
+            feature_map = Nystroem(
+                kernel=self.metric,
+                kernel_params=self.metric_dict_,
+                n_components=min(self.n_components, len(X)),
+                random_state=self.random_state_,
+            ).fit(X)
+            Z_l = feature_map.transform(X[mask_l])
+            Z_c = feature_map.transform(X_cand)
+            K_cc_diag = _kernel_diagonal(
+                X_cand, metric=self.metric, **self.metric_dict_
+            )
         else:
-            K = pairwise_kernels(X, X, metric=self.metric, **self.metric_dict_)
-        # compute L and L_aa
-        L = np.linalg.inv(K + lmbda * np.eye(len(X)))
-        # Compute the inverse of L_aa
-        L_aa_inv = _L_aa_inv(K, lmbda, mask_a, mask_l)
+            n_labeled = np.sum(mask_l)
+            K_ll = np.empty((n_labeled, n_labeled))
+            K_cl = np.empty((len(X_cand), n_labeled))
+            if n_labeled > 0:
+                K_ll = pairwise_kernels(
+                    X[mask_l],
+                    X[mask_l],
+                    metric=self.metric,
+                    **self.metric_dict_,
+                )
+                K_cl = pairwise_kernels(
+                    X_cand, X[mask_l], metric=self.metric, **self.metric_dict_
+                )
+            K_cc_diag = _kernel_diagonal(
+                X_cand, metric=self.metric, **self.metric_dict_
+            )
 
-        utilities_cand = np.full((len(X)), fill_value=np.nan)
         y_labeled_ovr = _one_versus_rest_transform(
             y[mask_l], classes_, l_rest=-1
         )
-        for i, s in enumerate(mapping):
-            mask_u = mask_a.copy()
-            mask_u[s] = False
-            L_uu_inv = _del_i_inv(L_aa_inv, i)
-
-            utilities_cand[s] = L[s, s] + np.max(
-                [
-                    yl.T.dot(L[mask_l][:, mask_l]).dot(yl)
-                    + 2 * L[s][mask_l].dot(yl)
-                    - (L[mask_u][:, mask_l].dot(yl) + L[mask_u][:, [s]])
-                    .T.dot(L_uu_inv)
-                    .dot(L[mask_u][:, mask_l].dot(yl) + L[mask_u][:, [s]])
-                    for yl in y_labeled_ovr.T[:, :, np.newaxis]
-                ]
+        utilities_cand = np.full((len(X)), fill_value=np.nan)
+        if self.approximation == "nystroem":
+            utilities_cand[mapping] = _quire_utilities_low_rank(
+                Z_l, Z_c, K_cc_diag, y_labeled_ovr, lmbda
+            )
+        else:
+            utilities_cand[mapping] = _quire_utilities(
+                K_ll, K_cl, K_cc_diag, y_labeled_ovr, lmbda
             )
 
         # If we want to use enforce_mapping = False later
@@ -231,28 +291,101 @@ def _one_versus_rest_transform(y, classes, l_one=1, l_rest=-1):
     return y_ovr.T
 
 
-def _del_i_inv(A_inv, s):
-    np.testing.assert_allclose(
-        A_inv, A_inv.T, err_msg="A_inv is not symmetric."
-    )
-    a = A_inv[s, s]
-    b = np.delete(A_inv[:, [s]], s, axis=0)
-    D = np.delete(np.delete(A_inv, [s], axis=0), [s], axis=1)
-    B_inv = D - (1 / a) * np.dot(b, b.T)
-    return B_inv
+def _kernel_diagonal(X, metric, **kwargs):
+    """Computes the diagonal of the kernel matrix of `X` in chunks."""
+    K_diag = np.empty(len(X))
+    chunk_n_rows = get_chunk_n_rows(row_bytes=8 * len(X), max_n_rows=len(X))
+    for sl in gen_batches(len(X), chunk_n_rows):
+        K_diag[sl] = np.diag(
+            pairwise_kernels(X[sl], X[sl], metric=metric, **kwargs)
+        )
+    return K_diag
 
 
-def _L_aa_inv(K, lmbda, is_unlabeled, is_labeled):
-    L_aa_inv = (
-        lmbda * np.eye(sum(is_unlabeled)) + K[is_unlabeled][:, is_unlabeled]
-    )
-    L_aa_inv -= (
-        K[is_unlabeled][:, is_labeled]
-        .dot(
-            np.linalg.inv(
-                lmbda * np.eye(sum(is_labeled)) + K[is_labeled][:, is_labeled]
-            )
-        )
-        .dot(K[is_labeled][:, is_unlabeled])
+def _quire_utilities(K_ll, K_cl, K_cc_diag, y_labeled_ovr, lmbda):
+    """Computes the QUIRE objective values of all candidates.
+
+    With `A = K + lmbda * I` and `L = A^-1`, the objective of a candidate
+    `s` and a one-versus-rest labeling `y_l` of the labeled samples requires
+    the inverse of `L_uu`, where `u` are the unlabeled samples except `s`.
+    Removing `s` from the inverse of `L_aa`, i.e., from the Schur complement
+    `S = A_aa - A_al A_ll^-1 A_la` of all unlabeled samples `a`, is a rank-one
+    update. Inserting it into the objective, all terms involving `L_aa`
+    cancel out, and the objective reduces to
+
+        y_l^T A_ll^-1 y_l + (1 - A_sl A_ll^-1 y_l)^2 / S_ss.
+
+    Hence, only the Cholesky factorization of `A_ll` is required, and all
+    candidates and classes are evaluated at once.
+
+    Parameters
+    ----------
+    K_ll : numpy.ndarray of shape (n_labeled, n_labeled)
+        Kernel matrix of the labeled samples.
+    K_cl : numpy.ndarray of shape (n_candidates, n_labeled)
+        Kernel matrix between the candidates and the labeled samples.
+    K_cc_diag : numpy.ndarray of shape (n_candidates)
+        Kernel values of the candidates with themselves.
+    y_labeled_ovr : numpy.ndarray of shape (n_labeled, n_classes)
+        One-versus-rest labels of the labeled samples.
+    lmbda : float
+        Regularization parameter.
+
+    Returns
+    -------
+    utilities : numpy.ndarray of shape (n_candidates)
+        Maximum objective values over all classes for each candidate.
+    """
+    if len(K_ll) > 0:
+        A_ll = cho_factor(K_ll + lmbda * np.eye(len(K_ll)))
+        A_ll_inv_y = cho_solve(A_ll, y_labeled_ovr)
+        A_ll_inv_K_lc = cho_solve(A_ll, K_cl.T)
+        y_norms = np.sum(y_labeled_ovr * A_ll_inv_y, axis=0)
+        residuals = 1 - K_cl.dot(A_ll_inv_y)
+        S_diag = K_cc_diag + lmbda - np.sum(K_cl * A_ll_inv_K_lc.T, axis=1)
+    else:
+        y_norms = np.zeros(y_labeled_ovr.shape[1])
+        residuals = np.ones((len(K_cl), y_labeled_ovr.shape[1]))
+        S_diag = K_cc_diag + lmbda
+    return np.max(y_norms + residuals**2 / S_diag[:, np.newaxis], axis=1)
+
+
+def _quire_utilities_low_rank(Z_l, Z_c, K_cc_diag, y_labeled_ovr, lmbda):
+    """Computes the QUIRE objective values of all candidates for the
+    low-rank kernel matrix `Z @ Z.T`.
+
+    The objective is the one of `_quire_utilities`, where the inverse of
+    `A_ll = Z_l Z_l^T + lmbda * I` is computed via the Woodbury identity,
+    i.e., only the inverse of `G = Z_l^T Z_l + lmbda * I` of shape
+    (n_components, n_components) is required.
+
+    Parameters
+    ----------
+    Z_l : numpy.ndarray of shape (n_labeled, n_components)
+        Features of the labeled samples.
+    Z_c : numpy.ndarray of shape (n_candidates, n_components)
+        Features of the candidates.
+    K_cc_diag : numpy.ndarray of shape (n_candidates)
+        Kernel values of the candidates with themselves.
+    y_labeled_ovr : numpy.ndarray of shape (n_labeled, n_classes)
+        One-versus-rest labels of the labeled samples.
+    lmbda : float
+        Regularization parameter.
+
+    Returns
+    -------
+    utilities : numpy.ndarray of shape (n_candidates)
+        Maximum objective values over all classes for each candidate.
+    """
+    G = cho_factor(Z_l.T.dot(Z_l) + lmbda * np.eye(Z_l.shape[1]))
+    Z_l_y = Z_l.T.dot(y_labeled_ovr)
+    G_inv_Z_l_y = cho_solve(G, Z_l_y)
+    y_norms = (
+        np.sum(y_labeled_ovr**2, axis=0) - np.sum(Z_l_y * G_inv_Z_l_y, axis=0)
+    ) / lmbda
+    residuals = 1 - Z_c.dot(G_inv_Z_l_y)
+    G_inv_Z_c = cho_solve(G, Z_c.T).T
+    S_diag = (
+        K_cc_diag + lmbda - np.sum(Z_c * (Z_c - lmbda * G_inv_Z_c), axis=1)
     )
-    return L_aa_inv
+    return np.max(y_norms + residuals**2 / S_diag[:, np.newaxis], axis=1)
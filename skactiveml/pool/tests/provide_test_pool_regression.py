@@ -506,6 +506,59 @@ def provide_test_regression_query_strategy_change_dependence(
     )
 
 
+def provide_test_regression_query_strategy_batch_update(
+    test_instance, qs_class, init_dict=None, query_dict=None
+):
+    # initialisation
+    if init_dict is None:
+        init_dict = get_default_init_dict()
+    if query_dict is None:
+        query_dict = get_default_query_dict()
+
+    X, y = get_regression_test_data()
+    update_query_dict_for_one_batch(query_dict, X, y)
+    query_dict["return_utilities"] = True
+
+    # The utilities computed for all candidates and potential labels at once
+    # equal the ones computed for each pair.
+    integration_dicts = [
+        {"method": "assume_linear"},
+        {"method": "gauss_hermite", "n_integration_samples": 3},
+        {"method": "monte_carlo", "n_integration_samples": 3},
+    ]
+    query_params = [
+        {},
+        {"sample_weight": np.arange(len(X)) + 1.0},
+        {"candidates": X[unlabeled_indices(y)] + 0.5},
+    ]
+    for integration_dict, params in product(integration_dicts, query_params):
+        utilities = []
+        for vector_func in ["both", False]:
+            integration_dict["vector_func"] = vector_func
+            qs = call_func(
+                qs_class,
+                **init_dict,
+                integration_dict=integration_dict.copy(),
+            )
+            utilities.append(call_func(qs.query, **query_dict, **params)[1])
+        np.testing.assert_allclose(*utilities)
+
+    # Vectorized updates are rejected for regressors not supporting them.
+    query_dict["reg"] = SklearnNormalRegressor(GaussianProcessRegressor())
+    for vector_func in [True, "both"]:
+        qs = call_func(
+            qs_class,
+            **init_dict,
+            integration_dict={
+                "method": "assume_linear",
+                "vector_func": vector_func,
+            },
+        )
+        test_instance.assertRaises(
+            ValueError, call_func, qs.query, **query_dict
+        )
+
+
 def get_list_of_regression_test_data(missing_label=MISSING_LABEL):
     X_s = [
         np.arange(7).reshape(7, 1),
@@ -0,0 +1,147 @@
+import unittest
+
+import numpy as np
+from sklearn.datasets import make_blobs
+
+from skactiveml.classifier import ParzenWindowClassifier
+from skactiveml.pool import (
+    CandidateScreening,
+    MonteCarloEER,
+    RandomSampling,
+    UncertaintySampling,
+)
+from skactiveml.utils import MISSING_LABEL, unlabeled_indices
+
+
+class TestCandidateScreening(unittest.TestCase):
+    def setUp(self):
+        self.X, self.y_true = make_blobs(
+            n_samples=40, centers=2, random_state=0
+        )
+        self.y = np.full_like(self.y_true, MISSING_LABEL, dtype=float)
+        self.y[:4] = self.y_true[:4]
+        self.clf = ParzenWindowClassifier(classes=[0, 1], random_state=0)
+        self.kwargs = dict(X=self.X, y=self.y, clf=self.clf)
+
+    def test_init_param_strategy(self):
+        for strategy in [ParzenWindowClassifier(), "test", 0]:
+            qs = CandidateScreening(strategy=strategy, max_candidates=5)
+            self.assertRaises(TypeError, qs.query, **self.kwargs)
+
+    def test_init_param_screening_strategy(self):
+        for screening_strategy in [ParzenWindowClassifier(), "test", 0]:
+            qs = CandidateScreening(
+                screening_strategy=screening_strategy, max_candidates=5
+            )
+            self.assertRaises(TypeError, qs.query, **self.kwargs)
+
+        # The screened candidates are the most uncertain ones.
+        qs = CandidateScreening(
+            strategy=RandomSampling(random_state=0),
+            screening_strategy=UncertaintySampling(),
+            max_candidates=5,
+            random_state=0,
+        )
+        _, utilities = qs.query(**self.kwargs, return_utilities=True)
+        _, us_utilities = UncertaintySampling().query(
+            **self.kwargs, return_utilities=True
+        )
+        screened = np.argwhere(~np.isnan(utilities[0])).ravel()
+        self.assertEqual(len(screened), 5)
+        unlbld = unlabeled_indices(self.y)
+        top = unlbld[np.argsort(-us_utilities[0, unlbld])[:5]]
+        np.testing.assert_array_equal(np.sort(top), screened)
+
+    def test_init_param_max_candidates(self):
+        for max_candidates in [0, -1]:
+            qs = CandidateScreening(max_candidates=max_candidates)
+            self.assertRaises(ValueError, qs.query, **self.kwargs)
+        for max_candidates in [1.5, "test", None]:
+            qs = CandidateScreening(max_candidates=max_candidates)
+            self.assertRaises(TypeError, qs.query, **self.kwargs)
+
+        # No screening if the number of candidates does not exceed the limit.
+        qs = CandidateScreening(
+            strategy=UncertaintySampling(),
+            screening_strategy=RandomSampling(),
+            max_candidates=len(self.X),
+        )
+        _, utilities = qs.query(**self.kwargs, return_utilities=True)
+        _, us_utilities = UncertaintySampling().query(
+            **self.kwargs, return_utilities=True
+        )
+        np.testing.assert_array_equal(utilities, us_utilities)
+
+        # At least `batch_size` candidates are screened.
+        qs = CandidateScreening(max_candidates=2, random_state=0)
+        query_indices = qs.query(**self.kwargs, batch_size=4)
+        self.assertEqual(len(np.unique(query_indices)), 4)
+
+    def test_init_param_screening(self):
+        for screening in ["test", 0, None]:
+            qs = CandidateScreening(screening=screening, max_candidates=5)
+            self.assertRaises(TypeError, qs.query, **self.kwargs)
+
+        qs = CandidateScreening(
+            screening_strategy=UncertaintySampling(),
+            max_candidates=6,
+            screening="stratified",
+            random_state=0,
+        )
+        _, utilities = qs.query(**self.kwargs, return_utilities=True)
+        self.assertEqual(np.sum(~np.isnan(utilities[0])), 6)
+        _, utilities_2 = qs.query(**self.kwargs, return_utilities=True)
+        np.testing.assert_array_equal(utilities, utilities_2)
+
+    def test_query_param_screening_params_dict(self):
+        for screening_params_dict in ["test", 0]:
+            qs = CandidateScreening(max_candidates=5)
+            self.assertRaises(
+                TypeError,
+                qs.query,
+                **self.kwargs,
+                screening_params_dict=screening_params_dict,
+            )
+
+        qs = CandidateScreening(
+            strategy=RandomSampling(),
+            screening_strategy=UncertaintySampling(),
+            max_candidates=5,
+        )
+        self.assertRaises(
+            TypeError,
+            qs.query,
+            X=self.X,
+            y=self.y,
+            screening_params_dict={"clf": None},
+        )
+        qs.query(X=self.X, y=self.y, screening_params_dict={"clf": self.clf})
+
+    def test_query(self):
+        qs = CandidateScreening(
+            strategy=MonteCarloEER(),
+            screening_strategy=UncertaintySampling(),
+            max_candidates=5,
+            random_state=0,
+        )
+        unlbld = unlabeled_indices(self.y)
+
+        # Candidates as indices.
+        query_indices, utilities = qs.query(
+            **self.kwargs, candidates=unlbld, return_utilities=True
+        )
+        self.assertEqual(utilities.shape, (1, len(self.X)))
+        self.assertFalse(np.isnan(utilities[0, query_indices[0]]))
+        screened = np.argwhere(~np.isnan(utilities[0])).ravel()
+        _, eer_utilities = MonteCarloEER().query(
+            **self.kwargs, candidates=screened, return_utilities=True
+        )
+        np.testing.assert_allclose(utilities, eer_utilities)
+
+        # Candidates as samples.
+        query_indices_2, utilities_2 = qs.query(
+            **self.kwargs, candidates=self.X[unlbld], return_utilities=True
+        )
+        self.assertEqual(utilities_2.shape, (1, len(unlbld)))
+        self.assertEqual(unlbld[query_indices_2[0]], query_indices[0])
+        np.testing.assert_allclose(utilities_2, utilities[:, unlbld])
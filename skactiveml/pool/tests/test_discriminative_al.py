@@ -1,11 +1,18 @@
 import unittest
+import warnings
+from unittest.mock import patch
 
 import numpy as np
 from sklearn.datasets import load_breast_cancer
+from sklearn.ensemble import (
+    HistGradientBoostingClassifier,
+    RandomForestClassifier,
+)
 from sklearn.gaussian_process import GaussianProcessClassifier
+from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
 
-from skactiveml.classifier import ParzenWindowClassifier
+from skactiveml.classifier import ParzenWindowClassifier, SklearnClassifier
 from skactiveml.pool import DiscriminativeAL
 
 
@@ -32,6 +39,136 @@ class TestDiscriminativeAL(unittest.TestCase):
                 discriminator=self.discriminator,
             )
 
+    def test_init_param_refit_interval(self):
+        for refit_interval, error in zip([0, 1.5], [ValueError, TypeError]):
+            dal = DiscriminativeAL(refit_interval=refit_interval)
+            self.assertRaises(
+                error,
+                dal.query,
+                X=self.X,
+                y=self.y_unlblb,
+                discriminator=self.discriminator,
+            )
+
+        y = np.full_like(self.y, -1)
+        y[:50] = self.y[:50]
+        discriminator = ParzenWindowClassifier()
+        for refit_interval, n_fits in [(1, 7), (3, 3), (7, 1)]:
+            dal = DiscriminativeAL(
+                refit_interval=refit_interval, missing_label=-1
+            )
+            with patch.object(
+                ParzenWindowClassifier,
+                "fit",
+                autospec=True,
+                side_effect=ParzenWindowClassifier.fit,
+            ) as fit:
+                query_indices, utilities = dal.query(
+                    X=self.X,
+                    y=y,
+                    discriminator=discriminator,
+                    batch_size=7,
+                    return_utilities=True,
+                )
+                self.assertEqual(fit.call_count, n_fits)
+            for i in range(1, 7):
+                if i % refit_interval != 0:
+                    is_nan = np.isnan(utilities[i])
+                    np.testing.assert_array_equal(
+                        utilities[i, ~is_nan], utilities[i - 1, ~is_nan]
+                    )
+
+        # Without refits, the top candidates are selected.
+        dal = DiscriminativeAL(greedy_selection=True, missing_label=-1)
+        query_indices_greedy = dal.query(
+            X=self.X, y=y, discriminator=discriminator, batch_size=7
+        )
+        np.testing.assert_array_equal(
+            np.sort(query_indices), np.sort(query_indices_greedy)
+        )
+
+    def test_init_param_warm_start(self):
+        for warm_start in [0, "test", None]:
+            dal = DiscriminativeAL(warm_start=warm_start)
+            self.assertRaises(
+                TypeError,
+                dal.query,
+                X=self.X,
+                y=self.y_unlblb,
+                discriminator=self.discriminator,
+            )
+
+        y = np.full_like(self.y, -1)
+        y[:50] = self.y[:50]
+
+        # Estimators with `warm_start` continue from the previous fit.
+        discriminator = SklearnClassifier(LogisticRegression())
+        lr_fit = LogisticRegression.fit
+        for warm_start, n_warm_fits in [(False, 0), (True, 4)]:
+            dal = DiscriminativeAL(warm_start=warm_start, missing_label=-1)
+            is_warm_fit = []
+
+            def fit(estimator, X, y, sample_weight=None):
+                is_warm_fit.append(hasattr(estimator, "coef_"))
+                return lr_fit(estimator, X, y, sample_weight)
+
+            with patch.object(
+                LogisticRegression, "fit", autospec=True, side_effect=fit
+            ):
+                dal.query(
+                    X=self.X, y=y, discriminator=discriminator, batch_size=5
+                )
+            self.assertEqual(sum(is_warm_fit), n_warm_fits)
+            self.assertFalse(discriminator.estimator.warm_start)
+
+        # Discriminators without `warm_start` are refitted from scratch.
+        discriminator = ParzenWindowClassifier()
+        dal = DiscriminativeAL(warm_start=True, missing_label=-1)
+        with patch.object(
+            ParzenWindowClassifier,
+            "fit",
+            autospec=True,
+            side_effect=ParzenWindowClassifier.fit,
+        ) as fit, patch.object(
+            ParzenWindowClassifier,
+            "partial_fit",
+            autospec=True,
+            side_effect=ParzenWindowClassifier.partial_fit,
+        ) as partial_fit:
+            dal.query(X=self.X, y=y, discriminator=discriminator, batch_size=5)
+            self.assertEqual(fit.call_count, 5)
+            self.assertEqual(partial_fit.call_count, 0)
+
+        # Ensembles, for which `warm_start` adds estimators, and estimators
+        # whose warm start does not change the model are refitted from
+        # scratch.
+        for estimator in [
+            RandomForestClassifier(n_estimators=20, random_state=0),
+            HistGradientBoostingClassifier(max_iter=5, random_state=0),
+        ]:
+            discriminator = SklearnClassifier(estimator, random_state=0)
+            utilities = {}
+            for warm_start in [False, True]:
+                dal = DiscriminativeAL(
+                    warm_start=warm_start, missing_label=-1, random_state=0
+                )
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", UserWarning)
+                    _, utilities[warm_start] = dal.query(
+                        X=self.X,
+                        y=y,
+                        discriminator=discriminator,
+                        batch_size=5,
+                        return_utilities=True,
+                    )
+            np.testing.assert_array_equal(utilities[False], utilities[True])
+            is_nan = np.isnan(utilities[True][-1])
+            self.assertFalse(
+                np.array_equal(
+                    utilities[True][0, ~is_nan], utilities[True][-1, ~is_nan]
+                )
+            )
+
     def test_query_param_discriminator(self):
         dal = DiscriminativeAL(missing_label=-1)
         for discriminator in [None, GaussianProcessClassifier(), "test"]:
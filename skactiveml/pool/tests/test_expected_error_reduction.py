@@ -120,6 +120,165 @@ class TemplateTestExpectedErrorReduction:
             ignore_partial_fit=None,
         )
 
+    def test_init_param_n_jobs(self):
+        for n_jobs in ["string", 1.5, 0]:
+            qs = self.Strategy(n_jobs=n_jobs)
+            self.assertRaises((TypeError, ValueError), qs.query, **self.kwargs)
+        self.assertTrue(hasattr(qs, "n_jobs"))
+
+    def test_init_param_backend(self):
+        qs = self.Strategy(backend=1)
+        self.assertRaises(TypeError, qs.query, **self.kwargs)
+        self.assertTrue(hasattr(qs, "backend"))
+
+    def test_init_param_batch_mode(self):
+        for batch_mode in ["string", 1, None]:
+            qs = self.Strategy(batch_mode=batch_mode)
+            self.assertRaises(TypeError, qs.query, **self.kwargs)
+        self.assertTrue(hasattr(qs, "batch_mode"))
+
+    def test_query_sequential(self):
+        random_state = np.random.RandomState(0)
+        X = random_state.randn(30, 2)
+        y = random_state.randint(0, 3, 30).astype(float)
+        y[random_state.rand(30) < 0.7] = np.nan
+        sample_weight = random_state.rand(30) + 0.5
+        X_cand = random_state.randn(5, 2)
+
+        # The first selection equals the one of the simple batch mode.
+        clf = ParzenWindowClassifier(classes=self.classes, class_prior=0.1)
+        candidates_list = [None, np.arange(10)]
+        if not self.Strategy().enforce_mapping:
+            candidates_list.append(X_cand)
+        for candidates in candidates_list:
+            with self.subTest(candidates=candidates):
+                qs = self.Strategy(random_state=0)
+                idx_simple, utils_simple = qs.query(
+                    X, y, clf, candidates=candidates, return_utilities=True
+                )
+                qs = self.Strategy(batch_mode="sequential", random_state=0)
+                idx, utils = qs.query(
+                    X,
+                    y,
+                    clf,
+                    candidates=candidates,
+                    batch_size=3,
+                    return_utilities=True,
+                )
+                self.assertEqual(len(np.unique(idx)), 3)
+                self.assertEqual(idx[0], idx_simple[0])
+                np.testing.assert_allclose(utils[0], utils_simple[0])
+                self.assertEqual(utils.shape[1], utils_simple.shape[1])
+                for b in range(1, 3):
+                    self.assertTrue(np.isnan(utils[b, idx[:b]]).all())
+
+        # The closed-form computation must yield the same batch as refitting.
+        qs = self.Strategy(batch_mode="sequential", random_state=0)
+        results = []
+        for n_neighbors in [None, 100]:
+            clf = ParzenWindowClassifier(
+                classes=self.classes, class_prior=0.1, n_neighbors=n_neighbors
+            )
+            results.append(
+                qs.query(
+                    X,
+                    y,
+                    clf,
+                    sample_weight=sample_weight,
+                    candidates=np.arange(10),
+                    batch_size=4,
+                    return_utilities=True,
+                )
+            )
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        np.testing.assert_allclose(results[0][1], results[1][1])
+
+        # The batch size is reduced to the number of candidates.
+        clf = ParzenWindowClassifier(classes=self.classes)
+        self.assertWarns(
+            Warning,
+            qs.query,
+            X,
+            y,
+            clf,
+            candidates=np.arange(2),
+            batch_size=3,
+        )
+
+    def test_query_parallel(self):
+        random_state = np.random.RandomState(0)
+        X = random_state.randn(20, 2)
+        y = random_state.randint(0, 3, 20).astype(float)
+        y[random_state.rand(20) < 0.7] = np.nan
+        clfs = [
+            ParzenWindowClassifier(classes=self.classes),
+            ParzenWindowClassifier(classes=self.classes, n_neighbors=100),
+            SklearnClassifier(GaussianNB(), classes=self.classes),
+        ]
+        for clf in clfs:
+            qs = self.Strategy(random_state=0)
+            idx_serial, utils_serial = qs.query(
+                X, y, clf, batch_size=2, return_utilities=True
+            )
+            for n_jobs, backend in [(2, "loky"), (-1, "threading")]:
+                with self.subTest(clf=clf, n_jobs=n_jobs, backend=backend):
+                    qs = self.Strategy(
+                        random_state=0, n_jobs=n_jobs, backend=backend
+                    )
+                    idx, utils = qs.query(
+                        X, y, clf, batch_size=2, return_utilities=True
+                    )
+                    np.testing.assert_array_equal(idx_serial, idx)
+                    np.testing.assert_allclose(utils_serial, utils)
+
+    def test_query_closed_form_pwc(self):
+        # The closed-form computation for the `ParzenWindowClassifier` must
+        # yield the same utilities as refitting for every candidate. Setting
+        # `n_neighbors` larger than the number of samples does not change
+        # the predictions but enforces refitting.
+        random_state = np.random.RandomState(0)
+        X = random_state.randn(30, 2)
+        y = random_state.randint(0, 3, 30).astype(float)
+        y[random_state.rand(30) < 0.7] = np.nan
+        sample_weight = random_state.rand(30) + 0.5
+        cost_matrix = random_state.rand(3, 3) * (1 - np.eye(3))
+        qs = self.Strategy(cost_matrix=cost_matrix)
+        utilities = []
+        for n_neighbors in [None, 100]:
+            clf = ParzenWindowClassifier(
+                classes=self.classes, class_prior=0.1, n_neighbors=n_neighbors
+            )
+            _, utils = qs.query(
+                X,
+                y,
+                clf,
+                sample_weight=sample_weight,
+                candidates=np.arange(10),
+                return_utilities=True,
+            )
+            utilities.append(utils)
+        np.testing.assert_allclose(utilities[0], utilities[1])
+
+    def test_query_tree_based_pwc(self):
+        # Tree-based nearest neighbor searches must yield the same utilities
+        # as the brute-force search.
+        random_state = np.random.RandomState(0)
+        X = random_state.randn(30, 2)
+        y = random_state.randint(0, 3, 30).astype(float)
+        y[random_state.rand(30) < 0.7] = np.nan
+        qs = self.Strategy()
+        utilities = []
+        for algorithm in ["brute", "auto", "ball_tree", "kd_tree"]:
+            clf = ParzenWindowClassifier(
+                classes=self.classes, n_neighbors=5, algorithm=algorithm
+            )
+            _, utils = qs.query(
+                X, y, clf, candidates=np.arange(10), return_utilities=True
+            )
+            utilities.append(utils)
+        for utils in utilities[1:]:
+            np.testing.assert_allclose(utilities[0], utils)
+
     def test_query(self):
         """
         qs = self.Strategy()
@@ -429,6 +588,28 @@ class TestExpectedErrorReduction(unittest.TestCase):
                 b = qs._risk_estimation(*args)
                 np.testing.assert_allclose(a, b)
 
+        # Stacked inputs are evaluated separately along the leading axes.
+        probs = np.random.rand(3, 2, n_samples, n_classes)
+        preds = np.random.randint(0, n_classes, (3, 2, n_samples))
+        params = [
+            [pred_true, preds, cm, sw],
+            [pred_true, probs, cm, sw],
+            [probs, preds, cm, sw],
+            [probs, prob_pred, cm, sw],
+            [probs, probs, cm, sw],
+        ]
+        for args in params:
+            with self.subTest(msg="stacked", args=args):
+                b = qs._risk_estimation(*args)
+                self.assertEqual(b.shape, (3, 2))
+                for i, j in np.ndindex(3, 2):
+                    args_ij = [
+                        arg[i, j] if arg.ndim > 2 or arg is preds else arg
+                        for arg in args[:2]
+                    ]
+                    a = risk_estimation_slow(*args_ij, cm, sw)
+                    np.testing.assert_allclose(a, b[i, j])
+
     def test__logloss_estimation(self):
         n_samples = 20
         n_classes = 4
@@ -441,6 +622,13 @@ class TestExpectedErrorReduction(unittest.TestCase):
         b = qs._logloss_estimation(prob_true, prob_pred)
         np.testing.assert_allclose(a, b)
 
+        probs = np.random.rand(3, n_samples, n_classes)
+        b = qs._logloss_estimation(probs, probs)
+        self.assertEqual(b.shape, (3,))
+        np.testing.assert_allclose(
+            b[1], qs._logloss_estimation(*probs[[1, 1]])
+        )
+
 
 class TestMonteCarloEER(TemplateTestExpectedErrorReduction, unittest.TestCase):
     def get_query_strategy(self):
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from sklearn.linear_model import LinearRegression
@@ -17,6 +18,9 @@ from skactiveml.pool.tests.provide_test_pool_regression import (
     provide_test_regression_query_strategy_query_return_utilities,
     provide_test_regression_query_strategy_change_dependence,
 )
+from skactiveml.pool._expected_model_change_maximization import (
+    _fit_estimators,
+)
 from skactiveml.regressor import SklearnRegressor
 
 
@@ -66,6 +70,82 @@ class TestExpectedModelChange(unittest.TestCase):
         )[1]
         np.testing.assert_array_equal(np.zeros(2), utilities[0, :2])
 
+    def test_init_param_n_jobs(self):
+        for wrong_val, error in zip(["five", 0], [TypeError, ValueError]):
+            qs = ExpectedModelChangeMaximization(n_jobs=wrong_val)
+            self.assertRaises(error, qs.query, **self.query_kwargs)
+
+        utilities = []
+        for n_jobs in [None, 2]:
+            qs = ExpectedModelChangeMaximization(
+                n_jobs=n_jobs, backend="threading", random_state=0
+            )
+            utilities.append(
+                qs.query(**self.query_kwargs, return_utilities=True)[1]
+            )
+        np.testing.assert_allclose(*utilities)
+
+    def test_init_param_backend(self):
+        qs = ExpectedModelChangeMaximization(backend=1)
+        self.assertRaises(TypeError, qs.query, **self.query_kwargs)
+
+    def test_init_param_warm_start(self):
+        qs = ExpectedModelChangeMaximization(warm_start="True")
+        self.assertRaises(TypeError, qs.query, **self.query_kwargs)
+
+        X = np.random.RandomState(0).rand(30, 2)
+        y = np.full(30, np.nan)
+        y[:20] = X[:20, 0] - X[:20, 1]
+        reg = SklearnRegressor(LinearRegression())
+        qs = ExpectedModelChangeMaximization(
+            bootstrap_size=10, n_train=1, warm_start=True, random_state=0
+        )
+        qs.query(X, y, reg=reg)
+        subsets_indices = qs._bootstrap_cache["subsets_indices"]
+
+        # Only the estimators whose bootstraps contain the new label are
+        # refitted. They equal estimators fitted from scratch.
+        y[20] = 1
+        n_refits = sum(20 in indices for indices in subsets_indices)
+        with patch.object(
+            LinearRegression,
+            "fit",
+            autospec=True,
+            side_effect=LinearRegression.fit,
+        ) as fit:
+            utilities = qs.query(X, y, reg=reg, return_utilities=True)[1]
+            self.assertEqual(fit.call_count, 1 + n_refits)
+        self.assertIs(qs._bootstrap_cache["subsets_indices"], subsets_indices)
+        learners = _fit_estimators(reg, X, y, subsets_indices)
+        for learner, learner_exp in zip(
+            qs._bootstrap_cache["learners"], learners
+        ):
+            np.testing.assert_allclose(
+                learner.estimator_.coef_, learner_exp.estimator_.coef_
+            )
+
+        # Unchanged data do not require refits.
+        with patch.object(
+            LinearRegression,
+            "fit",
+            autospec=True,
+            side_effect=LinearRegression.fit,
+        ) as fit:
+            np.testing.assert_array_equal(
+                qs.query(X, y, reg=reg, return_utilities=True)[1], utilities
+            )
+            self.assertEqual(fit.call_count, 1)
+
+        # Changed hyperparameters lead to new bootstraps.
+        reg = SklearnRegressor(LinearRegression(fit_intercept=False))
+        qs.query(X, y, reg=reg)
+        self.assertIsNot(
+            qs._bootstrap_cache["subsets_indices"], subsets_indices
+        )
+        qs.warm_start = False
+        qs.query(X, y, reg=reg)
+        self.assertIsNone(qs._bootstrap_cache)
+
     def test_init_param_ord(self):
         qs = ExpectedModelChangeMaximization(ord="wrong_norm")
         self.assertRaises(ValueError, qs.query, **self.query_kwargs)
@@ -18,6 +18,7 @@ from skactiveml.pool.tests.provide_test_pool_regression import (
     provide_test_regression_query_strategy_init_integration_dict,
     provide_test_regression_query_strategy_query_X_eval,
     provide_test_regression_query_strategy_change_dependence,
+    provide_test_regression_query_strategy_batch_update,
 )
 from skactiveml.regressor import NICKernelRegressor
 
@@ -118,3 +119,8 @@ class TestExpectedModelOutputChange(unittest.TestCase):
         provide_test_regression_query_strategy_change_dependence(
             self, ExpectedModelOutputChange
         )
+
+    def test_batch_update(self):
+        provide_test_regression_query_strategy_batch_update(
+            self, ExpectedModelOutputChange
+        )
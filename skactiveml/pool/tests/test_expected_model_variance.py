@@ -15,6 +15,7 @@ from skactiveml.pool.tests.provide_test_pool_regression import (
     provide_test_regression_query_strategy_init_integration_dict,
     provide_test_regression_query_strategy_query_X_eval,
     provide_test_regression_query_strategy_change_dependence,
+    provide_test_regression_query_strategy_batch_update,
 )
 
 
@@ -83,3 +84,8 @@ class TestExpectedModelVarianceMinimization(unittest.TestCase):
         provide_test_regression_query_strategy_change_dependence(
             self, ExpectedModelVarianceReduction
         )
+
+    def test_batch_update(self):
+        provide_test_regression_query_strategy_batch_update(
+            self, ExpectedModelVarianceReduction
+        )
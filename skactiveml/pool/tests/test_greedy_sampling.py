@@ -1,6 +1,8 @@
 import unittest
 
 import numpy as np
+from sklearn import config_context
+from sklearn.metrics import pairwise_distances
 
 from skactiveml.base import SkactivemlRegressor
 from skactiveml.pool import GreedySamplingX, GreedySamplingTarget
@@ -75,6 +77,33 @@ class TestGreedySamplingX(unittest.TestCase):
             utilities, np.append([MISSING_LABEL], np.arange(1, 7))
         )
 
+        # The utilities of a batch are the minimum distances to the labeled
+        # and previously queried samples, independent of the chunk size.
+        X = np.random.RandomState(0).rand(30, 2)
+        for n_labeled in [0, 3]:
+            y = np.full(30, MISSING_LABEL)
+            y[:n_labeled] = 0
+            qs = GreedySamplingX(random_state=0)
+            query_indices, utilities = qs.query(
+                X, y, batch_size=5, return_utilities=True
+            )
+            with config_context(working_memory=0.0005):
+                np.testing.assert_allclose(
+                    qs.query(X, y, batch_size=5, return_utilities=True)[1],
+                    utilities,
+                )
+            dist = pairwise_distances(X)
+            selected = list(range(n_labeled))
+            for i, idx in enumerate(query_indices):
+                if selected:
+                    util_exp = np.min(dist[:, selected], axis=1)
+                else:
+                    util_exp = -np.sum(dist, axis=1)
+                util_exp[selected] = np.nan
+                np.testing.assert_allclose(utilities[i], util_exp)
+                self.assertEqual(idx, np.nanargmax(util_exp))
+                selected.append(idx)
+
 
 class TestGreedySamplingY(unittest.TestCase):
     def setUp(self):
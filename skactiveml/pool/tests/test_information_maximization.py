@@ -21,6 +21,7 @@ from skactiveml.pool.tests.provide_test_pool_regression import (
     provide_test_regression_query_strategy_init_integration_dict,
     provide_test_regression_query_strategy_query_X_eval,
     provide_test_regression_query_strategy_change_dependence,
+    provide_test_regression_query_strategy_batch_update,
 )
 from skactiveml.regressor import NICKernelRegressor, SklearnRegressor
 
@@ -91,6 +92,11 @@ class TestMutualInformationGainMaximization(unittest.TestCase):
             self, MutualInformationGainMaximization
         )
 
+    def test_batch_update(self):
+        provide_test_regression_query_strategy_batch_update(
+            self, MutualInformationGainMaximization
+        )
+
 
 class TestKLDivergenceMaximization(unittest.TestCase):
     def setUp(self):
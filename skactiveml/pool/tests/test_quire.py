@@ -1,12 +1,16 @@
 import unittest
 
 import numpy as np
+from scipy.stats import spearmanr
+from sklearn import config_context
+from sklearn.datasets import make_blobs
 from sklearn.metrics import pairwise_kernels
 
 from skactiveml.pool._quire import (
-    _del_i_inv,
-    _L_aa_inv,
+    _kernel_diagonal,
     _one_versus_rest_transform,
+    _quire_utilities,
+    _quire_utilities_low_rank,
     Quire,
 )
 from skactiveml.utils import MISSING_LABEL, is_labeled, is_unlabeled
@@ -50,6 +54,62 @@ class TestQuire(unittest.TestCase):
         K = np.zeros((len(self.y), len(self.y) - 1))
         self.assertRaises(ValueError, qs.query, y=self.y, X=K)
 
+    def test_init_param_approximation(self):
+        for approximation in ["test", "rff", 0]:
+            qs = Quire(self.classes, approximation=approximation)
+            self.assertRaises(ValueError, qs.query, **self.kwargs)
+        qs = Quire(
+            self.classes, metric="precomputed", approximation="nystroem"
+        )
+        K = pairwise_kernels(self.X, self.X, metric="rbf")
+        self.assertRaises(ValueError, qs.query, X=K, y=self.y)
+
+        # Benchmark the agreement of the utility rankings with the exact
+        # kernel matrix on small pools.
+        for n_samples, n_components, min_correlation in [
+            (100, 100, 0.999),
+            (200, 50, 0.95),
+            (500, 100, 0.95),
+        ]:
+            X, y_true = make_blobs(
+                n_samples, centers=3, cluster_std=2, random_state=0
+            )
+            y = np.full(n_samples, MISSING_LABEL)
+            y[:20] = y_true[:20]
+            _, utils = Quire(classes=[0, 1, 2]).query(
+                X, y, return_utilities=True
+            )
+            qs = Quire(
+                classes=[0, 1, 2],
+                approximation="nystroem",
+                n_components=n_components,
+                random_state=0,
+            )
+            _, utils_approx = qs.query(X, y, return_utilities=True)
+            is_unlbld = is_unlabeled(y)
+            np.testing.assert_array_equal(
+                np.isnan(utils), np.isnan(utils_approx)
+            )
+            correlation = spearmanr(
+                utils[0, is_unlbld], utils_approx[0, is_unlbld]
+            ).correlation
+            self.assertGreaterEqual(correlation, min_correlation)
+
+    def test_init_param_n_components(self):
+        for n_components, error in zip(
+            [0, 1.5, None], [ValueError, TypeError, TypeError]
+        ):
+            qs = Quire(
+                self.classes,
+                approximation="nystroem",
+                n_components=n_components,
+            )
+            self.assertRaises(error, qs.query, **self.kwargs)
+
+        # `n_components` is ignored without approximation.
+        qs = Quire(self.classes, n_components=0)
+        qs.query(**self.kwargs)
+
     def test_query(self):
         # Test metric="precomputed"
         qs = Quire(self.classes, metric="precomputed")
@@ -76,30 +136,108 @@ class TestQuire(unittest.TestCase):
         qs = Quire(self.classes)
         _, utils = qs.query(**self.kwargs, return_utilities=True)
 
-    def test__del_i_inv(self):
-        A = np.random.random((3, 3))
-        A = A + A.T
-        A_inv = np.linalg.inv(A)
-        for i in range(len(A)):
-            B = np.delete(np.delete(A, i, axis=0), i, axis=1)
-            B_inv = np.linalg.inv(B)
-            np.testing.assert_allclose(B_inv, _del_i_inv(A_inv, i))
-
-    def test__L_aa_inv(self):
-        lmbda = 1
+        # Test that utilities do not depend on the other candidates.
+        for candidates in [[3], [3, 1]]:
+            _, utils_cand = qs.query(
+                self.X, self.y, candidates=candidates, return_utilities=True
+            )
+            np.testing.assert_allclose(
+                utils[:, candidates], utils_cand[:, candidates]
+            )
+
+    def test__quire_utilities(self):
+        lmbda = 0.5
         X = np.append(self.X, self.X_cand, axis=0)
-        y = np.append(self.y_true, np.full(len(self.X_cand), MISSING_LABEL))
+        y = np.append(self.y, np.full(len(self.X_cand), MISSING_LABEL))
         is_lbld = is_labeled(y=y, missing_label=MISSING_LABEL)
         is_unlbld = is_unlabeled(y=y, missing_label=MISSING_LABEL)
+        y_ovr = _one_versus_rest_transform(y[is_lbld], self.classes)
         K = pairwise_kernels(X, X, metric="rbf")
-        # compute L and L_aa
         L = np.linalg.inv(K + lmbda * np.eye(len(X)))
-        L_aa = L[is_unlbld][:, is_unlbld]
-        L_aa_inv = np.linalg.inv(L_aa)
+
+        # Compare to the objective with explicit inverses.
+        candidates = np.argwhere(is_unlbld).ravel()
+        expected = np.empty(len(candidates))
+        for i, s in enumerate(candidates):
+            is_u = is_unlbld.copy()
+            is_u[s] = False
+            L_uu_inv = np.linalg.inv(L[is_u][:, is_u])
+            objectives = []
+            for yl in y_ovr.T:
+                v = L[is_u][:, is_lbld].dot(yl) + L[is_u, s]
+                objectives.append(
+                    L[s, s]
+                    + yl.dot(L[is_lbld][:, is_lbld]).dot(yl)
+                    + 2 * L[s, is_lbld].dot(yl)
+                    - v.dot(L_uu_inv).dot(v)
+                )
+            expected[i] = np.max(objectives)
+        utilities = _quire_utilities(
+            K[is_lbld][:, is_lbld],
+            K[candidates][:, is_lbld],
+            np.diag(K)[candidates],
+            y_ovr,
+            lmbda,
+        )
+        np.testing.assert_allclose(expected, utilities)
+
+        # Without labeled samples, only the kernel diagonal is relevant.
+        utilities = _quire_utilities(
+            np.empty((0, 0)),
+            np.empty((len(candidates), 0)),
+            np.diag(K)[candidates],
+            np.empty((0, len(self.classes))),
+            lmbda,
+        )
         np.testing.assert_allclose(
-            L_aa_inv, _L_aa_inv(K, lmbda, is_unlbld, is_lbld)
+            1 / (np.diag(K)[candidates] + lmbda), utilities
         )
 
+    def test__quire_utilities_low_rank(self):
+        lmbda = 0.5
+        X = np.append(self.X, self.X_cand, axis=0)
+        y = np.append(self.y, np.full(len(self.X_cand), MISSING_LABEL))
+        is_lbld = is_labeled(y=y, missing_label=MISSING_LABEL)
+        y_ovr = _one_versus_rest_transform(y[is_lbld], self.classes)
+        candidates = np.argwhere(~is_lbld).ravel()
+
+        # Compare to the exact objective of a low-rank kernel matrix.
+        Z = np.random.RandomState(0).rand(len(X), 3)
+        K = Z.dot(Z.T)
+        for K_cc_diag in [np.diag(K)[candidates], np.ones(len(candidates))]:
+            expected = _quire_utilities(
+                K[is_lbld][:, is_lbld],
+                K[candidates][:, is_lbld],
+                K_cc_diag,
+                y_ovr,
+                lmbda,
+            )
+            utilities = _quire_utilities_low_rank(
+                Z[is_lbld], Z[candidates], K_cc_diag, y_ovr, lmbda
+            )
+            np.testing.assert_allclose(expected, utilities)
+
+        # Without labeled samples, only the kernel diagonal is relevant.
+        utilities = _quire_utilities_low_rank(
+            np.empty((0, 3)),
+            Z[candidates],
+            np.diag(K)[candidates],
+            np.empty((0, len(self.classes))),
+            lmbda,
+        )
+        np.testing.assert_allclose(
+            1 / (np.diag(K)[candidates] + lmbda), utilities
+        )
+
+    def test__kernel_diagonal(self):
+        X = np.append(self.X, self.X_cand, axis=0)
+        for metric in ["rbf", "linear", "poly"]:
+            K = pairwise_kernels(X, X, metric=metric)
+            with config_context(working_memory=0.0001):
+                np.testing.assert_allclose(
+                    np.diag(K), _kernel_diagonal(X, metric=metric)
+                )
+
     def test__one_versus_rest_transform(self):
         y = np.array([0, 1, 2, 1, 2, 0])
         y_ovr = np.array(
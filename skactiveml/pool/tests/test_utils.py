@@ -1,21 +1,31 @@
 import itertools
+import pickle
 import unittest
+from copy import copy, deepcopy
 from itertools import product
+from unittest.mock import patch
 
 import numpy as np
+from scipy.integrate import fixed_quad
+from scipy.special import roots_hermitenorm, roots_legendre
 from scipy.stats import norm
+from sklearn.base import clone
 from sklearn.exceptions import NotFittedError
 from sklearn.gaussian_process import GaussianProcessRegressor
-from sklearn.linear_model import LinearRegression
+from sklearn.linear_model import LinearRegression, LogisticRegression
 from sklearn.metrics import pairwise_kernels
 from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier
 
 from skactiveml.classifier import ParzenWindowClassifier, SklearnClassifier
 from skactiveml.pool.utils import _cross_entropy
 from skactiveml.pool.utils import (
     IndexClassifierWrapper,
+    _KernelCache,
     _conditional_expect,
+    _quadrature_nodes,
     _reshape_scipy_dist,
+    _supports_batch_update,
     _update_X_y,
     _update_reg,
 )
@@ -138,6 +148,19 @@ class TestIndexClassifierWrapper(unittest.TestCase):
 
         self.assertRaises(TypeError, self.iclf, use_speed_up="string")
 
+        # No speed up for a Parzen Window Classifier with approximated kernel.
+        clf = ParzenWindowClassifier(
+            classes=[0, 1], approximation="rff", random_state=0
+        )
+        iclf = IndexClassifierWrapper(clf, self.X, self.y, use_speed_up=True)
+        self.assertFalse(iclf.use_speed_up)
+        iclf.precompute(np.arange(4), np.arange(4))
+        iclf.fit(np.arange(2))
+        np.testing.assert_allclose(
+            iclf.predict_proba(np.arange(4)),
+            clone(clf).fit(self.X[:2], self.y[:2]).predict_proba(self.X),
+        )
+
     def test_init_param_missing_label(self):
         self.assertTrue(hasattr(self.iclf(), "missing_label"))
         self.assertTrue(
@@ -148,6 +171,50 @@ class TestIndexClassifierWrapper(unittest.TestCase):
 
         self.assertRaises(TypeError, self.iclf, missing_label="string")
 
+    def test_init_param_kernel_dtype(self):
+        self.assertTrue(hasattr(self.iclf(), "kernel_dtype"))
+        self.assertEqual(self.iclf().kernel_dtype, None)
+        self.assertRaises(TypeError, self.iclf, kernel_dtype=int)
+        self.assertRaises(TypeError, self.iclf, kernel_dtype="string")
+
+    def test_init_param_kernel_cache_size(self):
+        self.assertTrue(hasattr(self.iclf(), "kernel_cache_size"))
+        self.assertEqual(self.iclf().kernel_cache_size, None)
+        self.assertRaises(TypeError, self.iclf, kernel_cache_size="string")
+        self.assertRaises(ValueError, self.iclf, kernel_cache_size=0)
+
+    def test_init_param_warm_start(self):
+        self.assertTrue(hasattr(self.iclf(), "warm_start"))
+        self.assertEqual(self.iclf().warm_start, False)
+        self.assertRaises(TypeError, self.iclf, warm_start="string")
+        self.assertRaises(ValueError, self.iclf, warm_start=True)
+        self.assertRaises(
+            ValueError,
+            IndexClassifierWrapper,
+            SklearnClassifier(GaussianNB(), classes=[0, 1]),
+            self.X,
+            self.y,
+            warm_start=True,
+        )
+
+        X = np.random.RandomState(0).randn(40, 2)
+        y = (X[:, 0] > 0).astype(float)
+        y[:2] = 1 - y[:2]
+        clf = SklearnClassifier(LogisticRegression(), classes=[0, 1])
+        P = {}
+        for warm_start in [False, True]:
+            iclf = IndexClassifierWrapper(
+                clf, X, y, warm_start=warm_start, enforce_unique_samples=True
+            )
+            iclf.fit(np.arange(30), set_base_clf=True)
+            coef = iclf.base_clf_.estimator_.coef_.copy()
+            iclf.partial_fit([30], use_base_clf=True)
+            P[warm_start] = iclf.predict_proba(np.arange(40))
+            np.testing.assert_array_equal(
+                coef, iclf.base_clf_.estimator_.coef_
+            )
+        np.testing.assert_allclose(P[False], P[True], rtol=1e-3)
+
     def test_precompute_param_idx_fit(self):
         iclf = self.iclf()
         self.assertRaises((ValueError, TypeError), iclf.precompute, "str", [0])
@@ -204,13 +271,21 @@ class TestIndexClassifierWrapper(unittest.TestCase):
                     self.X[fit_idx], self.X[pred_idx], metric="rbf"
                 )
 
-                np.testing.assert_array_equal(K, iclf.pwc_K_)
+                np.testing.assert_array_equal(
+                    K, iclf.pwc_K_.get(all_idx, all_idx)
+                )
 
     def test_fit_param_idx(self):
         iclf = self.iclf()
         self.assertRaises((ValueError, TypeError), iclf.fit, 0)
         self.assertRaises((ValueError, TypeError), iclf.fit, "wrong_str")
         self.assertRaises((ValueError, TypeError), iclf.fit, [10])
+        self.assertRaisesRegex(ValueError, "non-negative", iclf.fit, [-1])
+
+        # Duplicate indices are only rejected for unique samples.
+        self.iclf().fit([0, 0])
+        iclf = self.iclf(enforce_unique_samples=True)
+        self.assertRaisesRegex(ValueError, "same value", iclf.fit, [0, 0])
 
     def test_fit_param_y(self):
         iclf = self.iclf()
@@ -235,6 +310,15 @@ class TestIndexClassifierWrapper(unittest.TestCase):
         self.assertRaises((ValueError, TypeError), iclf.partial_fit, 0)
         self.assertRaises((ValueError, TypeError), iclf.partial_fit, "str")
         self.assertRaises((ValueError, TypeError), iclf.partial_fit, [10])
+        self.assertRaises(
+            (ValueError, TypeError), iclf.partial_fit, np.array([[0]])
+        )
+        self.assertRaisesRegex(
+            ValueError, "non-negative", iclf.partial_fit, [-1]
+        )
+        iclf.partial_fit(np.array([1, 1]))
+        iclf = self.iclf(enforce_unique_samples=True).fit([0])
+        self.assertRaises(ValueError, iclf.partial_fit, np.array([1, 1]))
 
     def test_partial_fit_param_y(self):
         iclf = self.iclf().fit([0])
@@ -263,12 +347,133 @@ class TestIndexClassifierWrapper(unittest.TestCase):
             TypeError, iclf.partial_fit, [0], use_base_clf="string"
         )
 
+        # The base classifier is restored via its state.
+        clf = SklearnClassifier(GaussianNB(), classes=[0, 1])
+        iclf = IndexClassifierWrapper(clf, self.X, self.y2)
+        iclf.fit([0, 1], set_base_clf=True)
+        self.assertIsNotNone(iclf.base_clf_state_)
+        clf_ = iclf.clf_
+        P_exp = deepcopy(iclf.base_clf_).partial_fit(self.X[[2]], [0])
+        P_exp = P_exp.predict_proba(self.X)
+        for _ in range(2):
+            iclf.partial_fit([2], use_base_clf=True)
+            self.assertIs(iclf.clf_, clf_)
+            np.testing.assert_allclose(iclf.predict_proba([0, 1, 2, 3]), P_exp)
+
     def test_partial_fit_param_set_base_clf(self):
         iclf = self.iclf().fit([0])
         self.assertRaises(
             TypeError, iclf.partial_fit, [0], set_base_clf="string"
         )
 
+    def test_partial_fit_proba_param_idx(self):
+        iclf = self.iclf().fit([0])
+        proba = [[0.5, 0.5]]
+        self.assertRaises(
+            (ValueError, TypeError), iclf.partial_fit_proba, 0, proba
+        )
+        self.assertRaises(
+            (ValueError, TypeError), iclf.partial_fit_proba, [10], proba
+        )
+        self.assertRaises(ValueError, iclf.partial_fit_proba, [0, 1], proba)
+
+    def test_partial_fit_proba_param_proba(self):
+        iclf = self.iclf().fit([0])
+        self.assertRaises(
+            (ValueError, TypeError), iclf.partial_fit_proba, [0], "str"
+        )
+        self.assertRaises(ValueError, iclf.partial_fit_proba, [0], [[1]])
+        self.assertRaises(
+            ValueError, iclf.partial_fit_proba, [0], [[0.5, 0.5, 0]]
+        )
+
+    def test_partial_fit_proba_param_use_base_clf(self):
+        iclf = self.iclf().fit([0])
+        self.assertRaises(
+            TypeError,
+            iclf.partial_fit_proba,
+            [1],
+            [[0.5, 0.5]],
+            use_base_clf="string",
+        )
+        self.assertRaises(
+            NotFittedError,
+            iclf.partial_fit_proba,
+            [1],
+            [[0.5, 0.5]],
+            use_base_clf=True,
+        )
+
+    def test_partial_fit_proba_param_set_base_clf(self):
+        iclf = self.iclf().fit([0])
+        self.assertRaises(
+            TypeError,
+            iclf.partial_fit_proba,
+            [1],
+            [[0.5, 0.5]],
+            set_base_clf="string",
+        )
+
+    def test_partial_fit_proba(self):
+        all_idx = np.arange(len(self.X))
+        proba = np.array([[0.2, 0.8], [1.0, 0.0]])
+        for sample_weight in [None, np.linspace(0.2, 1, 4)]:
+            with self.subTest(sample_weight=sample_weight):
+                w = np.ones(4) if sample_weight is None else sample_weight
+                # The vote vectors of the `ParzenWindowClassifier` equal the
+                # weighted probabilities.
+                iclf = IndexClassifierWrapper(
+                    self.clf,
+                    self.X,
+                    self.y,
+                    sample_weight=sample_weight,
+                    enforce_unique_samples=True,
+                    use_speed_up=True,
+                )
+                iclf.precompute(all_idx, all_idx)
+                iclf.fit(all_idx, set_base_clf=True)
+                iclf.partial_fit_proba(
+                    [2, 3], proba, use_base_clf=True, set_base_clf=True
+                )
+                F = iclf.predict_freq(all_idx)
+                K = pairwise_kernels(self.X, self.X, metric="rbf")
+                V = np.zeros((4, 2))
+                V[[0, 1], [0, 1]] = w[[0, 1]]
+                V[[2, 3]] = w[[2, 3], np.newaxis] * proba
+                np.testing.assert_allclose(F, K @ V)
+
+                # Closed-form simulations consider the fractional samples.
+                P = iclf.simulate_proba([2, 3], all_idx)
+                iclf.partial_fit([3], [0], use_base_clf=True)
+                np.testing.assert_allclose(
+                    iclf.predict_proba(all_idx), P[1, 0]
+                )
+
+        # Classifiers with `partial_fit` are updated with fractional samples.
+        clf = SklearnClassifier(GaussianNB(), classes=[0, 1])
+        iclf = IndexClassifierWrapper(
+            clf, self.X, self.y2, ignore_partial_fit=False
+        )
+        iclf.fit([0, 1], set_base_clf=True)
+        iclf.partial_fit_proba([2, 3], proba)
+        clf_exp = deepcopy(iclf.base_clf_).partial_fit(
+            self.X[[2, 2, 3, 3]], [0, 1, 0, 1], proba.ravel()
+        )
+        np.testing.assert_allclose(
+            iclf.predict_proba(all_idx), clf_exp.predict_proba(self.X)
+        )
+
+        # Classifiers ignoring sample weights cannot be updated.
+        clf = SklearnClassifier(KNeighborsClassifier(1), classes=[0, 1])
+        for ignore_partial_fit in [False, True]:
+            iclf = IndexClassifierWrapper(
+                clf, self.X, self.y2, ignore_partial_fit=ignore_partial_fit
+            )
+            iclf.fit([0, 1], set_base_clf=True)
+            self.assertRaises(
+                ValueError, iclf.partial_fit_proba, [2, 3], proba
+            )
+
     def test_predict_param_idx(self):
         iclf = self.iclf().fit([0])
         self.assertRaises((ValueError, TypeError, IndexError), iclf.predict, 0)
@@ -319,6 +524,32 @@ class TestIndexClassifierWrapper(unittest.TestCase):
         iclf.fit([0, 1])
         self.assertEqual(iclf.clf_.classes, iclf.classes)
 
+    def test_prepare_simulation(self):
+        all_idx = np.arange(len(self.X))
+        iclf = self.iclf(use_speed_up=True, enforce_unique_samples=True)
+        self.assertRaises(
+            (ValueError, TypeError), iclf.prepare_simulation, "str", [0]
+        )
+        self.assertRaises(
+            (ValueError, TypeError), iclf.prepare_simulation, [0], [10]
+        )
+        iclf.precompute(all_idx, all_idx)
+        iclf.fit(all_idx, set_base_clf=True)
+        self.assertEqual(len(iclf.pwc_K_.tiles_), 0)
+        iclf.prepare_simulation([2, 3], all_idx)
+        self.assertEqual(len(iclf.pwc_K_.tiles_), 1)
+
+        iclf_copy = copy(iclf)
+        self.assertIsNot(iclf.pwc_K_, iclf_copy.pwc_K_)
+        self.assertIsNot(iclf.pwc_K_.tiles_, iclf_copy.pwc_K_.tiles_)
+        iclf_copy.partial_fit([2], [1], use_base_clf=True)
+        np.testing.assert_array_equal(iclf.y_, [0, 1, np.nan, np.nan])
+
+        iclf_pickled = pickle.loads(pickle.dumps(iclf))
+        np.testing.assert_array_equal(
+            iclf.predict_proba(all_idx), iclf_pickled.predict_proba(all_idx)
+        )
+
     def test__concat_sw(self):
         iclf = IndexClassifierWrapper(
             clf=ParzenWindowClassifier(), X=self.X, y=self.y
@@ -649,6 +880,104 @@ class TestIndexClassifierWrapper(unittest.TestCase):
                         getattr(clf, pred)(self.X),
                     )
 
+    def test_simulate_proba(self):
+        iclf = self.iclf(use_speed_up=True, enforce_unique_samples=True)
+        self.assertFalse(iclf.can_simulate_proba())
+        self.assertRaises(ValueError, iclf.simulate_proba, [2], [0])
+
+        clf = SklearnClassifier(GaussianNB(), classes=[0, 1])
+        iclf = IndexClassifierWrapper(
+            clf, self.X, self.y, enforce_unique_samples=True
+        )
+        iclf.fit([0, 1, 2, 3], set_base_clf=True)
+        self.assertFalse(iclf.can_simulate_proba())
+
+        all_idx = np.arange(len(self.X))
+        for sample_weight, class_prior, y in product(
+            [None, np.linspace(0.2, 1, 4)], [0, 0.5], [self.y, self.y3]
+        ):
+            with self.subTest(
+                sample_weight=sample_weight, class_prior=class_prior, y=y
+            ):
+                iclf = IndexClassifierWrapper(
+                    ParzenWindowClassifier(
+                        classes=[0, 1], class_prior=class_prior
+                    ),
+                    self.X,
+                    y,
+                    sample_weight=sample_weight,
+                    enforce_unique_samples=True,
+                    use_speed_up=True,
+                )
+                iclf.precompute(all_idx, all_idx)
+                iclf.fit(all_idx, set_base_clf=True)
+                self.assertTrue(iclf.can_simulate_proba())
+
+                idx_add = [0, 2, 3]
+                P = iclf.simulate_proba(idx_add, all_idx)
+                self.assertEqual(P.shape, (3, 2, 4, 2))
+                for i_a, idx_a in enumerate(idx_add):
+                    for i_y, y_a in enumerate([0, 1]):
+                        iclf.partial_fit([idx_a], [y_a], use_base_clf=True)
+                        np.testing.assert_allclose(
+                            iclf.predict_proba(all_idx), P[i_a, i_y]
+                        )
+
+
+class TestKernelCache(unittest.TestCase):
+    def setUp(self):
+        self.X = np.random.RandomState(0).rand(10, 2)
+        self.K = pairwise_kernels(self.X, self.X, metric="rbf", gamma=2)
+
+    def test_get(self):
+        for dtype, max_bytes in product(
+            [None, np.float32], [None, 1, 4 * 8 * 3]
+        ):
+            with self.subTest(dtype=dtype, max_bytes=max_bytes):
+                cache = _KernelCache(
+                    self.X,
+                    metric="rbf",
+                    metric_dict={"gamma": 2},
+                    dtype=dtype,
+                    max_bytes=max_bytes,
+                    tile_size=3,
+                )
+                idx_fit = np.array([0, 7, 2, 9])
+                idx_pred = np.array([4, 5, 1])
+                K = cache.get(idx_fit, idx_pred)
+                self.assertTrue(np.isnan(K).all())
+                self.assertEqual(len(cache.tiles_), 0)
+
+                cache.add_block(idx_fit[:2], idx_pred)
+                cache.add_block(idx_fit[2:], idx_pred[1:])
+                K_true = self.K[np.ix_(idx_fit, idx_pred)]
+                K_true[2:, 0] = np.nan
+                for _ in range(2):
+                    K = cache.get(idx_fit, idx_pred)
+                    np.testing.assert_allclose(K_true, K, rtol=1e-6)
+                    self.assertEqual(K.dtype, np.float64)
+                if max_bytes is not None:
+                    self.assertLessEqual(cache.nbytes_, max_bytes)
+
+        # Unsorted and repeated indices spanning several tiles.
+        random_state = np.random.RandomState(0)
+        cache = _KernelCache(
+            self.X, metric="rbf", metric_dict={"gamma": 2}, tile_size=3
+        )
+        is_avail = np.zeros((10, 10), dtype=bool)
+        for _ in range(3):
+            idx_fit = random_state.choice(10, size=4)
+            idx_pred = random_state.choice(10, size=5)
+            cache.add_block(idx_fit, idx_pred)
+            is_avail[np.ix_(idx_fit, idx_pred)] = True
+        K_true = np.where(is_avail, self.K, np.nan)
+        idx_fit = random_state.choice(10, size=20)
+        idx_pred = random_state.choice(10, size=15)
+        np.testing.assert_allclose(
+            K_true[np.ix_(idx_fit, idx_pred)], cache.get(idx_fit, idx_pred)
+        )
+        self.assertEqual(cache.get([], idx_pred).shape, (0, 15))
+
 
 class TestApproximation(unittest.TestCase):
     def setUp(self):
@@ -756,6 +1085,45 @@ class TestApproximation(unittest.TestCase):
 
             np.testing.assert_array_equal(res, np.zeros(2))
 
+        # The quantile quadrature equals `scipy.integrate.fixed_quad` and
+        # predicts the target distribution only once.
+        reg = SklearnNormalRegressor(estimator=GaussianProcessRegressor())
+        reg.fit(X_train, y_train)
+        with patch.object(
+            reg,
+            "predict_target_distribution",
+            wraps=reg.predict_target_distribution,
+        ) as predict_target_distribution:
+            res = _conditional_expect(
+                X=X,
+                func=lambda idx, x, y: y**2,
+                reg=reg,
+                method="quantile",
+                quantile_method="quadrature",
+                n_integration_samples=5,
+                vector_func=True,
+            )
+            self.assertEqual(predict_target_distribution.call_count, 1)
+        dist = reg.predict_target_distribution(X)
+        res_exp, _ = fixed_quad(
+            lambda q: dist.ppf(q.reshape(-1, 1)).T ** 2, 0, 1, n=5
+        )
+        np.testing.assert_allclose(res, res_exp)
+
+    def test_quadrature_nodes(self):
+        for method, roots in [
+            ("gauss_hermite", roots_hermitenorm),
+            ("gauss_legendre", roots_legendre),
+        ]:
+            nodes, weights = _quadrature_nodes(method, 7)
+            np.testing.assert_allclose(np.array([nodes, weights]), roots(7))
+            self.assertFalse(nodes.flags.writeable)
+            self.assertFalse(weights.flags.writeable)
+            nodes_2, weights_2 = _quadrature_nodes(method, 7)
+            self.assertIs(nodes, nodes_2)
+            self.assertIs(weights, weights_2)
+            self.assertEqual(len(_quadrature_nodes(method, 3)[0]), 3)
+
     def test_reshape_distribution(self):
         dist = norm(loc=np.array([0, 0]))
         _reshape_scipy_dist(dist, shape=(2, 1))
@@ -862,6 +1230,118 @@ class TestFunctions(unittest.TestCase):
             X_update=np.array([8, 4]),
         )
 
+        # Regressors providing `with_added_samples` are not refitted, if
+        # they are fitted on the training data.
+        X = np.arange(7 * 2).reshape(7, 2) / 7
+        y = np.array([0, 1, 2, 3, MISSING_LABEL, MISSING_LABEL, 6])
+        sample_weight = np.arange(7) + 1
+        mapping = np.array([4, 5])
+        X_eval = np.linspace(0, 2, 10).reshape(5, 2)
+        for sw in [None, sample_weight]:
+            reg = NICKernelRegressor().fit(X, y, sw)
+            for idx_update, y_update in [(0, 5), (np.array([0, 1]), [5, 2])]:
+                reg_new = _update_reg(
+                    reg,
+                    X,
+                    y,
+                    y_update,
+                    sample_weight=sw,
+                    idx_update=idx_update,
+                    mapping=mapping,
+                )
+                self.assertEqual(
+                    len(reg_new.X_added_), len(np.atleast_1d(idx_update))
+                )
+                X_new, y_new = _update_X_y(
+                    X, y, y_update, idx_update=mapping[idx_update]
+                )
+                reg_exp = NICKernelRegressor().fit(X_new, y_new, sw)
+                np.testing.assert_allclose(
+                    reg_new.predict(X_eval, return_std=True),
+                    reg_exp.predict(X_eval, return_std=True),
+                )
+        reg = NICKernelRegressor().fit(X, y)
+        reg_new = _update_reg(reg, X, y, 5, X_update=np.array([1, 0.5]))
+        self.assertEqual(len(reg_new.X_added_), 1)
+        reg_exp = NICKernelRegressor().fit(
+            np.append(X, [[1, 0.5]], axis=0), np.append(y, 5)
+        )
+        np.testing.assert_allclose(
+            reg_new.predict(X_eval), reg_exp.predict(X_eval)
+        )
+
+        # Otherwise, they are refitted.
+        reg_new = _update_reg(
+            reg,
+            X,
+            y,
+            5,
+            sample_weight=sample_weight,
+            idx_update=0,
+            mapping=mapping,
+        )
+        self.assertEqual(len(reg_new.X_added_), 0)
+        reg_new = _update_reg(
+            reg, X, y, 5, idx_update=0, mapping=np.array([3])
+        )
+        self.assertEqual(len(reg_new.X_added_), 0)
+
+        # Two-dimensional labels update a batch of regressors at once.
+        y_update = np.array([[5, 2, 1], [0, 3, 4]])
+        for sw in [None, sample_weight]:
+            reg = NICKernelRegressor().fit(X, y, sw)
+            self.assertTrue(
+                _supports_batch_update(reg, X, y, sw, mapping=mapping)
+            )
+            reg_batch = _update_reg(
+                reg,
+                X,
+                y,
+                y_update,
+                sample_weight=sw,
+                idx_update=np.arange(2),
+                mapping=mapping,
+            )
+            mu = reg_batch.predict(X_eval)
+            for i, j in itertools.product(range(2), range(3)):
+                reg_new = _update_reg(
+                    reg,
+                    X,
+                    y,
+                    y_update[i, j],
+                    sample_weight=sw,
+                    idx_update=i,
+                    mapping=mapping,
+                )
+                np.testing.assert_allclose(mu[i, j], reg_new.predict(X_eval))
+        reg = NICKernelRegressor().fit(X, y)
+        reg_batch = _update_reg(reg, X, y, y_update, X_update=X[mapping])
+        np.testing.assert_allclose(
+            reg_batch.predict(X_eval),
+            _update_reg(
+                reg, X, y, y_update, idx_update=np.arange(2), mapping=mapping
+            ).predict(X_eval),
+        )
+        for reg_, sw, mapping_ in [
+            (self.reg.fit(X, y), None, mapping),
+            (reg, sample_weight, mapping),
+            (reg, None, np.array([3, 4])),
+            (reg, sample_weight, None),
+        ]:
+            self.assertFalse(
+                _supports_batch_update(reg_, X, y, sw, mapping=mapping_)
+            )
+        self.assertRaises(
+            ValueError,
+            _update_reg,
+            self.reg,
+            X,
+            y,
+            y_update,
+            idx_update=np.arange(2),
+            mapping=mapping,
+        )
+
     def test_boostrap_aggregation(self):
         reg_s = _bootstrap_estimators(
             self.reg, self.X, self.y, bootstrap_size=5
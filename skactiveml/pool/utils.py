@@ -1,22 +1,28 @@
 import warnings
-from copy import deepcopy
+from collections import OrderedDict
+from copy import copy, deepcopy
+from functools import lru_cache
 
 import numpy as np
 import scipy
 from scipy import integrate
-from scipy.special import roots_hermitenorm
+from scipy.special import roots_hermitenorm, roots_legendre
 from sklearn import clone
 from sklearn.exceptions import NotFittedError
 from sklearn.metrics import pairwise_kernels
 from sklearn.utils import column_or_1d
-from sklearn.utils.validation import check_array, check_consistent_length
+from sklearn.utils.validation import (
+    check_array,
+    check_consistent_length,
+    has_fit_parameter,
+)
 
 from ..base import (
     SkactivemlClassifier,
     ProbabilisticRegressor,
     SkactivemlRegressor,
 )
-from ..classifier import ParzenWindowClassifier
+from ..classifier import ParzenWindowClassifier, SklearnClassifier
 from ..utils import (
     MISSING_LABEL,
     is_labeled,
@@ -70,6 +76,23 @@ class IndexClassifierWrapper:
         implemented for Parzen Window Classifier.
     missing_label : scalar or string or np.nan or None, default=np.nan
         Value to represent a missing label.
+    kernel_dtype : numpy.dtype, optional (default=None)
+        Floating point type used to store the kernel values computed for the
+        speed up of the Parzen Window Classifier, e.g., `np.float32` to halve
+        the memory. If None, `np.float64` is used.
+    kernel_cache_size : float, optional (default=None)
+        Maximum size of the kernel cache in MB used for the speed up of the
+        Parzen Window Classifier. If the cache is full, the least recently used
+        kernel tiles are removed and recomputed when required again. If None,
+        the size of the cache is unlimited.
+    warm_start : bool, optional (default=False)
+        If True, refits simulating the addition of samples to the base
+        classifier (i.e., `partial_fit` with `use_base_clf=True` and without
+        using the `partial_fit` of `clf`) are initialized with the solution of
+        the fitted base classifier, which typically reduces the number of
+        solver iterations considerably. Further fits are initialized with the
+        solution of the current classifier. Requires `clf` to be a
+        `SklearnClassifier` whose estimator has a `warm_start` parameter.
     """
 
     def __init__(
@@ -83,6 +106,9 @@ class IndexClassifierWrapper:
         enforce_unique_samples=False,
         use_speed_up=False,
         missing_label=MISSING_LABEL,
+        kernel_dtype=None,
+        kernel_cache_size=None,
+        warm_start=False,
     ):
         self.clf = clf
         self.X = X
@@ -92,10 +118,25 @@ class IndexClassifierWrapper:
         self.enforce_unique_samples = enforce_unique_samples
         self.use_speed_up = use_speed_up
         self.missing_label = missing_label
+        self.kernel_dtype = kernel_dtype
+        self.kernel_cache_size = kernel_cache_size
+        self.warm_start = warm_start
 
         # Validate classifier type.
         check_type(self.clf, "clf", SkactivemlClassifier)
 
+        # Check warm start
+        check_type(self.warm_start, "warm_start", bool)
+        if self.warm_start and (
+            not isinstance(self.clf, SklearnClassifier)
+            or not hasattr(self.clf.estimator, "get_params")
+            or "warm_start" not in self.clf.estimator.get_params()
+        ):
+            raise ValueError(
+                "`warm_start=True` requires `clf` to be a `SklearnClassifier` "
+                "whose estimator has a `warm_start` parameter."
+            )
+
         # Check X, y, sample_weight: will be done by base clf
         check_consistent_length(self.X, self.y)
 
@@ -107,9 +148,10 @@ class IndexClassifierWrapper:
         # deep copy classifier as it might be fitted already
         if hasattr(self.clf, "classes_"):
             self.clf_ = deepcopy(self.clf)
+            self._set_warm_start()
 
             if set_base_clf:
-                self.base_clf_ = deepcopy(self.clf_)
+                self._set_base_clf()
         else:
             if set_base_clf:
                 raise NotFittedError(
@@ -119,8 +161,15 @@ class IndexClassifierWrapper:
 
         # Check and use partial fit if applicable
         check_type(self.ignore_partial_fit, "ignore_partial_fit", bool)
+        # The Parzen Window Classifier is always refitted on the indexed
+        # samples. Thereby, labels of samples can be replaced (cf.
+        # `enforce_unique_samples`) and the kernel values can be precomputed
+        # (cf. `use_speed_up`), which would not be possible with its
+        # `partial_fit`.
         self.use_partial_fit = (
-            hasattr(self.clf, "partial_fit") and not self.ignore_partial_fit
+            hasattr(self.clf, "partial_fit")
+            and not self.ignore_partial_fit
+            and not isinstance(self.clf, ParzenWindowClassifier)
         )
 
         check_type(self.enforce_unique_samples, "enforce_unique_samples", bool)
@@ -138,23 +187,59 @@ class IndexClassifierWrapper:
 
         # Check use_speed_up
         check_type(self.use_speed_up, "use_speed_up", bool)
+        # The speed up relies on exact kernel values, which are not used by a
+        # Parzen Window Classifier approximating its kernel.
+        self.use_speed_up = self.use_speed_up and not (
+            isinstance(self.clf, ParzenWindowClassifier)
+            and self.clf.approximation is not None
+        )
 
         # Check missing label
         check_missing_label(self.missing_label)
         self.missing_label_ = self.missing_label
         check_equal_missing_label(self.clf.missing_label, self.missing_label_)
 
+        # Check kernel cache parameters
+        if self.kernel_dtype is not None:
+            if np.dtype(self.kernel_dtype).kind != "f":
+                raise TypeError(
+                    "`kernel_dtype` must be a floating point type, got "
+                    f"{self.kernel_dtype}."
+                )
+        if self.kernel_cache_size is not None:
+            check_scalar(
+                self.kernel_cache_size,
+                "kernel_cache_size",
+                (int, float),
+                min_val=0,
+                min_inclusive=False,
+            )
+
         # prepare ParzenWindowClassifier
         if isinstance(self.clf, ParzenWindowClassifier) and self.use_speed_up:
             self.pwc_metric_ = self.clf.metric
             self.pwc_metric_dict_ = (
                 {} if self.clf.metric_dict is None else self.clf.metric_dict
             )
-            self.pwc_K_ = np.full([len(self.X), len(self.X)], np.nan)
+            max_bytes = (
+                None
+                if self.kernel_cache_size is None
+                else int(self.kernel_cache_size * 2**20)
+            )
+            self.pwc_K_ = _KernelCache(
+                self.X,
+                metric=self.pwc_metric_,
+                metric_dict=self.pwc_metric_dict_,
+                dtype=self.kernel_dtype,
+                max_bytes=max_bytes,
+            )
 
+            # Tree-based neighbor searches do not support precomputed kernels,
+            # whereas the brute-force search yields the same neighbors.
             self.clf_ = clone(self.clf)
             self.clf_.metric = "precomputed"
             self.clf_.metric_dict = {}
+            self.clf_.algorithm = "brute"
 
     def precompute(
         self, idx_fit, idx_pred, fit_params="all", pred_params="all"
@@ -223,12 +308,7 @@ class IndexClassifierWrapper:
                 raise ValueError(f"`pred_params`== {pred_params} not defined")
 
             if len(idx_fit_) > 0 and len(idx_pred_) > 0:
-                self.pwc_K_[np.ix_(idx_fit_, idx_pred_)] = pairwise_kernels(
-                    self.X[idx_fit_],
-                    self.X[idx_pred_],
-                    self.pwc_metric_,
-                    **self.pwc_metric_dict_,
-                )
+                self.pwc_K_.add_block(idx_fit_, idx_pred_)
 
     def fit(self, idx, y=None, sample_weight=None, set_base_clf=False):
         """Fit the model using `self.X[idx]` as training data and `self.y[idx]`
@@ -257,9 +337,8 @@ class IndexClassifierWrapper:
 
         """
         # check idx
-        idx = check_array(idx, ensure_2d=False, dtype=int)
-        idx = check_indices(
-            idx, self.X, dim=0, unique=self.enforce_unique_samples
+        idx = self._check_idx(
+            idx, check_unique=bool(self.enforce_unique_samples)
         )
 
         # check set_base_clf
@@ -271,8 +350,7 @@ class IndexClassifierWrapper:
             if is_unlabeled(y, missing_label=self.missing_label_).all():
                 warnings.warn("All labels are of `missing_label` in `fit`.")
         else:
-            y = check_array(y, ensure_2d=False, force_all_finite="allow-nan")
-            check_consistent_length(idx, y)
+            y = self._check_y(idx, y)
 
         # check sample_weight
         if sample_weight is None:
@@ -281,12 +359,15 @@ class IndexClassifierWrapper:
             )
             # TODO deepcopy
         else:
-            sample_weight = check_array(sample_weight, ensure_2d=False)
-            check_consistent_length(sample_weight, y)
+            sample_weight = self._check_sw(idx, sample_weight)
 
+        return self._fit(idx, y, sample_weight, set_base_clf)
+
+    def _fit(self, idx, y, sample_weight, set_base_clf):
         # check if a clf_ exists
         if "clf_" not in self.__dict__:
             self.clf_ = clone(self.clf)
+            self._set_warm_start()
 
         # fit classifier
         self.clf_.fit(self.X[idx], y, sample_weight)
@@ -299,7 +380,7 @@ class IndexClassifierWrapper:
 
         # set base clf if necessary
         if set_base_clf:
-            self.base_clf_ = deepcopy(self.clf_)
+            self._set_base_clf()
             if not self.use_partial_fit:
                 self.base_idx_ = self.idx_.copy()
                 self.base_y_ = self.y_.copy()
@@ -344,9 +425,8 @@ class IndexClassifierWrapper:
         """
 
         # check idx
-        add_idx = check_array(idx, ensure_2d=False, dtype=int)
-        add_idx = check_indices(
-            add_idx, self.X, dim=0, unique=self.enforce_unique_samples
+        add_idx = self._check_idx(
+            idx, check_unique=bool(self.enforce_unique_samples)
         )
 
         # check use_base_clf
@@ -377,10 +457,7 @@ class IndexClassifierWrapper:
                     "All labels are of `missing_label` in " "`partial_fit`."
                 )
         else:
-            add_y = check_array(
-                y, ensure_2d=False, force_all_finite="allow-nan"
-            )
-            check_consistent_length(add_idx, add_y)
+            add_y = self._check_y(add_idx, y)
 
         # check sample_weight
         if sample_weight is None:
@@ -388,19 +465,97 @@ class IndexClassifierWrapper:
                 self._get_sw(self.sample_weight, idx=add_idx)
             )
         else:
-            add_sample_weight = check_array(sample_weight, ensure_2d=False)
-            check_consistent_length(add_idx, add_sample_weight)
+            add_sample_weight = self._check_sw(add_idx, sample_weight)
 
+        return self._partial_fit(
+            add_idx, add_y, add_sample_weight, use_base_clf, set_base_clf
+        )
+
+    def partial_fit_proba(
+        self, idx, proba, use_base_clf=False, set_base_clf=False
+    ):
+        """Update the fitted model using additional samples in `self.X[idx]`
+        whose class labels are uncertain. Each sample is added once per class
+        with its weight multiplied by the probability of this class. Hence,
+        classifiers that are linear in the sample weights, e.g., the
+        `ParzenWindowClassifier`, are updated with the expected labels of the
+        samples. Therefore, the classifier must accept sample weights.
+
+        Parameters
+        ----------
+        idx : array-like of shape (n_sub_samples)
+            Indices of samples in `X` that will be used to fit the classifier.
+        proba : array-like of shape (n_sub_samples, n_classes)
+            Class-membership probabilities of the samples in `X[idx]`. Classes
+            are ordered according to `classes_`.
+        use_base_clf : bool, default=False
+            If True, the base classifier will be used to update the fit instead
+            of the current classifier. Here, it is necessary that the base
+            classifier has been set once.
+        set_base_clf : bool, default=False
+            If True, the base classifier will be set to the newly fitted
+            classifier.
+
+        Returns
+        -------
+        self: IndexClassifierWrapper,
+            The fitted IndexClassifierWrapper.
+        """
+        add_idx = self._check_idx(idx)
+
+        check_type(use_base_clf, "use_base_clf", bool)
+        if not self.is_fitted(base_clf=use_base_clf):
+            raise NotFittedError(
+                "Classifier is not fitted. Please `fit` before using "
+                "`partial_fit_proba`."
+            )
+        check_type(set_base_clf, "set_base_clf", bool)
+
+        clf = self.base_clf_ if use_base_clf else self.clf_
+        classes = clf.classes_
+        proba = check_array(proba)
+        check_consistent_length(add_idx, proba)
+        if proba.shape[1] != len(classes):
+            raise ValueError(
+                f"`proba` must have {len(classes)} columns, one for each "
+                f"class, got {proba.shape[1]}."
+            )
+
+        # Classifiers ignoring the weights would be trained with every class
+        # label of the samples at full weight.
+        if not _accepts_sample_weight(clf):
+            raise ValueError(
+                f"`partial_fit_proba` requires a classifier accepting "
+                f"`sample_weight`, which is not the case for {clf}."
+            )
+
+        add_sample_weight = self._get_sw(self.sample_weight, idx=add_idx)
+        if add_sample_weight is None:
+            add_sample_weight = np.ones(len(add_idx))
+
+        # Add every sample once per class. The indices are not checked for
+        # uniqueness as the copies represent fractions of the same sample.
+        return self._partial_fit(
+            np.repeat(add_idx, len(classes)),
+            np.tile(classes, len(add_idx)),
+            (add_sample_weight[:, np.newaxis] * proba).ravel(),
+            use_base_clf,
+            set_base_clf,
+        )
+
+    def _partial_fit(
+        self, add_idx, add_y, add_sample_weight, use_base_clf, set_base_clf
+    ):
         # handle case when partial fit of clf is used
         if self.use_partial_fit:
             if use_base_clf:
-                self.clf_ = deepcopy(self.base_clf_)
+                self._restore_base_clf()
 
             # partial fit clf
             self.clf_.partial_fit(self.X[add_idx], add_y, add_sample_weight)
 
             if set_base_clf:
-                self.base_clf_ = deepcopy(self.clf_)
+                self._set_base_clf()
 
         # handle case using regular fit from clf
         else:
@@ -411,13 +566,27 @@ class IndexClassifierWrapper:
                     "where it has been fitted on."
                 )
             if use_base_clf:
-                self.clf_ = clone(self.base_clf_)
-                self.idx_ = self.base_idx_.copy()
-                self.y_ = self.base_y_.copy()
-                self.sample_weight_ = self._copy_sw(self.base_sample_weight_)
+                if self.warm_start:
+                    self._restore_base_clf()
+                else:
+                    self.clf_ = clone(self.base_clf_)
+                # The base arrays are not modified as new arrays are
+                # created by the concatenation below.
+                self.idx_ = self.base_idx_
+                self.y_ = self.base_y_
+                self.sample_weight_ = self.base_sample_weight_
+
+            # Samples without weights are weighted by one if the other
+            # samples are weighted, e.g., due to `partial_fit_proba`.
+            if add_sample_weight is None and self.sample_weight_ is not None:
+                add_sample_weight = np.ones(len(add_idx))
+            if self.sample_weight_ is None and add_sample_weight is not None:
+                self.sample_weight_ = np.ones(len(self.idx_))
 
             if self.enforce_unique_samples:
-                cur_idx = np.array([i not in add_idx for i in self.idx_])
+                is_add = np.zeros(len(self.X), dtype=bool)
+                is_add[add_idx] = True
+                cur_idx = ~is_add[self.idx_]
             else:
                 cur_idx = np.arange(len(self.idx_))
             self.idx_ = np.concatenate([self.idx_[cur_idx], add_idx], axis=0)
@@ -426,10 +595,11 @@ class IndexClassifierWrapper:
                 self._get_sw(self.sample_weight_, cur_idx), add_sample_weight
             )
 
-            self.fit(
+            # The concatenated data is valid such that it is not checked again.
+            self._fit(
                 self.idx_,
-                y=self.y_,
-                sample_weight=self.sample_weight_,
+                self.y_,
+                self.sample_weight_,
                 set_base_clf=set_base_clf,
             )
 
@@ -449,17 +619,7 @@ class IndexClassifierWrapper:
             Predicted class labels of the input samples.
         """
         if isinstance(self.clf, ParzenWindowClassifier) and self.use_speed_up:
-            P = self.pwc_K_[self.idx_, :][:, idx].T
-
-            # check if results contain NAN
-            if np.isnan(P).any():
-                raise ValueError(
-                    "Error in defining what should be "
-                    "pre-computed in ParzenWindowClassifier. "
-                    "Not all necessary "
-                    "information is available which results in "
-                    "NaNs in `predict_proba`."
-                )
+            P = self._get_pwc_K(self.idx_, idx).T
             return self.clf_.predict(P)
         else:
             return self.clf_.predict(self.X[idx])
@@ -479,17 +639,7 @@ class IndexClassifierWrapper:
             by lexicographic order.
         """
         if isinstance(self.clf, ParzenWindowClassifier) and self.use_speed_up:
-            P = self.pwc_K_[self.idx_, :][:, idx].T
-
-            # check if results contain NAN
-            if np.isnan(P).any():
-                raise ValueError(
-                    "Error in defining what should be "
-                    "pre-computed in ParzenWindowClassifier. "
-                    "Not all necessary "
-                    "information is available which results in "
-                    "NaNs in `predict_proba`."
-                )
+            P = self._get_pwc_K(self.idx_, idx).T
             return self.clf_.predict_proba(P)
         else:
             return self.clf_.predict_proba(self.X[idx])
@@ -509,21 +659,146 @@ class IndexClassifierWrapper:
             ordered according to `classes_`.
         """
         if isinstance(self.clf, ParzenWindowClassifier) and self.use_speed_up:
-            P = self.pwc_K_[self.idx_, :][:, idx].T
-
-            # check if results contain NAN
-            if np.isnan(P).any():
-                raise ValueError(
-                    "Error in defining what should be "
-                    "pre-computed in ParzenWindowClassifier. "
-                    "Not all necessary "
-                    "information is available which results in "
-                    "NaNs in `predict_proba`."
-                )
+            P = self._get_pwc_K(self.idx_, idx).T
             return self.clf_.predict_freq(P)
         else:
             return self.clf_.predict_freq(self.X[idx])
 
+    def can_simulate_proba(self):
+        """Returns if the class-membership probabilities after adding single
+        samples to the base classifier can be computed in closed form (see
+        `simulate_proba`). This is the case for a fitted base
+        `ParzenWindowClassifier` without `n_neighbors`, if `use_speed_up=True`
+        and `enforce_unique_samples=True`.
+
+        Returns
+        -------
+        can_simulate_proba : boolean
+            Boolean describing if `simulate_proba` can be used.
+        """
+        return (
+            isinstance(self.clf, ParzenWindowClassifier)
+            and self.use_speed_up
+            and bool(self.enforce_unique_samples)
+            and not self.use_partial_fit
+            and self.is_fitted(base_clf=True)
+            and hasattr(self, "base_idx_")
+            and self.base_clf_.n_neighbors is None
+        )
+
+    def simulate_proba(self, idx_add, idx_pred):
+        """Computes the class-membership probabilities for `X[idx_pred]` that
+        result from adding each sample `X[idx_add[a]]` with each class label
+        separately to the training set of the base classifier. For the
+        `ParzenWindowClassifier`, adding a single sample is a rank-one update
+        of the class frequency estimates such that no refitting is required.
+        The result equals calling `partial_fit([idx_add[a]], [y],
+        use_base_clf=True)` followed by `predict_proba(idx_pred)` for every
+        pair of sample and class label.
+
+        Parameters
+        ----------
+        idx_add : array-like of shape (n_add_samples)
+            Indices of samples in `X` that are added one at a time.
+        idx_pred : array-like of shape (n_pred_samples)
+            Indices of samples in `X` that are to be predicted.
+
+        Returns
+        -------
+        P : np.ndarray of shape (n_add_samples, n_classes, n_pred_samples,
+        n_classes)
+            The class-membership probabilities, where `P[a, c]` are the
+            probabilities of `X[idx_pred]` after adding `X[idx_add[a]]` with
+            label `classes_[c]`.
+        """
+        if not self.can_simulate_proba():
+            raise ValueError(
+                "`simulate_proba` is only available for a fitted base "
+                "`ParzenWindowClassifier` without `n_neighbors` that uses "
+                "`use_speed_up=True` and `enforce_unique_samples=True`."
+            )
+        idx_add = check_array(idx_add, ensure_2d=False, dtype=int)
+        idx_add = check_indices(idx_add, self.X, dim=0)
+        idx_pred = check_array(idx_pred, ensure_2d=False, dtype=int)
+        idx_pred = check_indices(idx_pred, self.X, dim=0)
+
+        base_clf = self.base_clf_
+        n_classes = len(base_clf.classes_)
+
+        # Class frequency estimates of the base classifier, which only depend
+        # on the training samples with non-zero vote vectors.
+        F_base = np.zeros((len(idx_pred), n_classes))
+        if not isinstance(base_clf.V_, int):
+            is_voting = np.any(base_clf.V_ != 0, axis=1)
+            if is_voting.any():
+                K_pred = self._get_pwc_K(self.base_idx_[is_voting], idx_pred)
+                F_base = K_pred.T @ base_clf.V_[is_voting]
+
+        # Vote vectors of the samples to be added, which are currently part
+        # of the training set. They are replaced by the simulated labels.
+        # Samples may be contained multiple times, e.g., after
+        # `partial_fit_proba`, such that their vote vectors are summed.
+        V_old = np.zeros((len(idx_add), n_classes))
+        if not isinstance(base_clf.V_, int):
+            V_full = np.zeros((len(self.X), n_classes))
+            np.add.at(V_full, self.base_idx_, base_clf.V_)
+            V_old = V_full[idx_add]
+        w_add = self._get_sw(self.sample_weight, idx=idx_add)
+        if w_add is None:
+            w_add = np.ones(len(idx_add))
+
+        # Rank-one update: D[a, c] is the change of the vote vector of
+        # `X[idx_add[a]]` if it is labeled as `classes_[c]`.
+        D = w_add[:, np.newaxis, np.newaxis] * np.eye(n_classes)
+        D -= V_old[:, np.newaxis, :]
+        K_add = self._get_pwc_K(idx_add, idx_pred)
+        P = (
+            K_add[:, np.newaxis, :, np.newaxis] * D[:, :, np.newaxis, :]
+            + F_base[np.newaxis, np.newaxis, :, :]
+            + base_clf.class_prior_
+        )
+
+        # Normalize probabilities as in `ClassFrequencyEstimator`.
+        normalizer = np.sum(P, axis=-1, keepdims=True)
+        is_zero = normalizer == 0
+        np.divide(P, normalizer, out=P, where=~is_zero)
+        if is_zero.any():
+            P[np.broadcast_to(is_zero, P.shape)] = 1 / n_classes
+        return P
+
+    def prepare_simulation(self, idx_add, idx_pred):
+        """Computes the values that are required to simulate adding the
+        samples `X[idx_add]` to the base classifier and predicting the samples
+        `X[idx_pred]` afterwards, i.e., via `partial_fit` with
+        `use_base_clf=True` or via `simulate_proba`. Copies of this wrapper
+        created afterwards share these values, which is useful for parallel
+        processing. Currently implemented for Parzen Window Classifier.
+
+        Parameters
+        ----------
+        idx_add : array-like of shape (n_add_samples)
+            Indices of samples in `X` that will be added.
+        idx_pred : array-like of shape (n_pred_samples)
+            Indices of samples in `X` that will be predicted.
+        """
+        idx_add = check_array(idx_add, ensure_2d=False, dtype=int)
+        idx_add = check_indices(idx_add, self.X, dim=0)
+        idx_pred = check_array(idx_pred, ensure_2d=False, dtype=int)
+        idx_pred = check_indices(idx_pred, self.X, dim=0)
+
+        if (
+            isinstance(self.clf, ParzenWindowClassifier)
+            and self.use_speed_up
+            and hasattr(self, "base_idx_")
+        ):
+            idx_fit = self.base_idx_
+            if self.can_simulate_proba() and not isinstance(
+                self.base_clf_.V_, int
+            ):
+                idx_fit = idx_fit[np.any(self.base_clf_.V_ != 0, axis=1)]
+            idx_fit = np.union1d(idx_fit, idx_add)
+            self._get_pwc_K(idx_fit, idx_pred)
+
     def is_fitted(self, base_clf=False):
         """Returns if the classifier (resp. the base classifier) is fitted.
 
@@ -547,8 +822,106 @@ class IndexClassifierWrapper:
     def __getattr__(self, item):
         if "clf_" in self.__dict__:
             return getattr(self.clf_, item)
-        else:
+        elif "clf" in self.__dict__:
             return getattr(self.clf, item)
+        else:
+            raise AttributeError(item)
+
+    def __copy__(self):
+        # The copy does not share the kernel cache and the current classifier
+        # with the original such that both can be used concurrently. Already
+        # computed kernel values and the base classifier are shared
+        # nevertheless.
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        if "clf_" in self.__dict__:
+            new.clf_ = deepcopy(self.clf_)
+        if "pwc_K_" in self.__dict__:
+            new.pwc_K_ = copy(self.pwc_K_)
+        return new
+
+    def _set_warm_start(self):
+        if self.warm_start:
+            self.clf_.set_params(estimator__warm_start=True)
+            # Let the `SklearnClassifier` keep its fitted estimator for refits.
+            self.clf_._warm_start_fit = True
+
+    def _set_base_clf(self):
+        # Store the snapshot of the fitted state, if supported, to restore
+        # `clf_` without copying the whole object graph of the classifier.
+        self.base_clf_ = deepcopy(self.clf_)
+        if hasattr(self.base_clf_, "get_state"):
+            self.base_clf_state_ = self.base_clf_.get_state()
+        else:
+            self.base_clf_state_ = None
+
+    def _restore_base_clf(self):
+        clf = self.__dict__.get("clf_")
+        if (
+            self.base_clf_state_ is None
+            or clf is None
+            or clf is self.base_clf_
+            or type(clf) is not type(self.base_clf_)
+        ):
+            self.clf_ = deepcopy(self.base_clf_)
+        else:
+            clf.set_state(self.base_clf_state_)
+
+    def _get_pwc_K(self, idx_fit, idx_pred):
+        K = self.pwc_K_.get(idx_fit, idx_pred)
+        if np.isnan(K).any():
+            raise ValueError(
+                "Error in defining what should be "
+                "pre-computed in ParzenWindowClassifier. "
+                "Not all necessary "
+                "information is available which results in "
+                "NaNs in `predict_proba`."
+            )
+        return K
+
+    def _check_idx(self, idx, check_unique=False):
+        # In contrast to `check_indices`, `self.X` is not validated again and
+        # validated integer arrays are not copied.
+        if not (
+            isinstance(idx, np.ndarray)
+            and idx.ndim == 1
+            and idx.dtype.kind in "iu"
+        ):
+            idx = check_array(idx, ensure_2d=False, dtype=int)
+            if idx.ndim != 1:
+                raise ValueError(
+                    f"`idx` must be one-dimensional, got shape {idx.shape}."
+                )
+        if len(idx) > 0:
+            if idx.min() < 0:
+                raise ValueError(
+                    f"`idx` contains index of value {idx.min()} but all "
+                    f"indices must be non-negative."
+                )
+            if idx.max() >= len(self.X):
+                raise ValueError(
+                    f"`idx` contains index of value {idx.max()} but all "
+                    f"indices must be less than {len(self.X)}."
+                )
+        if check_unique and len(idx) > 1:
+            if len(np.unique(idx)) < len(idx):
+                raise ValueError(
+                    "`idx` contains two different indices of the same value."
+                )
+        return idx
+
+    def _check_y(self, idx, y):
+        if not (
+            isinstance(y, np.ndarray) and y.ndim == 1 and y.dtype.kind in "f"
+        ):
+            y = check_array(y, ensure_2d=False, force_all_finite="allow-nan")
+        check_consistent_length(idx, y)
+        return y
+
+    def _check_sw(self, idx, sample_weight):
+        sample_weight = check_array(sample_weight, ensure_2d=False)
+        check_consistent_length(idx, sample_weight)
+        return sample_weight
 
     def _get_sw(self, sample_weight, idx=None):
         if sample_weight is None:
@@ -573,6 +946,162 @@ class IndexClassifierWrapper:
             )
 
 
+class _KernelCache:
+    """
+    Kernel matrix between all samples in `X` whose entries are computed
+    lazily. Only the blocks of index pairs that have been added via
+    `add_block` are available. The kernel values are computed tile-wise on
+    first access and kept in a cache that removes the least recently used
+    tiles if its maximum size is exceeded.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples, n_features)
+        Samples for which the kernel values are computed.
+    metric : str or callable
+        The metric passed to `sklearn.metrics.pairwise_kernels`.
+    metric_dict : dict, optional (default=None)
+        Any further parameters are passed directly to the kernel function.
+    dtype : numpy.dtype, optional (default=None)
+        Floating point type used to store the kernel tiles. If None,
+        `np.float64` is used.
+    max_bytes : int, optional (default=None)
+        Maximum number of bytes occupied by the stored tiles. If None, the
+        number of stored tiles is unlimited.
+    tile_size : int, optional (default=512)
+        Number of rows and columns of each tile.
+    """
+
+    def __init__(
+        self,
+        X,
+        metric,
+        metric_dict=None,
+        dtype=None,
+        max_bytes=None,
+        tile_size=512,
+    ):
+        self.X = X
+        self.metric = metric
+        self.metric_dict = {} if metric_dict is None else metric_dict
+        self.dtype = np.float64 if dtype is None else np.dtype(dtype)
+        self.max_bytes = max_bytes
+        self.tile_size = tile_size
+        self.blocks_ = []
+        self.tiles_ = OrderedDict()
+        self.nbytes_ = 0
+
+    def add_block(self, idx_fit, idx_pred):
+        """Makes the kernel values `K[idx_fit][:, idx_pred]` available.
+
+        Parameters
+        ----------
+        idx_fit : array-like of shape (n_fit_samples)
+            Indices of the rows in the kernel matrix.
+        idx_pred : array-like of shape (n_predict_samples)
+            Indices of the columns in the kernel matrix.
+        """
+        is_fit = np.zeros(len(self.X), dtype=bool)
+        is_fit[idx_fit] = True
+        is_pred = np.zeros(len(self.X), dtype=bool)
+        is_pred[idx_pred] = True
+        self.blocks_.append((is_fit, is_pred))
+
+    def get(self, idx_fit, idx_pred):
+        """Returns the kernel values `K[idx_fit][:, idx_pred]`.
+
+        Parameters
+        ----------
+        idx_fit : array-like of shape (n_fit_samples)
+            Indices of the rows in the kernel matrix.
+        idx_pred : array-like of shape (n_predict_samples)
+            Indices of the columns in the kernel matrix.
+
+        Returns
+        -------
+        K : np.ndarray of shape (n_fit_samples, n_predict_samples)
+            The kernel values. Entries that are not part of an added block are
+            set to np.nan.
+        """
+        idx_fit = np.asarray(idx_fit, dtype=int)
+        idx_pred = np.asarray(idx_pred, dtype=int)
+        K = np.full((len(idx_fit), len(idx_pred)), np.nan)
+        if not self.blocks_:
+            return K
+
+        # Memberships of the requested indices in the added blocks. An entry
+        # is available if its row and column are members of the same block.
+        F = np.column_stack([is_fit[idx_fit] for is_fit, _ in self.blocks_])
+        P = np.column_stack([is_pred[idx_pred] for _, is_pred in self.blocks_])
+        groups_pred = [
+            (t_pred, cols, P[cols])
+            for t_pred, cols in self._group_by_tile(idx_pred)
+        ]
+        for t_fit, rows in self._group_by_tile(idx_fit):
+            F_rows = F[rows]
+            F_rows_any = F_rows.any(axis=0)
+            for t_pred, cols, P_cols in groups_pred:
+                if not (F_rows_any & P_cols.any(axis=0)).any():
+                    continue
+                is_avail = (
+                    F_rows.astype(np.float32) @ P_cols.T.astype(np.float32)
+                ) > 0
+                tile = self._get_tile(t_fit, t_pred)
+                K_tile = tile[
+                    np.ix_(
+                        idx_fit[rows] - t_fit * self.tile_size,
+                        idx_pred[cols] - t_pred * self.tile_size,
+                    )
+                ]
+                K[np.ix_(rows, cols)] = np.where(is_avail, K_tile, np.nan)
+        return K
+
+    def _group_by_tile(self, idx):
+        # Returns the tiles of the indices `idx` together with the positions
+        # of the indices in each tile.
+        tiles, inverse = np.unique(idx // self.tile_size, return_inverse=True)
+        positions = np.argsort(inverse, kind="stable")
+        bounds = np.cumsum(np.bincount(inverse))[:-1]
+        return zip(tiles, np.split(positions, bounds))
+
+    def __copy__(self):
+        # The copy shares the computed tiles but not the containers such that
+        # both caches can be used concurrently.
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.blocks_ = list(self.blocks_)
+        new.tiles_ = OrderedDict(self.tiles_)
+        return new
+
+    def _get_tile(self, t_fit, t_pred):
+        key = (t_fit, t_pred)
+        if key in self.tiles_:
+            self.tiles_.move_to_end(key)
+            return self.tiles_[key]
+
+        sl_fit = slice(t_fit * self.tile_size, (t_fit + 1) * self.tile_size)
+        sl_pred = slice(t_pred * self.tile_size, (t_pred + 1) * self.tile_size)
+        tile = pairwise_kernels(
+            self.X[sl_fit], self.X[sl_pred], self.metric, **self.metric_dict
+        ).astype(self.dtype, copy=False)
+
+        if self.max_bytes is None or tile.nbytes <= self.max_bytes:
+            self.tiles_[key] = tile
+            self.nbytes_ += tile.nbytes
+            while self.max_bytes is not None and self.nbytes_ > self.max_bytes:
+                _, removed_tile = self.tiles_.popitem(last=False)
+                self.nbytes_ -= removed_tile.nbytes
+        return tile
+
+
+def _accepts_sample_weight(clf):
+    """Checks whether `clf` uses sample weights. A `SklearnClassifier` ignores
+    them with a warning if its estimator does not accept them."""
+    if isinstance(clf, SklearnClassifier):
+        return has_fit_parameter(clf.estimator, "sample_weight")
+    return True
+
+
 def _cross_entropy(
     X_eval, true_reg, other_reg, integration_dict=None, random_state=None
 ):
@@ -644,8 +1173,12 @@ def _update_reg(
         Training data set.
     y : array-like of shape (n_samples)
         Labels of the training data set.
-    y_update : array-like of shape (n_updates) or numeric
-        Updating labels or updating label.
+    y_update : array-like of shape (n_updates) or numeric or array-like of
+    shape (n_updates, n_labels)
+        Updating labels or updating label. If `y_update` is two-dimensional,
+        the returned regressor represents a batch of regressors, each of which
+        is updated by a single sample `i` with the label `y_update[i, j]`.
+        This requires `_supports_batch_update` to be true.
     sample_weight : array-like of shape (n_samples), optional (default = None)
         Sample weight of the training data set. If
     idx_update : array-like of shape (n_updates) or int
@@ -673,6 +1206,49 @@ def _update_reg(
             check_indices([idx_update], A=mapping, unique="check_unique")
         else:
             check_indices(idx_update, A=mapping, unique="check_unique")
+
+    if np.ndim(y_update) == 2:
+        if not _supports_batch_update(
+            reg, X, y, sample_weight=sample_weight, mapping=mapping
+        ):
+            raise ValueError(
+                "A batch of updates requires a regressor providing "
+                "`with_each_added_sample` that is fitted on the training "
+                "data and unlabeled candidates."
+            )
+        if mapping is not None:
+            idx_add = np.atleast_1d(mapping[idx_update])
+            w_add = None
+            if sample_weight is not None:
+                w_add = np.asarray(sample_weight)[idx_add]
+            return reg.with_each_added_sample(
+                np.asarray(X)[idx_add], y_update, sample_weight=w_add
+            )
+        X_add = np.asarray(X_update).reshape(len(y_update), -1)
+        return reg.with_each_added_sample(X_add, y_update)
+
+    # Regressors providing `with_added_samples` and being fitted on the
+    # training data are updated without refitting.
+    if hasattr(reg, "with_added_samples") and _is_fitted_on(
+        reg, X, y, sample_weight
+    ):
+        y_add = np.atleast_1d(y_update)
+        if mapping is not None:
+            idx_add = np.atleast_1d(mapping[idx_update])
+            if not np.any(
+                is_labeled(np.asarray(y)[idx_add], reg.missing_label_)
+            ):
+                w_add = None
+                if sample_weight is not None:
+                    w_add = np.asarray(sample_weight)[idx_add]
+                return reg.with_added_samples(
+                    np.asarray(X)[idx_add], y_add, sample_weight=w_add
+                )
+        else:
+            X_add = np.asarray(X_update).reshape(len(y_add), -1)
+            return reg.with_added_samples(X_add, y_add)
+
+    if mapping is not None:
         X_new, y_new = _update_X_y(
             X, y, y_update, idx_update=mapping[idx_update]
         )
@@ -683,6 +1259,120 @@ def _update_reg(
     return reg_new
 
 
+def _supports_batch_update(reg, X, y, sample_weight=None, mapping=None):
+    """Checks whether `_update_reg` can update the regressor by a batch of
+    candidates and labels at once, i.e., whether the regressor provides
+    `with_each_added_sample`, is fitted on the training data, and whether the
+    candidates are unlabeled.
+
+    Parameters
+    ----------
+    reg : SkactivemlRegressor
+        The regressor to be checked.
+    X : array-like of shape (n_samples, n_features)
+        Training data set.
+    y : array-like of shape (n_samples)
+        Labels of the training data set.
+    sample_weight : array-like of shape (n_samples), optional (default = None)
+        Sample weight of the training data set.
+    mapping : array-like of shape (n_candidates), optional (default = None)
+        The mapping between the candidates and the training data set.
+
+    Returns
+    -------
+    supports_batch_update : bool
+        Whether the regressor can be updated by a batch.
+    """
+    if not hasattr(reg, "with_each_added_sample") or not _is_fitted_on(
+        reg, X, y, sample_weight
+    ):
+        return False
+    if mapping is None:
+        return sample_weight is None
+    return not np.any(is_labeled(np.asarray(y)[mapping], reg.missing_label_))
+
+
+def _check_vector_func(
+    integration_dict, reg, X, y, sample_weight=None, mapping=None
+):
+    """Returns the `vector_func` passed to `_conditional_expect` for a
+    function updating the regressor via `_update_reg`. If not specified in
+    `integration_dict`, the candidates and potential labels are passed at once
+    if `_supports_batch_update` is true.
+
+    Parameters
+    ----------
+    integration_dict : dict
+        The integration parameters, which may contain `vector_func`.
+    reg : SkactivemlRegressor
+        The regressor to be updated.
+    X : array-like of shape (n_samples, n_features)
+        Training data set.
+    y : array-like of shape (n_samples)
+        Labels of the training data set.
+    sample_weight : array-like of shape (n_samples), optional (default = None)
+        Sample weight of the training data set.
+    mapping : array-like of shape (n_candidates), optional (default = None)
+        The mapping between the candidates and the training data set.
+
+    Returns
+    -------
+    vector_func : bool or str
+        The `vector_func` passed to `_conditional_expect`.
+    """
+    is_batch = _supports_batch_update(
+        reg, X, y, sample_weight=sample_weight, mapping=mapping
+    )
+    if "vector_func" not in integration_dict:
+        return "both" if is_batch else False
+    vector_func = integration_dict["vector_func"]
+    check_type(vector_func, "vector_func", bool, target_vals=["both"])
+    if vector_func and not is_batch:
+        raise ValueError(
+            f"`vector_func={vector_func}` requires a regressor providing "
+            f"`with_each_added_sample` that is fitted on the training data "
+            f"and unlabeled candidates."
+        )
+    return vector_func
+
+
+def _is_fitted_on(reg, X, y, sample_weight=None):
+    """Checks whether the regressor is fitted on the labeled samples of the
+    given training data, i.e., whether its training samples, labels, and
+    weights stored in `X_`, `y_`, and `weights_` coincide with them.
+
+    Parameters
+    ----------
+    reg : SkactivemlRegressor
+        The regressor to be checked.
+    X : array-like of shape (n_samples, n_features)
+        Training data set.
+    y : array-like of shape (n_samples)
+        Labels of the training data set.
+    sample_weight : array-like of shape (n_samples), optional (default = None)
+        Sample weight of the training data set.
+
+    Returns
+    -------
+    is_fitted_on : bool
+        Whether the regressor is fitted on the training data.
+    """
+    if not all(
+        hasattr(reg, attr)
+        for attr in ["X_", "y_", "weights_", "missing_label_"]
+    ):
+        return False
+    is_lbld = is_labeled(y, missing_label=reg.missing_label_)
+    if not (
+        np.array_equal(reg.X_, np.asarray(X)[is_lbld])
+        and np.array_equal(reg.y_, np.asarray(y)[is_lbld])
+    ):
+        return False
+    if sample_weight is None or reg.weights_ is None:
+        return sample_weight is None and reg.weights_ is None
+    return np.array_equal(reg.weights_, np.asarray(sample_weight)[is_lbld])
+
+
 def _update_X_y(X, y, y_update, idx_update=None, X_update=None):
     """Update the training data by the updating samples/labels.
 
@@ -852,6 +1542,36 @@ def expected_target_val(X, target_func, reg, **kwargs):
     return _conditional_expect(X, arg_filtered_func, reg, **kwargs)
 
 
+@lru_cache(maxsize=None)
+def _quadrature_nodes(method, n_integration_samples):
+    """Returns the nodes and weights of a Gaussian quadrature rule. They are
+    computed once per rule and number of nodes and are read-only.
+
+    Parameters
+    ----------
+    method : {'gauss_hermite', 'gauss_legendre'}
+        The quadrature rule. 'gauss_hermite' refers to the probabilists'
+        Hermite polynomials, i.e., the weight function `exp(-x**2/2)`, and
+        'gauss_legendre' to the interval from -1 to 1.
+    n_integration_samples : int
+        The number of nodes.
+
+    Returns
+    -------
+    nodes : numpy.ndarray of shape (n_integration_samples)
+        The nodes of the quadrature rule.
+    weights : numpy.ndarray of shape (n_integration_samples)
+        The weights of the quadrature rule.
+    """
+    if method == "gauss_hermite":
+        nodes, weights = roots_hermitenorm(n_integration_samples)
+    else:  # method equals "gauss_legendre"
+        nodes, weights = roots_legendre(n_integration_samples)
+    nodes.flags.writeable = False
+    weights.flags.writeable = False
+    return nodes, weights
+
+
 def _conditional_expect(
     X,
     func,
@@ -1031,23 +1751,21 @@ def _conditional_expect(
                     output, dx=1 / n_integration_samples, axis=1
                 )
         else:  # quantile_method equals "quadrature"
-
-            def fixed_quad_function_wrapper(inner_eval_points):
-                inner_cond_dist = _reshape_scipy_dist(
-                    reg.predict_target_distribution(X), shape=(-1, 1)
-                )
-                inner_potential_y = inner_cond_dist.ppf(
-                    inner_eval_points.reshape(1, -1)
-                )
-
-                return evaluate_func(inner_potential_y)
-
-            expectation, _ = integrate.fixed_quad(
-                fixed_quad_function_wrapper, 0, 1, n=n_integration_samples
+            # Gauss-Legendre quadrature on the interval from 0 to 1, as
+            # computed by `scipy.integrate.fixed_quad`.
+            nodes, weights = _quadrature_nodes(
+                "gauss_legendre", n_integration_samples
             )
+            eval_points = (nodes + 1) / 2
+            cond_dist = _reshape_scipy_dist(
+                reg.predict_target_distribution(X), shape=(-1, 1)
+            )
+            potential_y = cond_dist.ppf(eval_points.reshape(1, -1))
+            output = evaluate_func(potential_y)
+            expectation = np.sum(weights * output, axis=-1) / 2
     elif method == "gauss_hermite":
-        unscaled_potential_y, weights = roots_hermitenorm(
-            n_integration_samples
+        unscaled_potential_y, weights = _quadrature_nodes(
+            "gauss_hermite", n_integration_samples
         )
         cond_mean, cond_std = reg.predict(X, return_std=True)
         potential_y = (
@@ -1,7 +1,15 @@
+from copy import copy
+
 import numpy as np
 from scipy.stats import t
 from sklearn.metrics.pairwise import pairwise_kernels, KERNEL_PARAMS
-from sklearn.utils import check_array
+from sklearn.utils import (
+    check_array,
+    check_consistent_length,
+    column_or_1d,
+    gen_batches,
+    get_chunk_n_rows,
+)
 from sklearn.utils.validation import check_is_fitted
 
 from skactiveml.base import ProbabilisticRegressor
@@ -40,6 +48,11 @@ class NICKernelRegressor(ProbabilisticRegressor):
     random_state : int, RandomState instance or None, optional (default=None)
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    working_memory : int or float, optional (default=None)
+        The sought maximum memory in MiB for the temporary kernel matrices
+        during prediction. The test samples are processed in chunks such that
+        the peak memory is independent of their number. If None, the value of
+        `sklearn.get_config()['working_memory']` is used.
     """
 
     METRICS = list(KERNEL_PARAMS.keys()) + ["precomputed"]
@@ -54,6 +67,7 @@ class NICKernelRegressor(ProbabilisticRegressor):
         nu_0=2.5,
         missing_label=MISSING_LABEL,
         random_state=None,
+        working_memory=None,
     ):
         super().__init__(
             random_state=random_state, missing_label=missing_label
@@ -64,6 +78,7 @@ class NICKernelRegressor(ProbabilisticRegressor):
         self.sigma_sq_0 = sigma_sq_0
         self.metric = metric
         self.metric_dict = metric_dict
+        self.working_memory = working_memory
 
     def fit(self, X, y, sample_weight=None):
         """Fit the model using X as training data and y as class labels.
@@ -120,27 +135,220 @@ class NICKernelRegressor(ProbabilisticRegressor):
         check_type(
             self.metric_dict, "self.metric_dict", dict, target_vals=[None]
         )
+        if self.working_memory is not None:
+            check_scalar(
+                self.working_memory,
+                "self.working_memory",
+                (int, float),
+                min_val=0,
+                min_inclusive=False,
+            )
+
+        # Samples added by `with_added_samples` and cache of the parameters
+        # estimated from the training data.
+        self.X_added_ = self.X_[:0]
+        self.y_added_ = self.y_[:0]
+        self.weights_added_ = np.zeros(0)
+        self._ml_params_cache = {}
+        self.X_each_ = None
+        self.y_each_ = None
+        self.weights_each_ = None
 
         return self
 
-    def _estimate_ml_params(self, X):
-        K = pairwise_kernels(
-            X, self.X_, metric=self.metric, **self.metric_dict
+    def with_added_samples(self, X, y, sample_weight=None):
+        """Returns a copy of the fitted regressor whose training data is
+        extended by the samples `X` with the labels `y`. The parameters of the
+        predicted distributions only depend on kernel-weighted sums over the
+        training samples. Hence, the copy is not refitted but combines the
+        parameters estimated from the original training data with the ones
+        estimated from the added samples. The former are computed once for
+        the last test samples and are shared by all copies such that
+        predicting for these test samples takes time linear in their number
+        and the number of added samples.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_added_samples, n_features)
+            Samples to be added.
+        y : array-like of shape (n_added_samples)
+            Labels of the samples to be added. Samples with missing labels
+            are ignored.
+        sample_weight : array-like of shape (n_added_samples), optional
+        (default=None)
+            Weights of the samples to be added. If None, each sample has
+            weight one.
+
+        Returns
+        -------
+        reg_new : NICKernelRegressor
+            The regressor with the added samples.
+        """
+        check_is_fitted(self)
+        if self.metric == "precomputed":
+            raise ValueError(
+                "Samples cannot be added for `metric='precomputed'`."
+            )
+        X = check_array(X, ensure_min_samples=0)
+        y = column_or_1d(
+            check_array(
+                y,
+                ensure_2d=False,
+                force_all_finite=False,
+                ensure_min_samples=0,
+            )
+        )
+        check_consistent_length(X, y)
+        self._check_n_features(X, reset=False)
+        if sample_weight is None:
+            sample_weight = np.ones(len(y))
+        else:
+            sample_weight = column_or_1d(
+                check_array(
+                    sample_weight, ensure_2d=False, ensure_min_samples=0
+                )
+            )
+            check_consistent_length(y, sample_weight)
+        is_lbld = is_labeled(y, missing_label=self.missing_label_)
+
+        reg_new = copy(self)
+        reg_new.X_added_ = np.append(self.X_added_, X[is_lbld], axis=0)
+        reg_new.y_added_ = np.append(self.y_added_, y[is_lbld])
+        reg_new.weights_added_ = np.append(
+            self.weights_added_, sample_weight[is_lbld]
         )
+        return reg_new
+
+    def with_each_added_sample(self, X, y, sample_weight=None):
+        """Returns a copy of the fitted regressor representing a batch of
+        regressors. For each sample `X[i]` and each of its labels `y[i, j]`,
+        the batch contains the regressor whose training data is extended by
+        this single labeled sample. As for `with_added_samples`, no regressor
+        is refitted. Instead, the predictions of the whole batch are computed
+        at once from the parameters estimated from the training data and the
+        kernel values between the test samples and `X`. The predicted
+        distributions are of shape (n_added_samples, n_labels, n_test_samples).
 
-        if self.weights_ is not None:
-            K = self.weights_.reshape(1, -1) * K
+        Parameters
+        ----------
+        X : array-like of shape (n_added_samples, n_features)
+            Samples to be added one at a time.
+        y : array-like of shape (n_added_samples, n_labels)
+            Labels of the samples to be added, i.e., `y[i]` contains the
+            labels with which the sample `X[i]` is added.
+        sample_weight : array-like of shape (n_added_samples), optional
+        (default=None)
+            Weights of the samples to be added. If None, each sample has
+            weight one.
 
-        N = np.sum(K, axis=1)
-        mu_ml = K @ self.y_ / N
-        scatter = np.sum(
-            K * (self.y_[np.newaxis, :] - mu_ml[:, np.newaxis]) ** 2, axis=1
+        Returns
+        -------
+        reg_batch : NICKernelRegressor
+            The regressor representing the batch of regressors.
+        """
+        check_is_fitted(self)
+        if self.metric == "precomputed":
+            raise ValueError(
+                "Samples cannot be added for `metric='precomputed'`."
+            )
+        if self.__dict__.get("y_each_") is not None:
+            raise ValueError(
+                "The regressor already represents a batch of regressors."
+            )
+        X = check_array(X, ensure_min_samples=0)
+        y = check_array(y, ensure_min_samples=0, ensure_min_features=0)
+        check_consistent_length(X, y)
+        self._check_n_features(X, reset=False)
+        if sample_weight is None:
+            sample_weight = np.ones(len(y))
+        else:
+            sample_weight = column_or_1d(
+                check_array(
+                    sample_weight, ensure_2d=False, ensure_min_samples=0
+                )
+            )
+            check_consistent_length(y, sample_weight)
+
+        reg_batch = copy(self)
+        reg_batch.X_each_ = X
+        reg_batch.y_each_ = y
+        reg_batch.weights_each_ = sample_weight
+        return reg_batch
+
+    def _estimate_ml_params(self, X, X_train=None, y_train=None, w_train=None):
+        if X_train is None:
+            X_train, y_train, w_train = self.X_, self.y_, self.weights_
+        N = np.empty(len(X))
+        mu_ml = np.empty(len(X))
+        var_ml = np.empty(len(X))
+
+        # Estimate the parameters for chunks of test samples to bound the
+        # memory of the kernel matrix and the scatter term.
+        chunk_n_rows = get_chunk_n_rows(
+            row_bytes=2 * len(X_train) * 8,
+            max_n_rows=max(len(X), 1),
+            working_memory=self.working_memory,
         )
-        var_ml = 1 / N * scatter
+        for sl in gen_batches(len(X), chunk_n_rows):
+            K = pairwise_kernels(
+                X[sl], X_train, metric=self.metric, **self.metric_dict
+            )
+
+            if w_train is not None:
+                K = w_train.reshape(1, -1) * K
+
+            N[sl] = np.sum(K, axis=1)
+            mu_ml[sl] = K @ y_train / N[sl]
+            scatter = np.sum(
+                K * (y_train[np.newaxis, :] - mu_ml[sl, np.newaxis]) ** 2,
+                axis=1,
+            )
+            var_ml[sl] = 1 / N[sl] * scatter
 
         return N, mu_ml, var_ml
 
     def _estimate_update_params(self, X):
+        update_params = self._estimate_joint_update_params(X)
+        if self.__dict__.get("y_each_") is None:
+            return update_params
+
+        # Combine the parameters with each single added sample, whose
+        # maximum likelihood variance is zero.
+        N, _, mu_ml, var_ml = update_params
+        K = pairwise_kernels(
+            self.X_each_, X, metric=self.metric, **self.metric_dict
+        )
+        N_add = (self.weights_each_[:, np.newaxis] * K)[:, np.newaxis, :]
+        y_add = self.y_each_[:, :, np.newaxis]
+        N_com = N + N_add
+        mu_com = (N * mu_ml + N_add * y_add) / N_com
+        var_com = (
+            N * var_ml + N * N_add * (mu_ml - y_add) ** 2 / N_com
+        ) / N_com
+        return N_com, N_com, mu_com, var_com
+
+    def _estimate_joint_update_params(self, X):
+        if len(self.__dict__.get("X_added_", [])) != 0:
+            # Combine the cached parameters of the training data with the
+            # parameters of the added samples.
+            N_add, mu_add, var_add = self._estimate_ml_params(
+                X, self.X_added_, self.y_added_, self.weights_added_
+            )
+            if len(self.X_) == 0:
+                return N_add, N_add, mu_add, var_add
+            cache = self._ml_params_cache
+            if "X" not in cache or not np.array_equal(cache["X"], X):
+                cache["X"] = X.copy()
+                cache["params"] = self._estimate_ml_params(X)
+            N, mu_ml, var_ml = cache["params"]
+            N_com = N + N_add
+            mu_com = (N * mu_ml + N_add * mu_add) / N_com
+            var_com = (
+                N * var_ml
+                + N_add * var_add
+                + N * N_add * (mu_ml - mu_add) ** 2 / N_com
+            ) / N_com
+            return N_com, N_com, mu_com, var_com
 
         if len(self.X_) != 0:
             N, mu_ml, var_ml = self._estimate_ml_params(X)
@@ -215,6 +423,10 @@ class NadarayaWatsonRegressor(NICKernelRegressor):
     random_state : int, RandomState instance or None, optional (default=None)
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    working_memory : int or float, optional (default=None)
+        The sought maximum memory in MiB for the temporary kernel matrices
+        during prediction. If None, the value of
+        `sklearn.get_config()['working_memory']` is used.
     """
 
     def __init__(
@@ -223,6 +435,7 @@ class NadarayaWatsonRegressor(NICKernelRegressor):
         metric_dict=None,
         missing_label=MISSING_LABEL,
         random_state=None,
+        working_memory=None,
     ):
         super().__init__(
             random_state=random_state,
@@ -232,4 +445,5 @@ class NadarayaWatsonRegressor(NICKernelRegressor):
             kappa_0=0,
             nu_0=3,
             sigma_sq_0=1,
+            working_memory=working_memory,
         )
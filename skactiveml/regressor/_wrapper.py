@@ -14,9 +14,14 @@ from sklearn.utils.validation import (
     check_is_fitted,
 )
 
-from skactiveml.base import SkactivemlRegressor, ProbabilisticRegressor
+from skactiveml.base import (
+    SkactivemlRegressor,
+    ProbabilisticRegressor,
+    _FIT_CACHE,
+)
 from skactiveml.utils._functions import _available_if
 from skactiveml.utils._label import is_labeled, MISSING_LABEL
+from skactiveml.utils._validation import check_scalar
 
 
 class SklearnRegressor(SkactivemlRegressor, MetaEstimatorMixin):
@@ -35,15 +40,31 @@ class SklearnRegressor(SkactivemlRegressor, MetaEstimatorMixin):
     random_state : int or RandomState instance or None, default=None
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    fit_cache_size : int or None, default=None
+        If not None, the fitted states of `fit` are stored in a least recently
+        used cache of this size, which is shared by all wrappers with the
+        same `fit_cache_size`. A fit of this wrapper or one of its clones on
+        identical data restores the cached state instead of fitting
+        `estimator` again. Hence, `estimator` should be deterministic. Fits
+        with further keyword arguments are not cached. The cached states
+        contain copies of the fitted estimators and are kept until the end of
+        the process. Hence, `fit_cache_size` bounds the number of states kept
+        for each distinct value of `fit_cache_size`. All cached states are
+        released by `clear_fit_cache`.
     """
 
     def __init__(
-        self, estimator, missing_label=MISSING_LABEL, random_state=None
+        self,
+        estimator,
+        missing_label=MISSING_LABEL,
+        random_state=None,
+        fit_cache_size=None,
     ):
         super().__init__(
             random_state=random_state, missing_label=missing_label
         )
         self.estimator = estimator
+        self.fit_cache_size = fit_cache_size
 
     def fit(self, X, y, sample_weight=None, **fit_kwargs):
         """Fit the model using X as training data and y as labels.
@@ -67,14 +88,35 @@ class SklearnRegressor(SkactivemlRegressor, MetaEstimatorMixin):
         self: SklearnRegressor,
             The SklearnRegressor is fitted on the training data.
         """
-
-        return self._fit(
+        # Look up the fitted state in the cache.
+        key = None
+        if self.fit_cache_size is not None:
+            check_scalar(self.fit_cache_size, "fit_cache_size", int, min_val=1)
+            if not fit_kwargs:
+                key = _FIT_CACHE.key(self, X, y, sample_weight)
+                if key is not None and _FIT_CACHE.load(
+                    self, key, self.fit_cache_size
+                ):
+                    return self
+
+        self._fit(
             fit_function="fit",
             X=X,
             y=y,
             sample_weight=sample_weight,
             **fit_kwargs,
         )
+        if key is not None:
+            _FIT_CACHE.store(self, key, self.fit_cache_size)
+        return self
+
+    @classmethod
+    def clear_fit_cache(cls):
+        """Releases all fitted states cached by wrappers with a
+        `fit_cache_size`. As the cache is shared, this includes the states of
+        `SklearnClassifier` and `SklearnRegressor`.
+        """
+        _FIT_CACHE.clear()
 
     @_available_if("partial_fit", hasattr(metaestimators, "available_if"))
     def partial_fit(self, X, y, sample_weight=None, **fit_kwargs):
@@ -259,13 +301,24 @@ class SklearnNormalRegressor(ProbabilisticRegressor, SklearnRegressor):
     random_state : int or RandomState instance or None, default=None
         Determines random number for 'predict' method. Pass an int for
         reproducible results across multiple method calls.
+    fit_cache_size : int or None, default=None
+        If not None, the fitted states of `fit` are stored in a least recently
+        used cache of this size, which is shared by all wrappers with the
+        same `fit_cache_size` (cf. `SklearnRegressor`).
     """
 
     def __init__(
-        self, estimator, missing_label=MISSING_LABEL, random_state=None
+        self,
+        estimator,
+        missing_label=MISSING_LABEL,
+        random_state=None,
+        fit_cache_size=None,
     ):
         super().__init__(
-            estimator, missing_label=missing_label, random_state=random_state
+            estimator,
+            missing_label=missing_label,
+            random_state=random_state,
+            fit_cache_size=fit_cache_size,
         )
 
     def predict_target_distribution(self, X):
@@ -1,4 +1,5 @@
 import unittest
+from itertools import product
 
 import numpy as np
 from sklearn.exceptions import NotFittedError
@@ -36,6 +37,7 @@ class TestNICKernelEstimator(unittest.TestCase):
             "sigma_sq_0",
             "metric",
             "metric_dict",
+            "working_memory",
         ]:
             start_params = self.start_parameter.copy()
             start_params[param] = "wrong_value"
@@ -118,6 +120,121 @@ class TestNICKernelEstimator(unittest.TestCase):
         np.testing.assert_almost_equal(mu, 1.24, decimal=3)
         np.testing.assert_almost_equal(sigma, 0.0245, decimal=3)
 
+        # Chunked predictions equal the predictions at once.
+        X = norm.rvs(size=(50, 2), random_state=self.random_state)
+        y = norm.rvs(size=50, random_state=self.random_state)
+        w = np.linspace(0.1, 1, 50)
+        X_test = norm.rvs(size=(20, 2), random_state=self.random_state)
+        reg = NICKernelRegressor(**self.start_parameter)
+        mu_exp, std_exp = reg.fit(X, y, w).predict(X_test, return_std=True)
+        reg.set_params(working_memory=0.004)
+        mu, std = reg.fit(X, y, w).predict(X_test, return_std=True)
+        np.testing.assert_allclose(mu, mu_exp)
+        np.testing.assert_allclose(std, std_exp)
+
+    def test_with_added_samples(self):
+        reg = NICKernelRegressor(**self.start_parameter)
+        self.assertRaises(
+            NotFittedError, reg.with_added_samples, self.X, self.y
+        )
+
+        X = norm.rvs(size=(30, 2), random_state=self.random_state)
+        y = norm.rvs(size=30, random_state=self.random_state)
+        y[20:] = MISSING_LABEL
+        w = np.linspace(0.1, 1, 30)
+        X_test = norm.rvs(size=(10, 2), random_state=self.random_state)
+        for sample_weight in [None, w]:
+            w_fit, w_add = None, np.ones(10)
+            if sample_weight is not None:
+                w_fit, w_add = sample_weight[:20], sample_weight[20:]
+            reg.fit(X[:20], y[:20], w_fit)
+            self.assertRaises(
+                ValueError, reg.with_added_samples, X[20:], y[:9]
+            )
+            self.assertRaises(
+                ValueError, reg.with_added_samples, X[20:, :1], y[20:]
+            )
+            pred = reg.predict(X_test, return_std=True)
+
+            # Samples with missing labels are ignored.
+            reg_new = reg.with_added_samples(X[20:], y[20:])
+            self.assertEqual(len(reg_new.X_added_), 0)
+
+            y_add = norm.rvs(size=10, random_state=self.random_state)
+            reg_new = reg.with_added_samples(X[20:25], y_add[:5], w_add[:5])
+            reg_new = reg_new.with_added_samples(X[25:], y_add[5:], w_add[5:])
+            self.assertEqual(len(reg_new.X_added_), 10)
+            reg_exp = NICKernelRegressor(**self.start_parameter)
+            reg_exp.fit(X, np.append(y[:20], y_add), sample_weight)
+            for _ in range(2):
+                np.testing.assert_allclose(
+                    reg_new.predict(X_test, return_std=True),
+                    reg_exp.predict(X_test, return_std=True),
+                )
+
+            # The original regressor is not changed.
+            np.testing.assert_array_equal(
+                reg.predict(X_test, return_std=True), pred
+            )
+
+        # Samples can be added to a regressor without training samples.
+        reg.fit(X[20:], y[20:])
+        reg_new = reg.with_added_samples(X[:20], y[:20])
+        reg_exp = NICKernelRegressor(**self.start_parameter).fit(X, y)
+        np.testing.assert_allclose(
+            reg_new.predict(X_test), reg_exp.predict(X_test)
+        )
+
+        reg = NICKernelRegressor(metric="precomputed").fit(np.eye(3), self.y)
+        self.assertRaises(
+            ValueError, reg.with_added_samples, np.eye(3), self.y
+        )
+
+    def test_with_each_added_sample(self):
+        reg = NICKernelRegressor(**self.start_parameter)
+        self.assertRaises(
+            NotFittedError, reg.with_each_added_sample, self.X, [[1], [2], [3]]
+        )
+
+        X = norm.rvs(size=(20, 2), random_state=self.random_state)
+        y = norm.rvs(size=20, random_state=self.random_state)
+        y[15:] = MISSING_LABEL
+        w = np.linspace(0.1, 1, 20)
+        X_add = norm.rvs(size=(4, 2), random_state=self.random_state)
+        y_add = norm.rvs(size=(4, 3), random_state=self.random_state)
+        w_add = np.linspace(0.5, 2, 4)
+        X_test = norm.rvs(size=(5, 2), random_state=self.random_state)
+        for sample_weight, n_lbld in [(None, 15), (w, 15), (None, 0)]:
+            y_fit = y.copy()
+            y_fit[n_lbld:] = MISSING_LABEL
+            reg.fit(X, y_fit, sample_weight)
+            self.assertRaises(
+                ValueError, reg.with_each_added_sample, X_add, y_add[:3]
+            )
+            self.assertRaises(
+                ValueError, reg.with_each_added_sample, X_add, y_add[:, 0]
+            )
+            w_each = None if sample_weight is None else w_add
+            reg_batch = reg.with_each_added_sample(X_add, y_add, w_each)
+            self.assertRaises(
+                ValueError, reg_batch.with_each_added_sample, X_add, y_add
+            )
+            mu, std = reg_batch.predict(X_test, return_std=True)
+            self.assertEqual(mu.shape, (4, 3, 5))
+            for i, j in product(range(4), range(3)):
+                w_i = None if w_each is None else w_each[i : i + 1]
+                reg_new = reg.with_added_samples(
+                    X_add[i : i + 1], y_add[i, j : j + 1], w_i
+                )
+                mu_exp, std_exp = reg_new.predict(X_test, return_std=True)
+                np.testing.assert_allclose(mu[i, j], mu_exp)
+                np.testing.assert_allclose(std[i, j], std_exp)
+
+        reg = NICKernelRegressor(metric="precomputed").fit(np.eye(3), self.y)
+        self.assertRaises(
+            ValueError, reg.with_each_added_sample, np.eye(3), [[1], [2], [3]]
+        )
+
 
 class TestNadarayaWatsonRegressor(unittest.TestCase):
     def setUp(self):
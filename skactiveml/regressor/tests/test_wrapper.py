@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from sklearn import clone
@@ -68,6 +69,39 @@ class TestWrapper(unittest.TestCase):
         reg_2.fit(X, y)
         self.assertTrue(np.any(reg_1.predict(X) != reg_2.predict(X)))
 
+    def test_init_param_fit_cache_size(self):
+        reg = SklearnRegressor(estimator=LinearRegression())
+        self.assertIsNone(reg.fit_cache_size)
+        for fit_cache_size, error in [(0, ValueError), ("Test", TypeError)]:
+            reg = SklearnRegressor(
+                estimator=LinearRegression(), fit_cache_size=fit_cache_size
+            )
+            self.assertRaises(error, reg.fit, self.X, self.y)
+
+        SklearnRegressor.clear_fit_cache()
+        X = np.arange(5 * 2).reshape(5, 2)
+        y = np.array([3, 4, MISSING_LABEL, 2, 1])
+        for reg in [
+            SklearnRegressor(LinearRegression(), fit_cache_size=2),
+            SklearnNormalRegressor(LinearRegression(), fit_cache_size=2),
+        ]:
+            with patch.object(
+                LinearRegression,
+                "fit",
+                autospec=True,
+                side_effect=LinearRegression.fit,
+            ) as fit:
+                coef = clone(reg).fit(X, y).estimator_.coef_
+                reg_cached = clone(reg).fit(X, y)
+                self.assertEqual(fit.call_count, 1)
+                np.testing.assert_array_equal(
+                    reg_cached.estimator_.coef_, coef
+                )
+                self.assertEqual(reg_cached._label_mean, np.nanmean(y))
+                reg.fit(X, y, sample_weight=np.arange(1, 6))
+                self.assertEqual(fit.call_count, 2)
+        SklearnRegressor.clear_fit_cache()
+
     def test_fit(self):
         class DummyRegressor(SkactivemlRegressor):
             def predict(self, X):